@@ -0,0 +1,111 @@
+#!/usr/bin python3
+
+"""
+Connection pooling benchmark
+============================
+
+Compares the per-page latency of requesting pages through a fresh
+connection per request (the behaviour of ``requests.request``) with
+the pooled, keep-alive session used by ``Cov19API``. The requests are
+made against a local HTTPS stand-in for the API.
+
+Usage::
+
+    python -m benchmarks.bench_connection --pages 200
+"""
+
+# Imports
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Python:
+from argparse import ArgumentParser
+from tempfile import TemporaryDirectory
+from statistics import median, mean
+from time import perf_counter
+from typing import List
+
+# 3rd party:
+from requests import request
+
+# Internal:
+from uk_covid19 import Cov19API
+from uk_covid19.connection import create_session
+from tests.mock_api import MockAPIServer, generate_certificate
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+STRUCTURE = {
+    "date": "date",
+    "name": "areaName",
+    "code": "areaCode",
+    "newCases": "newCasesBySpecimenDate"
+}
+
+
+def time_unpooled(url: str, params: dict, pages: int, cert_path: str) -> List[float]:
+    timings = list()
+
+    for page in range(1, pages + 1):
+        start = perf_counter()
+        with request("GET", url, params={**params, "page": page}, verify=cert_path) as response:
+            response.content
+        timings.append(perf_counter() - start)
+
+    return timings
+
+
+def time_pooled(url: str, params: dict, pages: int, cert_path: str) -> List[float]:
+    session = create_session()
+    timings = list()
+
+    for page in range(1, pages + 1):
+        start = perf_counter()
+        with session.request("GET", url, params={**params, "page": page},
+                             verify=cert_path) as response:
+            response.content
+        timings.append(perf_counter() - start)
+
+    session.close()
+
+    return timings
+
+
+def report(label: str, timings: List[float]):
+    print(
+        f"{label:<10} mean: {mean(timings) * 1000:7.2f} ms  "
+        f"median: {median(timings) * 1000:7.2f} ms  "
+        f"total: {sum(timings):6.2f} s"
+    )
+
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=100)
+    parser.add_argument("--page-size", type=int, default=100)
+    args = parser.parse_args()
+
+    api = Cov19API(filters=["areaType=ltla"], structure=STRUCTURE)
+    params = {**api.api_params, "format": "json"}
+
+    with TemporaryDirectory() as directory:
+        certificate = generate_certificate(directory)
+        cert_path, _ = certificate
+
+        server = MockAPIServer(
+            total_records=args.pages * args.page_size,
+            page_size=args.page_size,
+            certificate=certificate
+        )
+
+        with server:
+            unpooled = time_unpooled(server.data_endpoint, params, args.pages, cert_path)
+            pooled = time_pooled(server.data_endpoint, params, args.pages, cert_path)
+
+    print(f"Per-page latency over {args.pages} pages (local HTTPS):")
+    report("unpooled", unpooled)
+    report("pooled", pooled)
+    print(f"speed-up:  {mean(unpooled) / mean(pooled):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
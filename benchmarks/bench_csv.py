@@ -0,0 +1,111 @@
+#!/usr/bin python3
+
+"""
+CSV concatenation benchmark
+===========================
+
+Compares the cost of assembling the CSV output from its pages with
+the approach used before version 1.3.0 -- decoding and splitting each
+page into lines, and appending it to a string -- and with the current
+pipeline, which handles the pages as bytes and only looks up their
+first line. The pages are generated in memory, so the timings exclude
+the network.
+
+Usage::
+
+    python -m benchmarks.bench_csv --pages 50 100 200 400 800
+"""
+
+# Imports
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Python:
+from argparse import ArgumentParser
+from io import BytesIO
+from time import perf_counter
+from typing import Callable, List
+
+# 3rd party:
+
+# Internal:
+from uk_covid19.utils import prepare_csv_page
+from tests.mock_api import make_record, to_csv
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+STRUCTURE = {
+    "date": "date",
+    "name": "areaName",
+    "code": "areaCode",
+    "newCases": "newCasesBySpecimenDate",
+    "cumCases": "cumCasesBySpecimenDate"
+}
+
+
+def legacy_concat(pages: List[bytes]) -> str:
+    linebreak = "\n"
+    resp = str()
+
+    for page_num, content in enumerate(pages, start=1):
+        decoded_content = content.decode()
+
+        if page_num > 1:
+            data_lines = decoded_content.split(linebreak)[1:]
+            decoded_content = str.join(linebreak, data_lines)
+
+        resp += decoded_content.strip() + linebreak
+
+    return resp
+
+
+def buffered_concat(pages: List[bytes]) -> str:
+    buffer = BytesIO()
+    header = None
+
+    for content in pages:
+        header, chunk = prepare_csv_page(content, header)
+        buffer.write(chunk)
+
+    return buffer.getvalue().decode()
+
+
+def measure(func: Callable[[List[bytes]], str], pages: List[bytes], repeat: int) -> float:
+    timings = list()
+
+    for _ in range(repeat):
+        start = perf_counter()
+        func(pages)
+        timings.append(perf_counter() - start)
+
+    return min(timings)
+
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, nargs="+", default=[50, 100, 200, 400, 800])
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    page = to_csv(STRUCTURE, [make_record(STRUCTURE, index) for index in range(args.page_size)])
+    page_size_mb = len(page) / 2 ** 20
+
+    print(f"CSV pages of {args.page_size:,} rows ({page_size_mb:.2f} MiB each):")
+    print(f"{'pages':>6}  {'legacy':>10}  {'per page':>9}  {'buffered':>10}  {'per page':>9}")
+
+    for num_pages in args.pages:
+        pages = [page] * num_pages
+
+        assert legacy_concat(pages) == buffered_concat(pages)
+
+        legacy = measure(legacy_concat, pages, args.repeat)
+        buffered = measure(buffered_concat, pages, args.repeat)
+
+        print(
+            f"{num_pages:>6}  {legacy * 1000:8.1f}ms  {legacy / num_pages * 1e6:7.0f}us  "
+            f"{buffered * 1000:8.1f}ms  {buffered / num_pages * 1e6:7.0f}us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin python3
+
+"""
+DataFrame ingestion benchmark
+=============================
+
+Compares the time and peak memory of building a ``pandas.DataFrame``
+from a list of records produced by ``.get_json()`` (the behaviour
+before version 1.3.0) with the columnar CSV path of ``.get_dataframe()``.
+The data are served by a local stand-in for the API.
+
+Peak memory is measured with ``tracemalloc`` in a separate run, as
+tracing slows down allocations.
+
+Usage::
+
+    python -m benchmarks.bench_dataframe --rows 1000000
+"""
+
+# Imports
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Python:
+from argparse import ArgumentParser
+from time import perf_counter
+from typing import Callable, Tuple
+import tracemalloc
+
+# 3rd party:
+from pandas import DataFrame
+
+# Internal:
+from uk_covid19 import Cov19API
+from tests.mock_api import MockAPIServer
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+STRUCTURE = {
+    "date": "date",
+    "name": "areaName",
+    "code": "areaCode",
+    "newCases": "newCasesBySpecimenDate",
+    "cumCases": "cumCasesBySpecimenDate",
+    "caseRate": "newCasesBySpecimenDateRollingRate"
+}
+
+
+def from_records(api: Cov19API, concurrency: int) -> DataFrame:
+    data = api.get_json(concurrency=concurrency)
+    return DataFrame(data["data"])
+
+
+def from_columns(api: Cov19API, concurrency: int) -> DataFrame:
+    return api.get_dataframe(concurrency=concurrency)
+
+
+def measure(func: Callable[[Cov19API, int], DataFrame], api: Cov19API,
+            concurrency: int) -> Tuple[float, float, int]:
+    start = perf_counter()
+    df = func(api, concurrency)
+    duration = perf_counter() - start
+    df_size = df.memory_usage(deep=True).sum()
+    del df
+
+    tracemalloc.start()
+    func(api, concurrency)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return duration, peak, df_size
+
+
+def report(label: str, duration: float, peak: float, df_size: int):
+    print(
+        f"{label:<10} time: {duration:6.2f} s  "
+        f"peak memory: {peak / 2 ** 20:8.1f} MiB  "
+        f"DataFrame: {df_size / 2 ** 20:7.1f} MiB"
+    )
+
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--page-size", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args()
+
+    server = MockAPIServer(total_records=args.rows, page_size=args.page_size)
+
+    with server:
+        api = Cov19API(filters=["areaType=ltla"], structure=STRUCTURE)
+        api.endpoint = server.data_endpoint
+
+        records = measure(from_records, api, args.concurrency)
+        columns = measure(from_columns, api, args.concurrency)
+
+    print(f"DataFrame of {args.rows:,} rows ({args.page_size:,} rows per page):")
+    report("records", *records)
+    report("columnar", *columns)
+    print(f"speed-up:  {records[0] / columns[0]:.1f}x")
+    print(f"peak memory reduction: {records[1] / columns[1]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
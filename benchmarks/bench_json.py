@@ -0,0 +1,115 @@
+#!/usr/bin python3
+
+"""
+JSON backend benchmark
+======================
+
+Compares the JSON backends available in ``uk_covid19.json_backend``
+when decoding pages of data -- into dictionaries and into typed
+records -- when serialising them, and when extracting the records
+of each page to be spliced into a JSON document. The pages are generated in
+memory, so the timings exclude the network. Backends whose library
+is not installed are skipped.
+
+Usage::
+
+    python -m benchmarks.bench_json --pages 100 --page-size 1000
+"""
+
+# Imports
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Python:
+from argparse import ArgumentParser
+from json import dumps
+from time import perf_counter
+from typing import Callable, List
+
+# 3rd party:
+
+# Internal:
+from uk_covid19.json_backend import BACKENDS, make_record_type
+from tests.mock_api import make_record
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+STRUCTURE = {
+    "date": "date",
+    "areaType": "areaType",
+    "areaName": "areaName",
+    "areaCode": "areaCode",
+    "newCases": "newCasesBySpecimenDate",
+    "cumCases": "cumCasesBySpecimenDate",
+    "caseRate": "newCasesBySpecimenDateRollingRate"
+}
+
+
+def make_pages(num_pages: int, page_size: int) -> List[bytes]:
+    pages = list()
+
+    for page in range(num_pages):
+        start = page * page_size
+        data = [make_record(STRUCTURE, index) for index in range(start, start + page_size)]
+        pages.append(dumps({"length": len(data), "data": data}).encode())
+
+    return pages
+
+
+def measure(func: Callable[[], None], repeat: int) -> float:
+    timings = list()
+
+    for _ in range(repeat):
+        start = perf_counter()
+        func()
+        timings.append(perf_counter() - start)
+
+    return min(timings)
+
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=100)
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    pages = make_pages(args.pages, args.page_size)
+    record_type = make_record_type(STRUCTURE)
+    total_mb = sum(map(len, pages)) / 2 ** 20
+
+    print(f"{args.pages} pages of {args.page_size:,} records ({total_mb:.1f} MiB):")
+    print(f"{'backend':<10}{'decode':>10}{'typed':>10}{'encode':>10}{'splice':>10}")
+
+    for name, backend_type in BACKENDS.items():
+        try:
+            backend = backend_type()
+        except ImportError:
+            print(f"{name:<10}{'not installed':>40}")
+            continue
+
+        decoded = [backend.decode_page(page) for page in pages]
+
+        def decode():
+            for page in pages:
+                backend.decode_page(page)
+
+        def decode_typed():
+            for page in pages:
+                backend.decode_page(page, record_type)
+
+        def encode():
+            for page_data in decoded:
+                backend.dumps(page_data)
+
+        def splice():
+            for page in pages:
+                backend.extract_data(page)
+
+        funcs = (decode, decode_typed, encode, splice)
+        timings = [measure(func, args.repeat) for func in funcs]
+
+        print(f"{name:<10}" + str.join("", (f"{timing * 1000:8.0f}ms" for timing in timings)))
+
+
+if __name__ == "__main__":
+    main()
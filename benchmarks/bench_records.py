@@ -0,0 +1,102 @@
+#!/usr/bin python3
+
+"""
+Record set memory benchmark
+===========================
+
+Compares the memory held by the list of dictionaries produced by
+``.get_json()`` with that of the compact ``RecordSet`` produced by
+``.get_records()``, as well as the time taken to build each. The data
+are served by a local stand-in for the API.
+
+Memory is measured with ``tracemalloc`` in a separate run, as tracing
+slows down allocations.
+
+Usage::
+
+    python -m benchmarks.bench_records --rows 1000000
+"""
+
+# Imports
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Python:
+from argparse import ArgumentParser
+from time import perf_counter
+from typing import Any, Callable, Tuple
+import tracemalloc
+
+# 3rd party:
+
+# Internal:
+from uk_covid19 import Cov19API
+from tests.mock_api import MockAPIServer
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+STRUCTURE = {
+    "date": "date",
+    "areaType": "areaType",
+    "areaName": "areaName",
+    "areaCode": "areaCode",
+    "newCases": "newCasesBySpecimenDate",
+    "cumCases": "cumCasesBySpecimenDate",
+    "caseRate": "newCasesBySpecimenDateRollingRate"
+}
+
+
+def from_json(api: Cov19API, concurrency: int) -> Any:
+    return api.get_json(concurrency=concurrency)["data"]
+
+
+def from_records(api: Cov19API, concurrency: int) -> Any:
+    return api.get_records(concurrency=concurrency)
+
+
+def measure(func: Callable[[Cov19API, int], Any], api: Cov19API,
+            concurrency: int) -> Tuple[float, float, float]:
+    start = perf_counter()
+    func(api, concurrency)
+    duration = perf_counter() - start
+
+    tracemalloc.start()
+    result = func(api, concurrency)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+
+    return duration, retained, peak
+
+
+def report(label: str, duration: float, retained: float, peak: float):
+    print(
+        f"{label:<10} time: {duration:6.2f} s  "
+        f"retained: {retained / 2 ** 20:8.1f} MiB  "
+        f"peak: {peak / 2 ** 20:8.1f} MiB"
+    )
+
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--page-size", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args()
+
+    server = MockAPIServer(total_records=args.rows, page_size=args.page_size)
+
+    with server:
+        api = Cov19API(filters=["areaType=ltla"], structure=STRUCTURE)
+        api.endpoint = server.data_endpoint
+
+        dicts = measure(from_json, api, args.concurrency)
+        records = measure(from_records, api, args.concurrency)
+
+    print(f"{args.rows:,} records ({args.page_size:,} records per page):")
+    report("dicts", *dicts)
+    report("records", *records)
+    print(f"memory reduction: {dicts[1] / records[1]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
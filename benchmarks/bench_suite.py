@@ -0,0 +1,265 @@
+#!/usr/bin python3
+
+"""
+Benchmark suite
+===============
+
+Measures ``.get_json()``, ``.get_csv()``, ``.get_xml()`` and
+``.get_dataframe()`` across dataset sizes against a local stand-in
+for the API, which runs in a separate process so that it does not
+compete with the SDK for the interpreter.
+
+For each method and size, the suite reports:
+
+- throughput, in records and in (decompressed) MiB per second,
+  based on the median duration of the repeated queries;
+- percentiles of the latency of the pages -- i.e. the time taken
+  to receive the headers of each response;
+- peak memory allocated by the query, measured with ``tracemalloc``
+  in a separate run, as tracing slows down allocations.
+
+The results may be saved as a baseline, and compared with a baseline
+saved earlier -- on the same machine. The suite exits with a non-zero
+status if the throughput of any benchmark drops, or its peak memory
+rises, by more than the tolerance.
+
+Usage::
+
+    python -m benchmarks.bench_suite --sizes 10000 100000 --save baseline.json
+    python -m benchmarks.bench_suite --sizes 10000 100000 --baseline baseline.json
+"""
+
+# Imports
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Python:
+from argparse import ArgumentParser
+from contextlib import contextmanager
+from multiprocessing import get_context
+from statistics import median
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterator, List
+import json
+import sys
+import tracemalloc
+
+# 3rd party:
+
+# Internal:
+from uk_covid19 import Cov19API
+from uk_covid19.connection import create_session
+from uk_covid19.retry import RetryPolicy
+from tests.mock_api import MockAPIServer
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+STRUCTURE = {
+    "date": "date",
+    "areaType": "areaType",
+    "areaName": "areaName",
+    "areaCode": "areaCode",
+    "newCases": "newCasesBySpecimenDate",
+    "cumCases": "cumCasesBySpecimenDate",
+    "caseRate": "newCasesBySpecimenDateRollingRate"
+}
+
+METHODS: Dict[str, Callable[[Cov19API, int], Any]] = {
+    "get_json": lambda api, concurrency: api.get_json(concurrency=concurrency),
+    "get_csv": lambda api, concurrency: api.get_csv(concurrency=concurrency),
+    "get_xml": lambda api, concurrency: api.get_xml(concurrency=concurrency),
+    "get_dataframe": lambda api, concurrency: api.get_dataframe(concurrency=concurrency)
+}
+
+PERCENTILES = (50, 95, 99)
+
+
+def _serve(queue, stop_event, options: dict):
+    with MockAPIServer(**options) as server:
+        queue.put(server.data_endpoint)
+        stop_event.wait()
+
+
+@contextmanager
+def run_server(**options) -> Iterator[str]:
+    """
+    Runs the stand-in API in a child process, and produces the
+    URL of its data endpoint.
+    """
+    context = get_context("spawn")
+    queue = context.Queue()
+    stop_event = context.Event()
+    process = context.Process(target=_serve, args=(queue, stop_event, options), daemon=True)
+    process.start()
+
+    try:
+        yield queue.get(timeout=30)
+    finally:
+        stop_event.set()
+        process.join(timeout=10)
+
+
+def percentile(values: List[float], percent: float) -> float:
+    """
+    Nearest-rank percentile of ``values``.
+    """
+    ordered = sorted(values)
+    rank = max(int(round(percent / 100 * len(ordered) + 0.5)) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+def measure(method: str, api: Cov19API, records: int, concurrency: int,
+            repeat: int) -> Dict[str, float]:
+    func = METHODS[method]
+    latencies = list()
+    durations = list()
+    content_bytes = 0
+
+    def record_latency(response, *args, **kwargs):
+        latencies.append(response.elapsed.total_seconds())
+
+    api.session.hooks["response"].append(record_latency)
+
+    try:
+        for _ in range(repeat):
+            start = perf_counter()
+            func(api, concurrency)
+            durations.append(perf_counter() - start)
+            content_bytes = api.decompressed_bytes
+    finally:
+        api.session.hooks["response"].remove(record_latency)
+
+    tracemalloc.start()
+    func(api, concurrency)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    duration = median(durations)
+
+    result = {
+        "duration": duration,
+        "records_per_second": records / duration,
+        "mib_per_second": content_bytes / 2 ** 20 / duration,
+        "peak_mib": peak / 2 ** 20
+    }
+
+    for percent in PERCENTILES:
+        result[f"latency_p{percent}_ms"] = percentile(latencies, percent) * 1000
+
+    return result
+
+
+def find_regressions(results: Dict[str, dict], baseline: Dict[str, dict],
+                     tolerance: float) -> List[str]:
+    regressions = list()
+
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+
+        expected = baseline[name]
+        min_throughput = expected["records_per_second"] * (1 - tolerance)
+        max_peak = expected["peak_mib"] * (1 + tolerance)
+
+        if result["records_per_second"] < min_throughput:
+            regressions.append(
+                f"{name}: throughput {result['records_per_second']:,.0f} records/s "
+                f"is below {min_throughput:,.0f} records/s"
+            )
+
+        if result["peak_mib"] > max_peak:
+            regressions.append(
+                f"{name}: peak memory {result['peak_mib']:.1f} MiB "
+                f"is above {max_peak:.1f} MiB"
+            )
+
+    return regressions
+
+
+def report(name: str, result: Dict[str, float]):
+    latencies = str.join(" / ", (
+        f"{result[f'latency_p{percent}_ms']:.1f}"
+        for percent in PERCENTILES
+    ))
+
+    print(
+        f"{name:<22}"
+        f"{result['records_per_second']:>12,.0f} rec/s"
+        f"{result['mib_per_second']:>8.1f} MiB/s"
+        f"{latencies:>22} ms"
+        f"{result['peak_mib']:>10.1f} MiB"
+    )
+
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--methods", nargs="+", choices=list(METHODS), default=list(METHODS))
+    parser.add_argument("--page-size", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--latency", type=float, default=0,
+                        help="Delay of each request for data, in seconds.")
+    parser.add_argument("--error-rate", type=float, default=0,
+                        help="Probability that a request for data fails.")
+    parser.add_argument("--compress", action="store_true",
+                        help="Serve the pages compressed with gzip.")
+    parser.add_argument("--save", help="Path to a file in which the results are saved.")
+    parser.add_argument("--baseline", help="Path to the results of an earlier run.")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+
+    results = dict()
+    retry = None
+
+    if args.error_rate:
+        retry = RetryPolicy(max_attempts=10, backoff_factor=0.01, jitter=False)
+
+    print(
+        f"{'benchmark':<22}{'throughput':>18}{'':>14}"
+        f"{'latency p' + str.join('/', map(str, PERCENTILES)):>22}{'peak':>13}"
+    )
+
+    for size in args.sizes:
+        options = dict(
+            total_records=size,
+            page_size=args.page_size,
+            compress=args.compress,
+            latency=args.latency,
+            error_rate=args.error_rate,
+            seed=0
+        )
+
+        with run_server(**options) as endpoint:
+            api = Cov19API(
+                filters=["areaType=ltla"],
+                structure=STRUCTURE,
+                session=create_session(pool_maxsize=args.concurrency),
+                retry=retry
+            )
+            api.endpoint = endpoint
+
+            for method in args.methods:
+                name = f"{method}/{size}"
+                results[name] = measure(method, api, size, args.concurrency, args.repeat)
+                report(name, results[name])
+
+    if args.save:
+        with open(args.save, "w") as pointer:
+            json.dump(results, pointer, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as pointer:
+            baseline = json.load(pointer)
+
+        regressions = find_regressions(results, baseline, args.tolerance)
+
+        if regressions:
+            print(f"\nRegressions (tolerance: {args.tolerance:.0%}):")
+            print(str.join("\n", regressions))
+            sys.exit(1)
+
+        print(f"\nNo regressions (tolerance: {args.tolerance:.0%}).")
+
+
+if __name__ == "__main__":
+    main()
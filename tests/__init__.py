@@ -7,6 +7,21 @@
 # 3rd party:
 
 # Internal: 
-from .test_api_interface import TestCov9Api
+from .test_api_interface import TestCov9Api, TestCov19APIOffline
+from .test_async_interface import TestAsyncCov19API
+from .test_cache import TestResponseCache
+from .test_retry import TestRetryPolicy
+from .test_rate_limit import TestRateLimiter
+from .test_schema import TestSchema
+from .test_columnar import TestColumnar
+from .test_store import TestJSONStore, TestSQLiteStore
+from .test_utils import TestPrepareCSVPage, TestIterXMLData
+from .test_json_backend import TestJSONBackend
+from .test_records import TestRecordSet
+from .test_connection import TestCreateSession
+from .test_instrumentation import TestQueryStats
+from .test_freshness import TestFreshness
+from .test_checkpoint import TestCheckpoint
+from .test_consistency import TestConsistency
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
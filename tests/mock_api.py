@@ -0,0 +1,396 @@
+#!/usr/bin python3
+
+"""
+Local stand-in for the dashboard API
+====================================
+
+Emulates the ``/v1/data`` and ``/v1/timestamp`` endpoints closely
+enough to exercise the SDK without network access. The data are
+synthetic and generated from the ``structure`` parameter of each
+request.
+
+Pages are served in JSON, CSV or XML, with ``204 No Content`` past the
+last page, and a ``Last-Modified`` header on every response. Queries
+with ``latestBy`` produce the records of the most recent date in a
+single response. Latency, failures and truncated responses may be
+injected to emulate a slow or unreliable service.
+"""
+
+# Imports
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Python:
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+from datetime import date, timedelta
+from threading import Thread, Lock
+from time import sleep
+from random import Random
+from json import dumps, loads
+from os.path import join as path_join
+from subprocess import run, DEVNULL
+from typing import Union, Tuple, List
+from csv import writer as csv_writer
+from io import StringIO
+from xml.etree.ElementTree import Element, SubElement, tostring
+import gzip
+import ssl
+
+# 3rd party:
+
+# Internal:
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+__all__ = [
+    'MockAPIServer',
+    'generate_certificate'
+]
+
+
+LAST_MODIFIED = "Mon, 12 Oct 2020 15:12:34 GMT"
+WEBSITE_TIMESTAMP = "2020-10-12T15:00:09.977840Z"
+FIRST_DATE = date(2020, 10, 12)
+AREAS_PER_DATE = 50
+XSI_NAMESPACE = "http://www.w3.org/2001/XMLSchema-instance"
+
+
+def generate_certificate(directory: str) -> Tuple[str, str]:
+    """
+    Creates a self-signed certificate for ``localhost`` using the
+    ``openssl`` command line tool.
+
+    Returns
+    -------
+    Tuple[str, str]
+        Paths to the certificate and the private key.
+    """
+    cert_path = path_join(directory, "localhost.crt")
+    key_path = path_join(directory, "localhost.key")
+
+    run(
+        [
+            "openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes",
+            "-keyout", key_path, "-out", cert_path, "-days", "1",
+            "-subj", "/CN=localhost",
+            "-addext", "subjectAltName=DNS:localhost,IP:127.0.0.1"
+        ],
+        check=True,
+        stdout=DEVNULL,
+        stderr=DEVNULL
+    )
+
+    return cert_path, key_path
+
+
+def make_record(structure: dict, index: int) -> dict:
+    """
+    Produces a synthetic record for the given ``structure``.
+    """
+    area_index = index % AREAS_PER_DATE
+    record = dict()
+
+    for key, metric in structure.items():
+        if metric == "date":
+            value = (FIRST_DATE - timedelta(days=index // AREAS_PER_DATE)).isoformat()
+        elif metric == "areaName":
+            value = f"Area {area_index}"
+        elif metric == "areaCode":
+            value = f"E{area_index:08d}"
+        elif metric == "areaType":
+            value = "ltla"
+        elif index % 13 == 0:
+            value = None
+        else:
+            value = (index * 7 + len(metric)) % 1000
+
+        record[key] = value
+
+    return record
+
+
+def to_csv(structure: dict, data: List[dict]) -> bytes:
+    buffer = StringIO()
+    writer = csv_writer(buffer, lineterminator="\n")
+    writer.writerow(structure.keys())
+    writer.writerows(record.values() for record in data)
+    return buffer.getvalue().encode()
+
+
+def to_xml(data: List[dict]) -> bytes:
+    document = Element("document")
+
+    for record in data:
+        elm = SubElement(document, "data")
+
+        for key, value in record.items():
+            item = SubElement(elm, key)
+
+            if value is None:
+                item.set(f"{{{XSI_NAMESPACE}}}nil", "true")
+            else:
+                item.text = str(value)
+
+    return tostring(document)
+
+
+class MockRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server: "_Server"
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status: int, body: bytes = b"", content_type: str = "application/json",
+              truncate: bool = False):
+        compressed = (
+            self.server.compress and
+            len(body) > 0 and
+            "gzip" in self.headers.get("Accept-Encoding", "")
+        )
+
+        if compressed:
+            body = gzip.compress(body, compresslevel=6)
+
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Last-Modified", self.server.last_modified)
+        self.send_header("Cache-Control", "public, max-age=60")
+
+        if compressed:
+            self.send_header("Content-Encoding", "gzip")
+
+        self.end_headers()
+
+        if self.command == "HEAD":
+            return
+
+        if truncate:
+            # Half of the content is sent before the connection drops.
+            self.wfile.write(body[:len(body) // 2])
+            self.close_connection = True
+            return
+
+        self.wfile.write(body)
+
+    def _data(self, params: dict):
+        structure = loads(params.get("structure", ['{"date":"date"}'])[0])
+        page = int(params.get("page", [1])[0])
+        page_size = self.server.page_size
+        total = self.server.total_records
+
+        indices = range(total)
+        filters = dict(
+            item.split("=", 1)
+            for item in params.get("filters", [""])[0].split(";")
+            if "=" in item
+        )
+
+        # Records are generated for AREAS_PER_DATE areas per date,
+        # counting back from FIRST_DATE.
+        if "latestBy" in params:
+            indices = indices[:AREAS_PER_DATE]
+            page_size = AREAS_PER_DATE
+            page = 1
+        elif "date" in filters:
+            days = (FIRST_DATE - date.fromisoformat(filters["date"])).days
+            start = max(days, 0) * AREAS_PER_DATE
+            indices = indices[start:start + AREAS_PER_DATE] if days >= 0 else range(0)
+
+        page_indices = indices[(page - 1) * page_size:page * page_size]
+
+        if not len(page_indices):
+            return self._send(HTTPStatus.NO_CONTENT)
+
+        data = [make_record(structure, index) for index in page_indices]
+        format_as = params.get("format", ["json"])[0]
+        truncate = self.server.should_truncate()
+
+        if format_as == "csv":
+            return self._send(HTTPStatus.OK, to_csv(structure, data), "text/csv", truncate)
+        elif format_as == "xml":
+            return self._send(HTTPStatus.OK, to_xml(data), "application/xml", truncate)
+
+        payload = {
+            "length": len(data),
+            "maxPageLimit": page_size,
+            "data": data,
+            "pagination": {
+                "current": f"/v1/data?page={page}",
+                "next": f"/v1/data?page={page + 1}",
+                "previous": None,
+                "first": "/v1/data?page=1",
+                "last": None
+            }
+        }
+
+        body = dumps(payload, separators=(",", ":")).encode()
+        self._send(HTTPStatus.OK, body, truncate=truncate)
+
+    def _route(self):
+        url = urlsplit(self.path)
+        params = parse_qs(url.query)
+
+        if self.headers.get("If-Modified-Since") == self.server.last_modified:
+            return self._send(HTTPStatus.NOT_MODIFIED)
+
+        if url.path == "/v1/data":
+            if self.server.latency:
+                sleep(self.server.latency)
+
+            if self.server.should_fail():
+                return self._send(self.server.error_status)
+
+            return self._data(params)
+        elif url.path == "/v1/timestamp":
+            body = dumps({"websiteTimestamp": WEBSITE_TIMESTAMP}).encode()
+            return self._send(HTTPStatus.OK, body)
+
+        self._send(HTTPStatus.NOT_FOUND)
+
+    do_GET = _route
+    do_HEAD = _route
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    page_size: int
+    total_records: int
+    last_modified: str
+    compress: bool
+    latency: float
+    error_rate: float
+    error_status: int
+    truncate_rate: float
+    random: Random
+    random_lock: Lock
+
+    def _draw(self, rate: float) -> bool:
+        if not rate:
+            return False
+
+        with self.random_lock:
+            return self.random.random() < rate
+
+    def should_fail(self) -> bool:
+        return self._draw(self.error_rate)
+
+    def should_truncate(self) -> bool:
+        return self._draw(self.truncate_rate)
+
+
+class MockAPIServer:
+    """
+    Runs the stand-in API in a background thread.
+
+    Parameters
+    ----------
+    total_records: int
+        Number of records available for any query.
+
+    page_size: int
+        Maximum number of records per page.
+
+    certificate: Union[Tuple[str, str], None]
+        Paths to a certificate and its private key. If defined, the
+        server is served over HTTPS.
+
+    compress: bool
+        If ``True``, responses are compressed with gzip for clients
+        that accept it.
+
+    latency: float
+        Number of seconds by which each request for data is delayed.
+
+    error_rate: float
+        Probability, between 0 and 1, that a request for data fails
+        with ``error_status``.
+
+    error_status: int
+        Status code of the failed requests.
+
+    truncate_rate: float
+        Probability, between 0 and 1, that the content of a response
+        for data is cut off halfway, as if the connection dropped.
+
+    seed: Union[int, None]
+        Seed of the random failures and truncations.
+
+    last_modified: str
+        Initial value of the ``Last-Modified`` header, which may be
+        changed while the server is running -- e.g. to emulate a
+        release during an extract.
+
+    Examples
+    --------
+    >>> with MockAPIServer(total_records=3000) as server:
+    ...     api = Cov19API(filters, structure)
+    ...     api.endpoint = server.data_endpoint
+    ...     data = api.get_json()
+    """
+
+    def __init__(self, total_records: int = 5000, page_size: int = 1000,
+                 certificate: Union[Tuple[str, str], None] = None,
+                 compress: bool = False, latency: float = 0,
+                 error_rate: float = 0, error_status: int = HTTPStatus.SERVICE_UNAVAILABLE,
+                 truncate_rate: float = 0, seed: Union[int, None] = None,
+                 last_modified: str = LAST_MODIFIED):
+        self._server = _Server(("127.0.0.1", 0), MockRequestHandler)
+        self._server.page_size = page_size
+        self._server.total_records = total_records
+        self._server.last_modified = last_modified
+        self._server.compress = compress
+        self._server.latency = latency
+        self._server.error_rate = error_rate
+        self._server.error_status = error_status
+        self._server.truncate_rate = truncate_rate
+        self._server.random = Random(seed)
+        self._server.random_lock = Lock()
+        self._thread = None
+        self.scheme = "http"
+
+        if certificate is not None:
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            context.load_cert_chain(*certificate)
+            self._server.socket = context.wrap_socket(self._server.socket, server_side=True)
+            self.scheme = "https"
+
+    @property
+    def last_modified(self) -> str:
+        return self._server.last_modified
+
+    @last_modified.setter
+    def last_modified(self, value: str):
+        self._server.last_modified = value
+
+    @property
+    def url(self) -> str:
+        _, port = self._server.server_address
+        return f"{self.scheme}://localhost:{port}"
+
+    @property
+    def data_endpoint(self) -> str:
+        return self.url + "/v1/data"
+
+    @property
+    def timestamp_endpoint(self) -> str:
+        return self.url + "/v1/timestamp"
+
+    def start(self) -> "MockAPIServer":
+        self._thread = Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def __enter__(self) -> "MockAPIServer":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
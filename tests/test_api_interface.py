@@ -3,18 +3,30 @@
 # Imports
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # Python:
-from unittest import TestCase
+from unittest import TestCase, skipUnless
 from urllib.parse import unquote
-from tempfile import gettempdir
+from tempfile import gettempdir, TemporaryDirectory
+from os import listdir
 from os.path import join as path_join
 from datetime import datetime
+from time import perf_counter
 import re
 
 # 3rd party:
+try:
+    from pandas import DataFrame
+except ImportError:
+    DataFrame = None
 
 # Internal: 
 from uk_covid19 import Cov19API
+from uk_covid19.cache import ResponseCache
+from uk_covid19.retry import RetryPolicy
+from uk_covid19.rate_limit import RateLimiter
+from uk_covid19.batch import iter_batch
+from uk_covid19.instrumentation import Observer
 from uk_covid19.exceptions import FailedRequestError
+from .mock_api import MockAPIServer
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
@@ -30,6 +42,13 @@ test_structure = {
     "newCases": "newCasesBySpecimenDate"
 }
 
+offline_structure = {
+    "date": "date",
+    "name": "areaName",
+    "code": "areaCode",
+    "newCases": "newCasesBySpecimenDate"
+}
+
 
 class TestCov9Api(TestCase):
     def setUp(self) -> None:
@@ -54,6 +73,18 @@ class TestCov9Api(TestCase):
 
         self.assertDictEqual(self.api.api_params, api_params)
 
+    def test_session(self):
+        from uk_covid19.connection import create_session, get_default_session
+
+        # Instances without a session of their own share one pool.
+        other = Cov19API(test_filters, test_structure)
+        self.assertIs(self.api.session, get_default_session())
+        self.assertIs(self.api.session, other.session)
+
+        session = create_session(pool_maxsize=2)
+        api = Cov19API(test_filters, test_structure, session=session)
+        self.assertIs(api.session, session)
+
     def test_last_update(self):
         last_update = self.api.last_update
 
@@ -126,6 +157,42 @@ class TestCov9Api(TestCase):
 
         self.assertEqual(data_str, file_data)
 
+    def test_get_json_concurrent(self):
+        data = self.api.get_json()
+        total_pages = self.api.total_pages
+
+        concurrent_data = self.api.get_json(concurrency=4)
+
+        self.assertEqual(self.api.total_pages, total_pages)
+        self.assertDictEqual(concurrent_data, data)
+
+        with self.assertRaises(ValueError):
+            self.api.get_json(concurrency=0)
+
+    def test_async_get_json(self):
+        from asyncio import run
+        from uk_covid19 import AsyncCov19API
+
+        async def get_json():
+            async with AsyncCov19API(test_filters, test_structure) as api:
+                return await api.get_json(concurrency=2)
+
+        data = run(get_json())
+        self.assertDictEqual(data, self.api.get_json())
+
+    def test_iterators(self):
+        data = self.api.get_json()
+
+        pages = list(self.api.iter_pages())
+        self.assertEqual(len(pages), data["totalPages"])
+
+        records = list(self.api.iter_records())
+        self.assertListEqual(records, data["data"])
+
+        lines = list(self.api.iter_csv_lines())
+        self.assertEqual(lines[0], str.join(",", test_structure.keys()))
+        self.assertEqual(len(lines) - 1, data["length"])
+
     def test_get_xml(self):
         from xml.etree.ElementTree import Element
 
@@ -176,6 +243,45 @@ class TestCov9Api(TestCase):
 
         self.assertEqual(data.strip(), file_data)
 
+    def test_export(self):
+        temp_dir = gettempdir()
+
+        expected = {
+            "json": self.api.get_json(as_string=True),
+            "xml": self.api.get_xml(as_string=True),
+            "csv": self.api.get_csv()
+        }
+
+        for ext, data in expected.items():
+            temp_path = path_join(temp_dir, f"export.{ext}")
+            self.api.export(temp_path)
+
+            with open(temp_path, "r") as pointer:
+                file_data = pointer.read()
+
+            self.assertEqual(data, file_data)
+
+        with self.assertRaises(ValueError):
+            self.api.export(path_join(temp_dir, "export.txt"))
+
+    def test_batch(self):
+        bad_structure = {
+            "name": "areaName",
+            "newCases": "newCasesBySpecimen"
+        }
+
+        queries = {
+            "valid": {"filters": test_filters, "structure": test_structure},
+            "instance": self.api,
+            "invalid": {"filters": test_filters, "structure": bad_structure}
+        }
+
+        batch = Cov19API.batch(queries, max_workers=3)
+
+        self.assertSetEqual(set(batch.results), {"valid", "instance"})
+        self.assertDictEqual(batch.results["valid"], batch.results["instance"])
+        self.assertIsInstance(batch.errors["invalid"], FailedRequestError)
+
     def test_length_equal(self):
         csv_len = len(self.api.get_csv().strip().split("\n")[1:])
         json_len = self.api.get_json()["length"]
@@ -226,3 +332,260 @@ class TestCov9Api(TestCase):
         self.assertIsInstance(df, DataFrame)
         self.assertEqual(df.columns.size, 3)
         self.assertGreater(df.index.size, 10)
+        self.assertEqual(df["name"].dtype, "category")
+        self.assertEqual(df["date"].dtype.kind, "M")
+        self.assertEqual(df["newCases"].dtype, "Int64")
+
+    def test_as_arrow(self):
+        import pyarrow as pa
+
+        table = self.api.get_arrow()
+
+        self.assertIsInstance(table, pa.Table)
+        self.assertEqual(table.num_columns, 3)
+        self.assertGreater(table.num_rows, 10)
+        self.assertEqual(table.schema.field("date").type, pa.date32())
+
+
+class QueryCounter(Observer):
+    def __init__(self):
+        self.queries = 0
+
+    def query_started(self, api, stats):
+        self.queries += 1
+
+
+class TestCov19APIOffline(TestCase):
+    """
+    Runs the queries against the stand-in API in ``tests.mock_api``,
+    which serves 2,500 records in 3 pages.
+    """
+
+    def setUp(self) -> None:
+        self.server = MockAPIServer(total_records=2500).start()
+        self.temp_dir = TemporaryDirectory()
+        self.api = self.make_api()
+
+    def tearDown(self) -> None:
+        self.server.stop()
+        self.temp_dir.cleanup()
+
+    def make_api(self, **kwargs) -> Cov19API:
+        api = Cov19API(["areaType=ltla"], offline_structure, **kwargs)
+        api.endpoint = self.server.data_endpoint
+
+        return api
+
+    def test_get_json_concurrent(self):
+        data = self.api.get_json()
+
+        self.assertEqual(data["length"], 2500)
+        self.assertEqual(data["totalPages"], 3)
+
+        for concurrency in (2, 4, 8):
+            with self.subTest(concurrency=concurrency):
+                api = self.make_api()
+
+                # Pages are assembled in order, whatever the concurrency.
+                self.assertDictEqual(api.get_json(concurrency=concurrency), data)
+                self.assertEqual(api.total_pages, 3)
+                self.assertEqual(api.stats.pages, 3)
+
+        with self.assertRaises(ValueError):
+            self.api.get_json(concurrency=0)
+
+    def test_iterators(self):
+        data = self.api.get_json()
+
+        pages = list(self.api.iter_pages(concurrency=2))
+        self.assertEqual([len(page) for page in pages], [1000, 1000, 500])
+
+        records = list(self.api.iter_records())
+        self.assertListEqual(records, data["data"])
+
+        lines = list(self.api.iter_csv_lines())
+        self.assertEqual(lines[0], str.join(",", offline_structure.keys()))
+        self.assertEqual(len(lines) - 1, data["length"])
+
+        elements = list(self.api.iter_xml_elements(clear=True))
+        self.assertEqual(len(elements), data["length"])
+
+        # The pages that follow are only requested once they are needed.
+        pages = self.api.iter_pages()
+        self.assertEqual(len(next(pages)), 1000)
+        pages.close()
+
+        self.assertEqual(self.api.stats.pages, 1)
+
+    def test_export(self):
+        expected = {
+            "json": self.api.get_json(as_string=True),
+            "xml": self.api.get_xml(as_string=True),
+            "csv": self.api.get_csv()
+        }
+
+        for ext, data in expected.items():
+            with self.subTest(ext=ext):
+                temp_path = path_join(self.temp_dir.name, f"export.{ext}")
+                self.api.export(temp_path, concurrency=2)
+
+                with open(temp_path, "r") as pointer:
+                    self.assertEqual(pointer.read(), data)
+
+        with self.assertRaises(ValueError):
+            self.api.export(path_join(self.temp_dir.name, "export.txt"))
+
+    def test_save_as(self):
+        expected = {
+            "json": self.api.get_json(as_string=True),
+            "xml": self.api.get_xml(as_string=True),
+            "csv": self.api.get_csv()
+        }
+
+        for ext, data in expected.items():
+            with self.subTest(ext=ext):
+                temp_path = path_join(self.temp_dir.name, f"save_as.{ext}")
+                resp = getattr(self.make_api(), f"get_{ext}")(save_as=temp_path)
+
+                with open(temp_path, "r") as pointer:
+                    self.assertEqual(pointer.read(), data)
+
+                if ext == "csv":
+                    self.assertEqual(resp, data)
+
+    def test_failed_export(self):
+        temp_path = path_join(self.temp_dir.name, "export.json")
+
+        with open(temp_path, "w") as pointer:
+            pointer.write("previous")
+
+        with MockAPIServer(total_records=2500, error_rate=1, seed=1) as server:
+            api = Cov19API(["areaType=ltla"], offline_structure)
+            api.endpoint = server.data_endpoint
+
+            with self.assertRaises(FailedRequestError):
+                api.export(temp_path)
+
+        # The previous file is kept, and the temporary file is removed.
+        with open(temp_path, "r") as pointer:
+            self.assertEqual(pointer.read(), "previous")
+
+        self.assertListEqual(listdir(self.temp_dir.name), ["export.json"])
+
+    def test_cache(self):
+        cache = ResponseCache(path_join(self.temp_dir.name, "cache"))
+        api = self.make_api(cache=cache)
+
+        data = api.get_json()
+        self.assertEqual(api.stats.cache_hits, 0)
+
+        # Pages within their ``max-age`` are not requested again,
+        # including the empty page past the last one.
+        self.assertDictEqual(api.get_json(), data)
+        self.assertEqual(api.stats.cache_hits, 4)
+        self.assertEqual(api.stats.requests, 0)
+        self.assertEqual(api.decompressed_bytes, 0)
+
+    def test_batch(self):
+        missing = self.make_api()
+        missing.endpoint = f"{self.server.url}/v1/missing"
+
+        queries = {
+            "ltla": self.api,
+            "concurrent": self.make_api(),
+            "missing": missing
+        }
+
+        batch = Cov19API.batch(queries, max_workers=3, concurrency=2)
+
+        self.assertSetEqual(set(batch.results), {"ltla", "concurrent"})
+        self.assertDictEqual(batch.results["ltla"], batch.results["concurrent"])
+        self.assertEqual(batch.results["ltla"]["length"], 2500)
+        self.assertIsInstance(batch.errors["missing"], FailedRequestError)
+
+    def test_iter_batch_closed(self):
+        counter = QueryCounter()
+
+        # Each query takes at least 0.2s, so that the iteration stops well
+        # before the running queries are complete.
+        with MockAPIServer(total_records=2500, latency=0.05) as server:
+            queries = list()
+
+            for _ in range(12):
+                query = Cov19API(["areaType=ltla"], offline_structure, observers=[counter])
+                query.endpoint = server.data_endpoint
+                queries.append(query)
+
+            for _ in iter_batch(queries, max_workers=2):
+                break
+
+        # Only the queries already running when the iteration stopped
+        # are completed; the others are cancelled.
+        self.assertLess(counter.queries, 6)
+
+    def test_retry(self):
+        policy = RetryPolicy(max_attempts=10, backoff_factor=0)
+
+        with MockAPIServer(total_records=2500, error_rate=0.3, seed=1) as server:
+            api = Cov19API(["areaType=ltla"], offline_structure, retry=policy)
+            api.endpoint = server.data_endpoint
+
+            # Failed pages are retried individually.
+            self.assertEqual(api.get_json(concurrency=2)["length"], 2500)
+            self.assertGreater(api.retries, 0)
+            self.assertEqual(api.stats.retries, api.retries)
+
+        with MockAPIServer(total_records=2500, error_rate=1) as server:
+            api = Cov19API(["areaType=ltla"], offline_structure, retry=policy)
+            api.endpoint = server.data_endpoint
+
+            with self.assertRaises(FailedRequestError):
+                api.get_json()
+
+            self.assertEqual(api.retries, policy.max_attempts - 1)
+
+    def test_rate_limiter(self):
+        # The first request uses the burst; the other three --
+        # including the request past the last page -- wait.
+        limiter = RateLimiter(rate=20, burst=1)
+        api = self.make_api(rate_limiter=limiter)
+
+        start = perf_counter()
+        self.assertEqual(api.get_json(concurrency=4)["length"], 2500)
+        self.assertGreaterEqual(perf_counter() - start, 3 / 20 - 0.01)
+
+        # Instances that share a limiter share its rate.
+        queries = [self.make_api(rate_limiter=limiter) for _ in range(2)]
+
+        start = perf_counter()
+        Cov19API.batch(queries, max_workers=2)
+        self.assertGreaterEqual(perf_counter() - start, 8 / 20 - 0.01)
+
+    @skipUnless(DataFrame, "The `pandas` library is not installed.")
+    def test_as_dataframe(self):
+        df = self.api.get_dataframe(concurrency=2)
+        data = self.api.get_json()
+
+        self.assertIsInstance(df, DataFrame)
+        self.assertListEqual(list(df.columns), list(offline_structure))
+        self.assertEqual(df.index.size, data["length"])
+        self.assertEqual(df["name"].dtype, "category")
+        self.assertEqual(df["code"].dtype, "category")
+        self.assertEqual(df["date"].dtype.kind, "M")
+        self.assertEqual(df["newCases"].dtype, "Int64")
+
+        # Missing counts are kept as nulls in the integer column.
+        new_cases = [record["newCases"] for record in data["data"]]
+        self.assertEqual(df["newCases"].isna().sum(), new_cases.count(None))
+        self.assertListEqual(
+            df["newCases"].dropna().tolist(),
+            [value for value in new_cases if value is not None]
+        )
+
+        # Queries without data produce an empty frame with the columns.
+        api = Cov19API(["areaType=ltla", "date=2030-01-01"], offline_structure)
+        api.endpoint = self.server.data_endpoint
+
+        df = api.get_dataframe()
+        self.assertEqual(df.index.size, 0)
+        self.assertListEqual(list(df.columns), list(offline_structure))
@@ -0,0 +1,175 @@
+#!/usr/bin python3
+
+# Imports
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Python:
+from unittest import TestCase, skipUnless
+from tempfile import TemporaryDirectory
+from json import loads
+from os import path
+import asyncio
+
+# 3rd party:
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import pyarrow as pa
+    from pyarrow.parquet import read_table as read_parquet
+except ImportError:
+    pa = None
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+# Internal:
+from uk_covid19 import AsyncCov19API
+from uk_covid19.store import JSONStore
+from .mock_api import MockAPIServer, FIRST_DATE, AREAS_PER_DATE
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+test_structure = {
+    "date": "date",
+    "code": "areaCode",
+    "newCases": "newCasesBySpecimenDate"
+}
+
+
+@skipUnless(aiohttp, "The `aiohttp` library is not installed.")
+class TestAsyncCov19API(TestCase):
+    def setUp(self) -> None:
+        self.server = MockAPIServer(total_records=2500).start()
+        self.temp_dir = TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.server.stop()
+        self.temp_dir.cleanup()
+
+    def run_query(self, method, *args, structure=None, **kwargs):
+        async def query():
+            async with AsyncCov19API(["areaType=ltla"], structure or test_structure) as api:
+                api.endpoint = self.server.data_endpoint
+                return await getattr(api, method)(*args, **kwargs)
+
+        return asyncio.run(query())
+
+    def collect(self, method, *args, **kwargs):
+        async def query():
+            async with AsyncCov19API(["areaType=ltla"], test_structure) as api:
+                api.endpoint = self.server.data_endpoint
+                return [item async for item in getattr(api, method)(*args, **kwargs)]
+
+        return asyncio.run(query())
+
+    def test_last_update(self):
+        async def query():
+            async with AsyncCov19API(["areaType=ltla"], test_structure) as api:
+                api.endpoint = self.server.data_endpoint
+                return await api.last_update
+
+        # The property is awaited, before the data are requested.
+        self.assertEqual(asyncio.run(query()), "2020-10-12T15:12:34.000000Z")
+
+    def test_get_csv(self):
+        data = self.run_query("get_csv", concurrency=2)
+        lines = data.splitlines()
+
+        self.assertEqual(lines[0], "date,code,newCases")
+        self.assertEqual(len(lines), 2501)
+
+        with self.assertRaises(ValueError):
+            self.run_query("get_csv", structure={"date": {"value": "date"}})
+
+    def test_iter_csv_lines(self):
+        lines = self.collect("iter_csv_lines", concurrency=2)
+
+        self.assertEqual(lines[0], "date,code,newCases")
+        self.assertEqual(len(lines), 2501)
+        self.assertEqual(lines[1:], self.run_query("get_csv").splitlines()[1:])
+
+    def test_iter_xml_elements(self):
+        elements = self.collect("iter_xml_elements")
+
+        self.assertEqual(len(elements), 2500)
+        self.assertEqual(elements[0].findtext("date"), FIRST_DATE.isoformat())
+
+    def test_export(self):
+        for ext in ("json", "xml", "csv"):
+            with self.subTest(ext=ext):
+                file_path = path.join(self.temp_dir.name, f"data.{ext}")
+                self.run_query("export", file_path, concurrency=2)
+
+                with open(file_path) as pointer:
+                    content = pointer.read()
+
+                if ext == "json":
+                    data = loads(content)
+                    self.assertEqual(data["length"], 2500)
+                    self.assertEqual(data["totalPages"], 3)
+                elif ext == "xml":
+                    self.assertEqual(content.count("<data>"), 2500)
+                    self.assertTrue(content.endswith("</document>"))
+                else:
+                    self.assertEqual(len(content.splitlines()), 2501)
+
+        with self.assertRaises(ValueError):
+            self.run_query("export", path.join(self.temp_dir.name, "data.txt"))
+
+    def test_save_as(self):
+        for ext in ("json", "xml", "csv"):
+            with self.subTest(ext=ext):
+                file_path = path.join(self.temp_dir.name, f"save_as.{ext}")
+                resp = self.run_query(f"get_{ext}", save_as=file_path, concurrency=2)
+
+                with open(file_path) as pointer:
+                    content = pointer.read()
+
+                # The pages are written as received, as with ``.export()``.
+                self.run_query("export", path.join(self.temp_dir.name, f"export.{ext}"))
+
+                with open(path.join(self.temp_dir.name, f"export.{ext}")) as pointer:
+                    self.assertEqual(content, pointer.read())
+
+                if ext == "json":
+                    self.assertEqual(resp["length"], 2500)
+                    self.assertEqual(len(resp["data"]), 2500)
+                elif ext == "xml":
+                    self.assertEqual(len(resp.findall("data")), 2500)
+                else:
+                    self.assertEqual(resp, content)
+
+    @skipUnless(pa, "The `pyarrow` library is not installed.")
+    def test_get_arrow(self):
+        file_path = path.join(self.temp_dir.name, "data.parquet")
+        table = self.run_query("get_arrow", save_as=file_path, concurrency=2)
+
+        self.assertEqual(table.num_rows, 2500)
+        self.assertEqual(table.schema.field("date").type, pa.date32())
+        self.assertEqual(read_parquet(file_path).num_rows, 2500)
+
+    @skipUnless(pd, "The `pandas` library is not installed.")
+    def test_get_dataframe(self):
+        df = self.run_query("get_dataframe", concurrency=2)
+
+        self.assertEqual(len(df), 2500)
+        self.assertEqual(str(df["code"].dtype), "category")
+        self.assertEqual(str(df["newCases"].dtype), "Int64")
+
+    def test_sync(self):
+        store_path = path.join(self.temp_dir.name, "store.json")
+
+        self.assertEqual(self.run_query("sync", JSONStore(store_path)), 2500)
+
+        # Only the dates from the look-back onwards are requested.
+        total = self.run_query(
+            "sync", JSONStore(store_path), lookback=1, end_date=FIRST_DATE
+        )
+
+        self.assertEqual(total, 2 * AREAS_PER_DATE)
+        self.assertEqual(len(JSONStore(store_path)), 2500)
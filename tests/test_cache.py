@@ -0,0 +1,122 @@
+#!/usr/bin python3
+
+# Imports
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Python:
+from unittest import TestCase
+from tempfile import TemporaryDirectory
+from concurrent.futures import ThreadPoolExecutor
+import os
+
+# 3rd party:
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+# Internal:
+from uk_covid19.cache import ResponseCache
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+test_url = "https://api.coronavirus.data.gov.uk/v1/data?filters=areaType%3Dnation&page={}"
+test_last_modified = "Mon, 12 Oct 2020 15:12:34 GMT"
+
+
+def make_response(content: bytes, status_code: int = 200, max_age: int = 60) -> Response:
+    response = Response()
+    response.status_code = status_code
+    response.headers = CaseInsensitiveDict({
+        "Cache-Control": f"public, max-age={max_age}",
+        "Last-Modified": test_last_modified,
+        "Content-Type": "application/json; charset=utf-8"
+    })
+    response._content = content
+
+    return response
+
+
+class TestResponseCache(TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = TemporaryDirectory()
+        self.cache = ResponseCache(self.temp_dir.name)
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def test_get_set(self):
+        url = test_url.format(1)
+        self.assertIsNone(self.cache.get(url))
+
+        self.cache.set(url, make_response(b'{"data":[]}'))
+
+        entry = self.cache.get(url)
+        self.assertTrue(entry.is_fresh())
+        self.assertEqual(entry.to_response().json(), {"data": []})
+        self.assertEqual(entry.validators, {"If-Modified-Since": test_last_modified})
+
+        # Entries are available to new instances.
+        self.assertEqual(len(ResponseCache(self.temp_dir.name)), 1)
+
+    def test_shared_directory(self):
+        url = test_url.format(1)
+        caches = [ResponseCache(self.temp_dir.name) for _ in range(4)]
+
+        def store(index):
+            caches[index % len(caches)].set(url, make_response(b'{"data":[]}'))
+
+        # Instances with separate locks write to the same directory.
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(store, range(200)))
+
+        self.assertEqual(self.cache.get(url).to_response().json(), {"data": []})
+        self.assertFalse([
+            filename
+            for filename in os.listdir(self.temp_dir.name)
+            if filename.endswith(".tmp")
+        ])
+
+    def test_stale_entry(self):
+        url = test_url.format(1)
+        self.cache.set(url, make_response(b"data", max_age=0))
+
+        entry = self.cache.get(url)
+        self.assertFalse(entry.is_fresh())
+
+        refreshed = self.cache.refresh(entry, make_response(b"", status_code=304))
+        self.assertEqual(refreshed.content, b"data")
+        self.assertTrue(refreshed.is_fresh())
+
+    def test_eviction(self):
+        cache = ResponseCache(self.temp_dir.name, max_size=25)
+
+        for page in range(1, 4):
+            cache.set(test_url.format(page), make_response(b"x" * 10))
+
+        # Using page 2 makes page 3 the least recently used entry
+        # once page 4 is added.
+        cache.get(test_url.format(2))
+        cache.set(test_url.format(4), make_response(b"x" * 10))
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.size, 20)
+        self.assertIsNotNone(cache.get(test_url.format(2)))
+        self.assertIsNone(cache.get(test_url.format(3)))
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+    def test_release_aware(self):
+        cache = ResponseCache(self.temp_dir.name, release_aware=True, release_check_interval=0)
+        timestamps = ["2020-10-12T15:00:09.977840Z"]
+
+        self.assertTrue(cache.check_release(lambda: timestamps[-1]))
+        cache.set(test_url.format(1), make_response(b"data", max_age=0))
+
+        # Stale responses remain usable until the next release.
+        self.assertFalse(cache.check_release(lambda: timestamps[-1]))
+        self.assertTrue(cache.is_fresh(cache.get(test_url.format(1))))
+
+        timestamps.append("2020-10-13T15:00:09.977840Z")
+        self.assertTrue(cache.check_release(lambda: timestamps[-1]))
+        self.assertEqual(cache.release_timestamp, timestamps[-1])
+        self.assertIsNone(cache.get(test_url.format(1)))
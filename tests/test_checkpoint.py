@@ -0,0 +1,162 @@
+#!/usr/bin python3
+
+# Imports
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Python:
+from unittest import TestCase
+from tempfile import TemporaryDirectory
+from json import dumps
+from glob import glob
+from os import path, remove
+
+# 3rd party:
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+# Internal:
+from uk_covid19 import Cov19API
+from uk_covid19.checkpoint import Checkpoint
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+class PagedAPI(Cov19API):
+    endpoint = "https://api.example.com/v1/extract"
+
+    total_pages = 4
+    last_modified = "Mon, 12 Oct 2020 15:12:34 GMT"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.requested_pages = list()
+
+    def head(self):
+        return {"Last-Modified": self.last_modified}
+
+    def _request_page(self, api_params: dict, revalidate: bool = False) -> Response:
+        page = api_params["page"]
+        self.requested_pages.append(page)
+
+        response = Response()
+        response.url = f"{self.endpoint}?page={page}"
+        response.headers = CaseInsensitiveDict({"Last-Modified": self.last_modified})
+        response.status_code = 200
+        response._content = dumps({
+            "data": [{"date": f"2020-10-{page:02d}", "name": self.last_modified}]
+        }).encode()
+
+        if page > self.total_pages:
+            response.status_code = 204
+            response._content = b""
+
+        return response
+
+
+class TestCheckpoint(TestCase):
+    def setUp(self) -> None:
+        self.directory = TemporaryDirectory()
+        self.checkpoint = Checkpoint(self.directory.name)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def get_api(self) -> PagedAPI:
+        return PagedAPI(
+            filters=["areaType=nation"],
+            structure={"date": "date", "name": "areaName"},
+            checkpoint=self.checkpoint
+        )
+
+    def interrupt(self, api: PagedAPI, pages: int):
+        iterator = api.iter_pages()
+
+        for _ in range(pages):
+            next(iterator)
+
+        iterator.close()
+
+    def test_resume(self):
+        self.interrupt(self.get_api(), 2)
+
+        api = self.get_api()
+        data = api.get_json()["data"]
+
+        self.assertEqual([item["date"] for item in data], [
+            "2020-10-01", "2020-10-02", "2020-10-03", "2020-10-04"
+        ])
+        self.assertEqual(api.requested_pages, [3, 4, 5])
+        self.assertEqual(api.stats.cache_hits, 2)
+        self.assertEqual(api.total_pages, 4)
+
+        # The checkpoint is removed once the extract is complete.
+        api = self.get_api()
+        api.get_json()
+        self.assertEqual(api.requested_pages, [1, 2, 3, 4, 5])
+
+    def test_damaged_page(self):
+        self.interrupt(self.get_api(), 3)
+
+        page_path, = glob(path.join(self.directory.name, "*", "2.body"))
+        remove(page_path)
+
+        api = self.get_api()
+        data = api.get_json()["data"]
+
+        # The extract continues from the damaged page, without
+        # producing the pages before it twice.
+        self.assertEqual([item["date"] for item in data], [
+            "2020-10-01", "2020-10-02", "2020-10-03", "2020-10-04"
+        ])
+        self.assertEqual(data, [item for item in data if data.count(item) == 1])
+        self.assertEqual(api.requested_pages, [2, 3, 4, 5])
+        self.assertEqual(api.stats.cache_hits, 1)
+
+    def test_restart_after_update(self):
+        self.interrupt(self.get_api(), 2)
+
+        api = self.get_api()
+        api.last_modified = "Tue, 13 Oct 2020 15:12:34 GMT"
+        data = api.get_json()["data"]
+
+        self.assertEqual(api.requested_pages, [1, 2, 3, 4, 5])
+        self.assertEqual({item["name"] for item in data}, {api.last_modified})
+
+    def test_update_mid_extract(self):
+        api = self.get_api()
+        iterator = api.iter_pages()
+        next(iterator)
+
+        api.last_modified = "Tue, 13 Oct 2020 15:12:34 GMT"
+        next(iterator)
+        iterator.close()
+
+        # Pages of different releases are never resumed.
+        api = self.get_api()
+        api.get_json()
+        self.assertEqual(api.requested_pages, [1, 2, 3, 4, 5])
+
+    def test_add_page(self):
+        url = "https://api.example.com/v1/extract?format=json"
+        api = self.get_api()
+
+        page = api._request_page({"page": 1})
+        state = self.checkpoint.add_page(url, 1, page)
+        self.assertEqual(state.next_page, 2)
+        self.assertEqual(self.checkpoint.get_page(url, 1).content, page.content)
+        self.assertIsNone(self.checkpoint.get_page(url, 2))
+
+        with self.assertRaises(ValueError):
+            self.checkpoint.add_page(url, 3, api._request_page({"page": 3}))
+
+        self.checkpoint.add_page(url, 2, api._request_page({"page": 2}))
+        self.assertEqual(self.checkpoint.rewind(url, 2).next_page, 2)
+        self.assertIsNone(self.checkpoint.get_page(url, 2))
+        self.assertIsNotNone(self.checkpoint.get_page(url, 1))
+
+        api.last_modified = "Tue, 13 Oct 2020 15:12:34 GMT"
+
+        with self.assertRaises(ValueError):
+            self.checkpoint.add_page(url, 2, api._request_page({"page": 2}))
+
+        self.checkpoint.clear()
+        self.assertIsNone(self.checkpoint.get_state(url))
@@ -0,0 +1,86 @@
+#!/usr/bin python3
+
+# Imports
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Python:
+from unittest import TestCase, skipUnless
+from tempfile import TemporaryDirectory
+from os import path
+
+# 3rd party:
+try:
+    import pyarrow as pa
+    from pyarrow.feather import read_table as read_feather
+    from pyarrow.parquet import read_table as read_parquet
+except ImportError:
+    pa = None
+
+# Internal:
+from uk_covid19.columnar import get_arrow_schema, read_csv_table
+from uk_covid19.data_format import ArrowFormat
+from uk_covid19.utils import stream_tables
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+test_structure = {
+    "date": "date",
+    "name": "areaName",
+    "newCases": "newCasesBySpecimenDate",
+    "caseRate": "newCasesBySpecimenDateRollingRate"
+}
+
+test_pages = [
+    b"date,name,newCases,caseRate\n"
+    b"2020-10-12,Adur,12,51.2\n"
+    b"2020-10-12,Allerdale,,\n",
+    b"date,name,newCases,caseRate\n"
+    b"2020-10-11,Amber Valley,3,20.5\n"
+    b"2020-10-11,Adur,7,49.9\n"
+]
+
+
+@skipUnless(pa is not None, "The `pyarrow` library is not installed.")
+class TestColumnar(TestCase):
+    def setUp(self) -> None:
+        self.schema = get_arrow_schema(test_structure)
+        self.tables = [read_csv_table(page, self.schema) for page in test_pages]
+
+    def test_schema(self):
+        self.assertEqual(self.schema.field("date").type, pa.date32())
+        self.assertTrue(pa.types.is_dictionary(self.schema.field("name").type))
+        self.assertEqual(self.schema.field("newCases").type, pa.int64())
+        self.assertEqual(self.schema.field("caseRate").type, pa.float64())
+
+    def test_read_csv_table(self):
+        table = self.tables[0]
+
+        self.assertEqual(table.schema, self.schema)
+        self.assertEqual(table.column("newCases").to_pylist(), [12, None])
+        self.assertEqual(table.column("name").to_pylist(), ["Adur", "Allerdale"])
+
+    def test_string_metric(self):
+        structure = {"date": "date", "alertLevel": "alertLevelName"}
+        schema = get_arrow_schema(structure)
+        page = (
+            b"date,alertLevel\n"
+            b"2020-10-12,Medium\n"
+            b"2020-10-12,\n"
+        )
+
+        table = read_csv_table(page, schema)
+
+        self.assertEqual(schema.field("alertLevel").type, pa.string())
+        self.assertEqual(table.column("alertLevel").to_pylist(), ["Medium", None])
+
+    def test_stream_tables(self):
+        expected = pa.concat_tables(self.tables).to_pandas()
+
+        with TemporaryDirectory() as directory:
+            for ext, read in ((ArrowFormat.PARQUET, read_parquet),
+                              (ArrowFormat.FEATHER, read_feather)):
+                file_path = path.join(directory, f"data.{ext.value}")
+                stream_tables(iter(self.tables), self.schema, file_path, ext)
+
+                with self.subTest(ext=ext):
+                    self.assertTrue(read(file_path).to_pandas().equals(expected))
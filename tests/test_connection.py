@@ -0,0 +1,29 @@
+#!/usr/bin python3
+
+# Imports
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Python:
+from unittest import TestCase
+
+# 3rd party:
+
+# Internal:
+from uk_covid19.connection import create_session
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+class TestCreateSession(TestCase):
+    def test_compression(self):
+        with create_session() as session:
+            accept_encoding = session.headers["Accept-Encoding"]
+
+            self.assertIn("gzip", accept_encoding)
+            self.assertIn("deflate", accept_encoding)
+
+        with create_session(compression=False) as session:
+            self.assertEqual(session.headers["Accept-Encoding"], "identity")
+
+    def test_keep_alive(self):
+        with create_session(keep_alive=False) as session:
+            self.assertEqual(session.headers["Connection"], "close")
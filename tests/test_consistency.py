@@ -0,0 +1,189 @@
+#!/usr/bin python3
+
+# Imports
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Python:
+from unittest import TestCase
+from tempfile import TemporaryDirectory
+from json import dumps
+from itertools import count
+
+# 3rd party:
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+# Internal:
+from uk_covid19 import Cov19API
+from uk_covid19.cache import ResponseCache
+from uk_covid19.instrumentation import Observer
+from uk_covid19.exceptions import ReleaseChangedError
+from .mock_api import MockAPIServer
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+PREVIOUS_RELEASE = "Mon, 12 Oct 2020 15:12:34 GMT"
+LATEST_RELEASE = "Tue, 13 Oct 2020 15:12:34 GMT"
+
+
+class ReleasingAPI(Cov19API):
+    """
+    Serves 4 pages of the previous release -- 5 of the latest release --
+    and publishes the latest release after ``release_after`` requests.
+    """
+    endpoint = "https://api.example.com/v1/releases"
+
+    release_after = 2
+    previous_pages = 4
+    latest_pages = 5
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.requested_pages = list()
+
+    def is_released(self, page: int) -> bool:
+        return len(self.requested_pages) > self.release_after
+
+    def _request_page(self, api_params: dict, revalidate: bool = False) -> Response:
+        page = api_params["page"]
+        self.requested_pages.append(page)
+
+        released = self.is_released(page)
+        last_modified = LATEST_RELEASE if released else PREVIOUS_RELEASE
+
+        response = Response()
+        response.url = f"{self.endpoint}?page={page}"
+        response.headers = CaseInsensitiveDict({"Last-Modified": last_modified})
+        response.status_code = 200
+        response._content = dumps({
+            "data": [{"date": f"2020-10-{page:02d}", "name": last_modified}]
+        }).encode()
+
+        if page > (self.latest_pages if released else self.previous_pages):
+            response.status_code = 204
+            response._content = b""
+
+        return response
+
+
+class ShrinkingAPI(ReleasingAPI):
+    """
+    Serves pages 1 and 4 of the first pass from the previous release,
+    and the others from the latest release, which has 3 pages.
+    """
+    latest_pages = 3
+
+    def is_released(self, page: int) -> bool:
+        return len(self.requested_pages) > 5 or page in (2, 3)
+
+
+class ReleaseObserver(Observer):
+    """
+    Publishes the latest release on the mock API once ``release_after``
+    pages have been received.
+    """
+    def __init__(self, server: MockAPIServer, release_after: int):
+        self.server = server
+        self.release_after = release_after
+        self.pages = 0
+
+    def page_received(self, api, event):
+        self.pages += 1
+
+        if self.pages == self.release_after:
+            self.server.last_modified = LATEST_RELEASE
+
+
+class TestConsistency(TestCase):
+    def get_api(self, consistency) -> ReleasingAPI:
+        return ReleasingAPI(
+            filters=["areaType=nation"],
+            structure={"date": "date", "name": "areaName"},
+            consistency=consistency
+        )
+
+    def test_unchecked(self):
+        data = self.get_api(None).get_json()["data"]
+
+        self.assertEqual(len({item["name"] for item in data}), 2)
+
+    def test_raise(self):
+        api = self.get_api("raise")
+
+        with self.assertRaises(ReleaseChangedError) as context:
+            api.get_json()
+
+        self.assertEqual(context.exception.page, 3)
+        self.assertEqual(context.exception.expected, PREVIOUS_RELEASE)
+        self.assertEqual(context.exception.received, LATEST_RELEASE)
+
+    def test_restart(self):
+        api = self.get_api("restart")
+        data = api.get_json()["data"]
+
+        self.assertEqual([item["name"] for item in data], [LATEST_RELEASE] * 5)
+        self.assertEqual(api.requested_pages, [1, 2, 3, 4, 5, 6, 1, 2, 3, 4, 5, 6])
+        self.assertEqual(api.last_update, "2020-10-13T15:12:34.000000Z")
+
+    def test_restart_with_cache(self):
+        with TemporaryDirectory() as directory, \
+                MockAPIServer(total_records=3000, last_modified=PREVIOUS_RELEASE) as server:
+            api = Cov19API(
+                filters=["areaType=ltla"],
+                structure={"date": "date", "newCases": "newCasesBySpecimenDate"},
+                cache=ResponseCache(directory),
+                observers=[ReleaseObserver(server, release_after=2)],
+                consistency="restart"
+            )
+            api.endpoint = server.data_endpoint
+            data = api.get_json()
+
+        # The pages of the previous release stored in the cache are
+        # revalidated, rather than produced again.
+        self.assertEqual(data["length"], 3000)
+        self.assertEqual(api.last_update, "2020-10-13T15:12:34.000000Z")
+
+    def test_refetch(self):
+        api = self.get_api("refetch")
+        data = api.get_json()["data"]
+
+        self.assertEqual([item["name"] for item in data], [LATEST_RELEASE] * 5)
+        self.assertEqual(api.requested_pages, [1, 2, 3, 4, 5, 6, 1, 2, 6])
+        self.assertEqual(api.last_update, "2020-10-13T15:12:34.000000Z")
+        self.assertEqual(api.total_pages, 5)
+
+    def test_refetch_fewer_pages(self):
+        api = ShrinkingAPI(
+            filters=["areaType=nation"],
+            structure={"date": "date", "name": "areaName"},
+            consistency="refetch"
+        )
+        data = api.get_json()
+
+        self.assertEqual([item["name"] for item in data["data"]], [LATEST_RELEASE] * 3)
+        self.assertEqual(api.requested_pages, [1, 2, 3, 4, 5, 1, 4])
+        self.assertEqual(data["lastUpdate"], "2020-10-13T15:12:34.000000Z")
+        self.assertEqual(api.last_update, "2020-10-13T15:12:34.000000Z")
+        self.assertEqual(api.total_pages, 3)
+
+    def test_attempts_exhausted(self):
+        api = self.get_api("refetch")
+        api.release_after = 1
+
+        # Every request after the first publishes a new release.
+        releases = (f"Wed, 14 Oct 2020 15:{minute:02d}:00 GMT" for minute in count())
+        request_page = api._request_page
+
+        def request_new_release(api_params, revalidate=False):
+            response = request_page(api_params, revalidate)
+            response.headers["Last-Modified"] = next(releases)
+            return response
+
+        api._request_page = request_new_release
+
+        with self.assertRaises(ReleaseChangedError):
+            api.get_json()
+
+    def test_unknown_policy(self):
+        with self.assertRaises(ValueError):
+            self.get_api("ignore")
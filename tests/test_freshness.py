@@ -0,0 +1,64 @@
+#!/usr/bin python3
+
+# Imports
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Python:
+from unittest import TestCase
+from datetime import datetime, timezone
+
+# 3rd party:
+
+# Internal:
+from uk_covid19 import Cov19API
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+class HeadCountingAPI(Cov19API):
+    endpoint = "https://api.example.com/v1/data"
+
+    last_modified = "Mon, 12 Oct 2020 15:12:34 GMT"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.head_requests = 0
+
+    def head(self):
+        self.head_requests += 1
+        return {"Last-Modified": self.last_modified}
+
+
+class TestFreshness(TestCase):
+    def setUp(self) -> None:
+        self.structure = {"date": "date", "name": "areaName"}
+
+    def test_freshness(self):
+        api = HeadCountingAPI(filters=["areaType=nation"], structure=self.structure)
+
+        self.assertEqual(api.freshness(), "2020-10-12T15:12:34.000000Z")
+        self.assertEqual(api.freshness(), "2020-10-12T15:12:34.000000Z")
+        self.assertEqual(api.head_requests, 1)
+
+        api.freshness(max_age=0)
+        self.assertEqual(api.head_requests, 2)
+
+        # Instances with the same query share the header.
+        other = HeadCountingAPI(filters=["areaType=nation"], structure=self.structure)
+        self.assertEqual(other.last_update, "2020-10-12T15:12:34.000000Z")
+        self.assertEqual(other.head_requests, 0)
+
+        different = HeadCountingAPI(filters=["areaType=region"], structure=self.structure)
+        different.freshness()
+        self.assertEqual(different.head_requests, 1)
+
+    def test_has_changed_since(self):
+        api = HeadCountingAPI(filters=["areaType=utla"], structure=self.structure)
+
+        self.assertFalse(api.has_changed_since("2020-10-12T15:12:34.000000Z"))
+        self.assertTrue(api.has_changed_since("2020-10-12T15:12:33.000000Z"))
+        self.assertTrue(api.has_changed_since("Sun, 11 Oct 2020 15:12:34 GMT"))
+        self.assertFalse(api.has_changed_since(datetime(2020, 10, 12, 16, 0)))
+        self.assertTrue(
+            api.has_changed_since(datetime(2020, 10, 12, 15, 0, tzinfo=timezone.utc))
+        )
+        self.assertEqual(api.head_requests, 1)
@@ -0,0 +1,61 @@
+#!/usr/bin python3
+
+# Imports
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Python:
+from unittest import TestCase
+
+# 3rd party:
+
+# Internal:
+from uk_covid19.instrumentation import PageEvent, QueryStats
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+def make_event(page, status_code=200, attempts=1, from_cache=False, size=100):
+    return PageEvent(
+        page=page,
+        format="json",
+        status_code=status_code,
+        attempts=attempts,
+        from_cache=from_cache,
+        started_at=0,
+        latency=0.1,
+        duration=0.5,
+        compressed_bytes=0 if from_cache else size // 2,
+        decompressed_bytes=0 if from_cache else size
+    )
+
+
+class TestQueryStats(TestCase):
+    def test_add_page(self):
+        stats = QueryStats("json")
+
+        stats.add_page(make_event(1, attempts=3))
+        stats.add_page(make_event(2, from_cache=True))
+        stats.add_page(make_event(3, status_code=204, size=0))
+
+        self.assertEqual(stats.pages, 2)
+        self.assertEqual(stats.requests, 4)
+        self.assertEqual(stats.retries, 2)
+        self.assertEqual(stats.cache_hits, 1)
+        self.assertEqual(stats.compressed_bytes, 50)
+        self.assertEqual(stats.decompressed_bytes, 100)
+        self.assertAlmostEqual(stats.request_time, 1.5)
+
+    def test_as_dict(self):
+        stats = QueryStats("csv")
+        result = stats.as_dict()
+
+        self.assertEqual(result["format"], "csv")
+        self.assertEqual(result["pages"], 0)
+        self.assertNotIn("_lock", result)
+        self.assertEqual(
+            set(result),
+            {
+                "format", "pages", "requests", "retries", "cache_hits",
+                "compressed_bytes", "decompressed_bytes", "request_time",
+                "wait_time", "parse_time", "wall_time"
+            }
+        )
@@ -0,0 +1,101 @@
+#!/usr/bin python3
+
+# Imports
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Python:
+from unittest import TestCase, skipUnless
+from datetime import date
+
+# 3rd party:
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+# Internal:
+from uk_covid19.json_backend import (
+    BACKENDS, JSONBackend, MsgspecBackend, get_json_backend, set_json_backend,
+    make_record_type
+)
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+test_structure = {
+    "date": "date",
+    "name": "areaName",
+    "newCases": "newCasesBySpecimenDate"
+}
+
+test_page = (
+    b'{"length":2,"data":['
+    b'{"date":"2020-10-12","name":"Ynys M\\u00f4n","newCases":4},'
+    b'{"date":"2020-10-11","name":"Adur","newCases":null}'
+    b'],"pagination":{}}'
+)
+
+
+class TestJSONBackend(TestCase):
+    def test_backends(self):
+        expected = [
+            {"date": "2020-10-12", "name": "Ynys Môn", "newCases": 4},
+            {"date": "2020-10-11", "name": "Adur", "newCases": None}
+        ]
+
+        for name, backend_type in BACKENDS.items():
+            try:
+                backend = backend_type()
+            except ImportError:
+                continue
+
+            with self.subTest(backend=name):
+                data = backend.decode_page(test_page)
+
+                self.assertEqual(data, expected)
+                self.assertEqual(backend.loads(backend.dumps(data)), expected)
+
+                collected = list()
+                chunk, length = backend.extract_data(test_page, collected)
+
+                self.assertEqual(length, 2)
+                self.assertEqual(backend.loads(f"[{chunk}]"), expected)
+                self.assertEqual(collected, expected)
+
+    @skipUnless(msgspec, "The `msgspec` library is not installed.")
+    def test_raw_records(self):
+        backend = MsgspecBackend()
+
+        # Without ``collect``, the records are reproduced as received --
+        # i.e. including the escaped characters.
+        chunk, length = backend.extract_data(test_page)
+
+        self.assertEqual(length, 2)
+        self.assertEqual(chunk.encode(), test_page[test_page.index(b"[") + 1:test_page.index(b"]")])
+
+        collected = list()
+        chunk, length = backend.extract_data(test_page, collected)
+
+        self.assertEqual(length, 2)
+        self.assertEqual(backend.loads(f"[{chunk}]"), collected)
+        self.assertEqual(collected[0]["name"], "Ynys Môn")
+
+    def test_typed_records(self):
+        record_type = make_record_type(test_structure)
+        records = JSONBackend().decode_page(test_page, record_type)
+
+        self.assertEqual(records[0].date, date(2020, 10, 12))
+        self.assertEqual(records[0].newCases, 4)
+        self.assertIsNone(records[1].newCases)
+
+    def test_default_backend(self):
+        current = get_json_backend()
+
+        try:
+            set_json_backend("json")
+            self.assertIsInstance(get_json_backend(), JSONBackend)
+            self.assertEqual(get_json_backend().name, "json")
+
+            with self.assertRaises(ValueError):
+                set_json_backend("simplejson")
+        finally:
+            set_json_backend(current)
@@ -0,0 +1,67 @@
+#!/usr/bin python3
+
+# Imports
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Python:
+from unittest import TestCase, skipIf
+from tempfile import TemporaryDirectory
+from concurrent.futures import ThreadPoolExecutor
+from os.path import join as path_join
+from time import monotonic, sleep
+import os
+
+# 3rd party:
+
+# Internal:
+from uk_covid19.rate_limit import RateLimiter, FileRateLimiter
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+class TestRateLimiter(TestCase):
+    def test_rate(self):
+        limiter = RateLimiter(rate=50, burst=5)
+
+        start = monotonic()
+
+        for _ in range(15):
+            with limiter:
+                pass
+
+        # The burst is immediate; the remaining 10 requests
+        # are spread at 50 requests per second.
+        self.assertGreaterEqual(monotonic() - start, 0.18)
+
+    def test_max_concurrent(self):
+        limiter = RateLimiter(rate=1000, max_concurrent=2)
+        active = list()
+        peak = list()
+
+        def request(_):
+            with limiter:
+                active.append(1)
+                peak.append(len(active))
+                sleep(0.01)
+                active.pop()
+
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            list(executor.map(request, range(12)))
+
+        self.assertLessEqual(max(peak), 2)
+
+    @skipIf(os.name != "posix", "File locks are only supported on POSIX systems.")
+    def test_file_rate_limiter(self):
+        with TemporaryDirectory() as temp_dir:
+            path = path_join(temp_dir, "limiter.json")
+
+            # Two limiters sharing a file share the same bucket.
+            first = FileRateLimiter(path, rate=50, burst=2)
+            second = FileRateLimiter(path, rate=50, burst=2)
+
+            start = monotonic()
+
+            for limiter in (first, second) * 3:
+                with limiter:
+                    pass
+
+            self.assertGreaterEqual(monotonic() - start, 0.07)
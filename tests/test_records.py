@@ -0,0 +1,71 @@
+#!/usr/bin python3
+
+# Imports
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Python:
+from unittest import TestCase
+from datetime import date
+
+# 3rd party:
+
+# Internal:
+from uk_covid19.records import RecordSet
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+test_structure = {
+    "date": "date",
+    "name": "areaName",
+    "newCases": "newCasesBySpecimenDate"
+}
+
+test_data = [
+    {"date": "2020-10-12", "name": "England", "newCases": 12872},
+    {"date": "2020-10-12", "name": "Wales", "newCases": None},
+    {"date": "2020-10-11", "name": "England", "newCases": 15166}
+]
+
+
+class TestRecordSet(TestCase):
+    def setUp(self) -> None:
+        self.records = RecordSet(test_structure)
+
+        # Separate copies of the strings, as decoded from separate pages.
+        for item in test_data:
+            self.records.extend([{
+                key: value[:1] + value[1:] if isinstance(value, str) else value
+                for key, value in item.items()
+            }])
+
+    def test_sequence(self):
+        self.assertEqual(len(self.records), 3)
+        self.assertEqual(self.records.columns, list(test_structure))
+
+        first = self.records[0]
+        self.assertEqual(first.date, date(2020, 10, 12))
+        self.assertEqual(first.name, "England")
+        self.assertEqual(first.newCases, 12872)
+
+        self.assertEqual(self.records[-1].newCases, 15166)
+        self.assertEqual(self.records[1:], list(self.records)[1:])
+        self.assertIsNone(self.records[1].newCases)
+
+        with self.assertRaises(IndexError):
+            _ = self.records[3]
+
+    def test_columns(self):
+        self.assertEqual(self.records["newCases"], [12872, None, 15166])
+
+        names = self.records["name"]
+        dates = self.records["date"]
+
+        # Categories and dates are shared between records.
+        self.assertIs(names[0], names[2])
+        self.assertIs(dates[0], dates[1])
+
+        with self.assertRaises(KeyError):
+            _ = self.records["areaCode"]
+
+    def test_to_dicts(self):
+        self.assertEqual(self.records.to_dicts(), test_data)
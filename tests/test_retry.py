@@ -0,0 +1,81 @@
+#!/usr/bin python3
+
+# Imports
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Python:
+from unittest import TestCase
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+
+# 3rd party:
+from requests import Response
+from requests.exceptions import ConnectionError
+
+# Internal:
+from uk_covid19 import Cov19API
+from uk_covid19.retry import RetryPolicy, parse_retry_after
+from uk_covid19.exceptions import FailedRequestError
+from .mock_api import MockAPIServer
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+def make_response(status_code: int, retry_after=None) -> Response:
+    response = Response()
+    response.status_code = status_code
+    response.reason = "Error"
+    response.url = "https://api.coronavirus.data.gov.uk/v1/data"
+    response._content = b""
+
+    if retry_after is not None:
+        response.headers["Retry-After"] = retry_after
+
+    return response
+
+
+class TestRetryPolicy(TestCase):
+    def test_parse_retry_after(self):
+        self.assertEqual(parse_retry_after("120"), 120)
+        self.assertIsNone(parse_retry_after(None))
+        self.assertIsNone(parse_retry_after("soon"))
+
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+        self.assertAlmostEqual(parse_retry_after(format_datetime(retry_at, usegmt=True)), 30, delta=2)
+
+    def test_is_retryable(self):
+        policy = RetryPolicy(max_attempts=3)
+
+        unavailable = FailedRequestError(make_response(503), params=dict())
+        bad_request = FailedRequestError(make_response(400), params=dict())
+
+        self.assertTrue(policy.should_retry(1, unavailable))
+        self.assertTrue(policy.should_retry(2, ConnectionError()))
+        self.assertFalse(policy.should_retry(3, unavailable))
+        self.assertFalse(policy.should_retry(1, bad_request))
+        self.assertFalse(RetryPolicy(retry_connection_errors=False).should_retry(1, ConnectionError()))
+
+    def test_get_delay(self):
+        policy = RetryPolicy(backoff_factor=1, max_backoff=5, jitter=False)
+
+        self.assertEqual(policy.get_delay(1), 1)
+        self.assertEqual(policy.get_delay(3), 4)
+        self.assertEqual(policy.get_delay(10), 5)
+        self.assertEqual(policy.get_delay(1, make_response(429, retry_after="3")), 3)
+
+        jittered = RetryPolicy(backoff_factor=1).get_delay(3)
+        self.assertTrue(0 <= jittered <= 4)
+
+    def test_truncated_response(self):
+        policy = RetryPolicy(max_attempts=10, backoff_factor=0)
+
+        with MockAPIServer(total_records=3000, truncate_rate=0.5, seed=1) as server:
+            api = Cov19API(
+                filters=["areaType=ltla"],
+                structure={"date": "date", "newCases": "newCasesBySpecimenDate"},
+                retry=policy
+            )
+            api.endpoint = server.data_endpoint
+            data = api.get_json()
+
+        self.assertEqual(data["length"], 3000)
+        self.assertGreater(api.retries, 0)
@@ -0,0 +1,49 @@
+#!/usr/bin python3
+
+# Imports
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Python:
+from unittest import TestCase
+
+# 3rd party:
+
+# Internal:
+from uk_covid19.schema import ColumnType, get_column_type, get_column_types
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+class TestSchema(TestCase):
+    def test_column_type(self):
+        expected = {
+            "date": ColumnType.DATE,
+            "areaName": ColumnType.CATEGORY,
+            "areaCode": ColumnType.CATEGORY,
+            "newCasesByPublishDateDirection": ColumnType.CATEGORY,
+            "newCasesBySpecimenDateRollingRate": ColumnType.FLOAT,
+            "newCasesBySpecimenDateRollingSum": ColumnType.INTEGER,
+            "cumCasesByPublishDate": ColumnType.INTEGER,
+            "hospitalCases": ColumnType.INTEGER,
+            "alertLevelName": ColumnType.STRING,
+            "newCasesBySpecimenDateAgeDemographics": ColumnType.STRING,
+        }
+
+        for metric, column_type in expected.items():
+            with self.subTest(metric=metric):
+                self.assertEqual(get_column_type(metric), column_type)
+
+    def test_column_types(self):
+        structure = {
+            "day": "date",
+            "name": "areaName",
+            "cases": "newCasesByPublishDate"
+        }
+
+        self.assertEqual(
+            get_column_types(structure),
+            {
+                "day": ColumnType.DATE,
+                "name": ColumnType.CATEGORY,
+                "cases": ColumnType.INTEGER
+            }
+        )
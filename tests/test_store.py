@@ -0,0 +1,200 @@
+#!/usr/bin python3
+
+# Imports
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Python:
+from unittest import TestCase
+from tempfile import TemporaryDirectory
+from os import path
+
+# 3rd party:
+
+# Internal:
+from uk_covid19 import Cov19API
+from uk_covid19.instrumentation import Observer
+from uk_covid19.store import BaseStore, JSONStore, SQLiteStore, get_store_keys
+from .mock_api import MockAPIServer, FIRST_DATE, AREAS_PER_DATE
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+test_structure = {
+    "day": "date",
+    "name": "areaName",
+    "code": "areaCode",
+    "newCases": "newCasesByPublishDate"
+}
+
+
+def make_record(day: str, name: str, new_cases: int) -> dict:
+    return {"day": day, "name": name, "code": f"E{name}", "newCases": new_cases}
+
+
+class QueryCounter(Observer):
+    def __init__(self):
+        self.queries = 0
+
+    def query_started(self, api, stats):
+        self.queries += 1
+
+
+class TestJSONStore(TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = TemporaryDirectory()
+        self.path = path.join(self.temp_dir.name, "store.json")
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def test_store_keys(self):
+        self.assertEqual(get_store_keys(test_structure), ("day", "code", "name"))
+
+        with self.assertRaises(ValueError):
+            get_store_keys({"name": "areaName"})
+
+        # Records of different areas must be told apart.
+        structure = {"day": "date", "newCases": "newCasesByPublishDate"}
+
+        with self.assertRaises(ValueError):
+            get_store_keys(structure, ["areaType=ltla"])
+
+        self.assertEqual(get_store_keys(structure, ["areaName=Adur"]), ("day",))
+        self.assertEqual(get_store_keys(structure, ["areaType=overview"]), ("day",))
+
+    def test_sync_without_area(self):
+        api = Cov19API(
+            filters=["areaType=ltla"],
+            structure={"date": "date", "newCases": "newCasesByPublishDate"}
+        )
+
+        with self.assertRaises(ValueError):
+            api.sync(JSONStore(self.path))
+
+        self.assertFalse(path.exists(self.path))
+
+    def test_incomplete_store(self):
+        class IncompleteStore(BaseStore):
+            def get_last_date(self):
+                return None
+
+        with self.assertRaises(TypeError):
+            IncompleteStore()
+
+    def test_sync(self):
+        counter = QueryCounter()
+
+        with MockAPIServer(total_records=3000) as server:
+            api = Cov19API(
+                filters=["areaType=ltla"],
+                structure={"date": "date", "code": "areaCode", "newCases": "newCasesByPublishDate"},
+                observers=[counter]
+            )
+            api.endpoint = server.data_endpoint
+
+            self.assertEqual(api.sync(JSONStore(self.path)), 3000)
+
+            # Only the dates from the look-back onwards are requested,
+            # one query per date.
+            total = api.sync(JSONStore(self.path), lookback=2, end_date=FIRST_DATE)
+
+        self.assertEqual(total, 3 * AREAS_PER_DATE)
+        self.assertEqual(counter.queries, 4)
+        self.assertEqual(len(JSONStore(self.path)), 3000)
+
+    def test_upsert(self):
+        keys = get_store_keys(test_structure)
+
+        store = JSONStore(self.path)
+        store.prepare(test_structure, keys)
+        self.assertIsNone(store.get_last_date())
+
+        store.upsert([
+            make_record("2020-10-11", "Adur", 1),
+            make_record("2020-10-11", "Allerdale", 2)
+        ])
+        store.save(last_update="2020-10-11T15:12:34.000000Z")
+
+        store = JSONStore(self.path)
+        store.prepare(test_structure, keys)
+        self.assertEqual(store.get_last_date(), "2020-10-11")
+
+        # Revised figures replace the existing records.
+        store.upsert([
+            make_record("2020-10-11", "Adur", 3),
+            make_record("2020-10-12", "Adur", 4)
+        ])
+        store.save()
+
+        store = JSONStore(self.path)
+        store.prepare(test_structure, keys)
+
+        self.assertEqual(len(store), 3)
+        self.assertEqual(store.get_last_date(), "2020-10-12")
+
+        with open(self.path) as pointer:
+            content = pointer.read()
+
+        self.assertIn('"lastUpdate":"2020-10-11T15:12:34.000000Z"', content)
+        self.assertIn('"newCases":3', content)
+        self.assertNotIn('"newCases":1', content)
+
+
+class TestSQLiteStore(TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = TemporaryDirectory()
+        self.path = path.join(self.temp_dir.name, "store.db")
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def test_upsert_query(self):
+        with SQLiteStore(self.path) as store:
+            self.assertEqual(len(store), 0)
+
+            store.prepare(test_structure, get_store_keys(test_structure))
+            store.upsert([
+                make_record("2020-10-11", "Adur", 1),
+                make_record("2020-10-11", "Allerdale", 2),
+                make_record("2020-10-12", "Adur", 3)
+            ])
+            store.save(last_update="2020-10-12T15:12:34.000000Z")
+
+        # The structure is restored from the database.
+        with SQLiteStore(self.path) as store:
+            self.assertEqual(store.get_last_date(), "2020-10-12")
+            self.assertEqual(store.last_update, "2020-10-12T15:12:34.000000Z")
+
+            store.upsert([make_record("2020-10-11", "Adur", 5)])
+            self.assertEqual(len(store), 3)
+
+            self.assertEqual(
+                store.query(["areaName=Adur"], columns=["day", "newCases"]),
+                [
+                    {"day": "2020-10-12", "newCases": 3},
+                    {"day": "2020-10-11", "newCases": 5}
+                ]
+            )
+
+            self.assertEqual(len(store.query(["date=2020-10-11"])), 2)
+
+            with self.assertRaises(ValueError):
+                store.query(["areaType=ltla"])
+
+    def test_change_keys(self):
+        with SQLiteStore(self.path) as store:
+            store.prepare(test_structure, ("day",))
+            store.upsert([make_record("2020-10-11", "Adur", 1)])
+
+        # The unique index follows the keys of the existing database.
+        with SQLiteStore(self.path) as store:
+            store.prepare(test_structure, get_store_keys(test_structure))
+            store.upsert([
+                make_record("2020-10-11", "Adur", 2),
+                make_record("2020-10-11", "Allerdale", 3)
+            ])
+
+            self.assertEqual(len(store), 2)
+            self.assertEqual(
+                store.query(["areaName=Adur"], columns=["newCases"]),
+                [{"newCases": 2}]
+            )
@@ -0,0 +1,52 @@
+#!/usr/bin python3
+
+# Imports
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Python:
+from unittest import TestCase
+
+# 3rd party:
+
+# Internal:
+from uk_covid19.utils import prepare_csv_page, iter_xml_data
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+class TestPrepareCSVPage(TestCase):
+    def test_pages(self):
+        header, chunk = prepare_csv_page(b"date,newCases\r\n2020-10-12,4\r\n2020-10-11,3\r\n", None)
+
+        self.assertEqual(header, b"date,newCases")
+        self.assertEqual(chunk, b"date,newCases\n2020-10-12,4\n2020-10-11,3\n")
+
+        _, chunk = prepare_csv_page(b"date,newCases\n2020-10-10,2", header)
+        self.assertEqual(chunk, b"2020-10-10,2\n")
+
+        _, chunk = prepare_csv_page(b"date,newCases\n", header)
+        self.assertEqual(chunk, b"")
+
+    def test_header_mismatch(self):
+        with self.assertRaises(ValueError):
+            prepare_csv_page(b"date,newDeaths\n2020-10-10,2\n", b"date,newCases")
+
+
+class TestIterXMLData(TestCase):
+    def test_chunks(self):
+        content = (
+            b'<document xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">'
+            b'<data><date>2020-10-12</date><data>4</data></data>'
+            b'<data><date>2020-10-11</date><data xsi:nil="true"/></data>'
+            b'</document>'
+        )
+        chunks = [content[index:index + 10] for index in range(0, len(content), 10)]
+
+        dates = [elm.findtext("date") for elm in iter_xml_data(chunks)]
+        self.assertEqual(dates, ["2020-10-12", "2020-10-11"])
+
+    def test_clear(self):
+        content = b"<document><data><date>2020-10-12</date></data></document>"
+        elements = list(iter_xml_data((content,), clear=True))
+
+        self.assertEqual(len(elements), 1)
+        self.assertEqual(len(elements[0]), 0)
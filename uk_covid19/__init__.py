@@ -23,6 +23,7 @@ The endpoint for the data provided using this SDK is:
 
 # Internal:
 from uk_covid19.api_interface import Cov19API
+from uk_covid19.async_interface import AsyncCov19API
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # Header
@@ -35,5 +36,6 @@ __url__ = "https://coronavirus.data.gov.uk/"
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
 __all__ = [
-    "Cov19API"
+    "Cov19API",
+    "AsyncCov19API"
 ]
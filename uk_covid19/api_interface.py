@@ -3,35 +3,164 @@
 # Imports
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # Python:
-from typing import Iterable, Dict, Union, Iterator
+from typing import Iterable, Dict, Union, Iterator, List, NoReturn, Tuple
 from json import dumps
 from http import HTTPStatus
-from datetime import datetime
+from datetime import datetime, date, timedelta, timezone
+from email.utils import parsedate_to_datetime
 from xml.etree.ElementTree import Element as XMLElement
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from threading import Lock
+from time import sleep, time, perf_counter, monotonic
+from contextlib import nullcontext
+from io import BytesIO
 
 # 3rd party:
-from requests import request, Response
-import certifi
+from requests import Response, Session, PreparedRequest
 
 # Internal:
-from uk_covid19.utils import save_data
-from uk_covid19.data_format import DataFormat
-from uk_covid19.exceptions import FailedRequestError
+from uk_covid19.utils import (
+    stream_data, stream_tables, prepare_csv_page, iter_xml_data
+)
+from uk_covid19.connection import get_default_session
+from uk_covid19.cache import ResponseCache
+from uk_covid19.retry import RetryPolicy
+from uk_covid19.rate_limit import RateLimiter
+from uk_covid19.data_format import DataFormat, ArrowFormat
+from uk_covid19.schema import ColumnType, get_column_types
+from uk_covid19.columnar import get_arrow_schema, read_csv_table
+from uk_covid19.store import BaseStore, get_store_keys
+from uk_covid19.json_backend import JSONBackend, get_json_backend, make_record_type
+from uk_covid19.records import RecordSet
+from uk_covid19.instrumentation import Observer, PageEvent, QueryStats
+from uk_covid19.checkpoint import Checkpoint
+from uk_covid19.exceptions import FailedRequestError, ReleaseChangedError
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
 __all__ = [
-    'Cov19API'
+    'BaseCov19API',
+    'Cov19API',
+    'get_memoised_last_modified',
+    'memoise_last_modified',
+    'parse_timestamp'
 ]
 
 
 StructureType = Dict[str, Union[dict, str]]
 FiltersType = Iterable[str]
 
+XSI_NAMESPACE = "http://www.w3.org/2001/XMLSchema-instance"
 
-class Cov19API:
+# Size of the chunks in which the content of pages is downloaded
+# and decompressed.
+CONTENT_CHUNK_SIZE = 2 ** 16
+
+# Number of seconds for which the ``Last-Modified`` header of a query
+# is reused by ``.freshness()`` -- i.e. the ``max-age`` of the API.
+DEFAULT_FRESHNESS_TTL = 60
+
+# ``Last-Modified`` headers received in response to ``HEAD`` requests,
+# and the time at which they were received, keyed by URL. Shared by
+# all instances.
+_last_modified_memo: Dict[str, Tuple[float, str]] = dict()
+_last_modified_memo_lock = Lock()
+
+# Ways of handling an extract whose pages belong to different releases.
+CONSISTENCY_POLICIES = ("raise", "restart", "refetch")
+
+# Number of times that an extract is restarted, or that its outdated
+# pages are requested again, before ``ReleaseChangedError`` is raised.
+MAX_CONSISTENCY_ATTEMPTS = 3
+
+
+def get_memoised_last_modified(url: str, max_age: float) -> Union[str, None]:
     """
-    Interface to access the API service for COVID-19 data in the United Kingdom.
+    Produces the ``Last-Modified`` header memoised for the ``HEAD``
+    request to ``url``, unless it was received ``max_age`` seconds
+    ago or earlier.
+
+    .. versionadded:: 1.3.0
+
+    Parameters
+    ----------
+    url: str
+        URL of the ``HEAD`` request.
+
+    max_age: float
+        Number of seconds for which a header is reused.
+
+    Returns
+    -------
+    Union[str, None]
+        Header, or ``None`` if none has been memoised since.
+    """
+    with _last_modified_memo_lock:
+        memo = _last_modified_memo.get(url)
+
+    if memo is None or monotonic() - memo[0] >= max_age:
+        return None
+
+    return memo[1]
+
+
+def memoise_last_modified(url: str, last_modified: str):
+    """
+    Memoises the ``Last-Modified`` header received in response to the
+    ``HEAD`` request to ``url``, for all instances.
+
+    .. versionadded:: 1.3.0
+
+    Parameters
+    ----------
+    url: str
+        URL of the ``HEAD`` request.
+
+    last_modified: str
+        Value of the header.
+    """
+    with _last_modified_memo_lock:
+        _last_modified_memo[url] = (monotonic(), last_modified)
+
+
+def parse_timestamp(timestamp: Union[str, datetime]) -> datetime:
+    """
+    Parses a timestamp -- as an ISO-8601 string (e.g. ``.last_update``),
+    an HTTP date (e.g. a ``Last-Modified`` header), or a ``datetime``,
+    which is assumed to be in UTC if it has no timezone.
+
+    .. versionadded:: 1.3.0
+
+    Parameters
+    ----------
+    timestamp: Union[str, datetime]
+
+    Returns
+    -------
+    datetime
+        Timezone-aware timestamp.
+    """
+    if isinstance(timestamp, str):
+        try:
+            timestamp = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+        except ValueError:
+            timestamp = parsedate_to_datetime(timestamp)
+
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+
+    return timestamp
+
+
+class BaseCov19API:
+    """
+    Members shared by the synchronous and asynchronous interfaces to the
+    API service -- i.e. the parameters of the query, the JSON backend,
+    and the summary of the most recent query. The data are requested
+    by the subclasses: ``Cov19API`` and ``AsyncCov19API``.
+
+    .. versionadded:: 1.3.0
 
     Parameters
     ----------
@@ -45,6 +174,13 @@ class Cov19API:
 
     latest_by: Union[str, None]
         Retrieves the latest value for a specific metric. [Default: ``None``]
+
+    json_backend: Union[JSONBackend, None]
+        Parses and serialises the data in JSON. If ``None`` (default),
+        the shared backend is used.
+
+    observers: Union[Iterable[Observer], None]
+        Receive the events of each query. [Default: ``None``]
     """
     endpoint = "https://api.coronavirus.data.gov.uk/v1/data"
     release_timestamp_endpoint = "https://api.coronavirus.data.gov.uk/v1/timestamp"
@@ -53,17 +189,62 @@ class Cov19API:
     _total_pages: Union[int, None] = None
 
     def __init__(self, filters: FiltersType, structure: StructureType,
-                 latest_by: Union[str, None] = None):
-        self.filters = filters
-
+                 latest_by: Union[str, None] = None,
+                 json_backend: Union[JSONBackend, None] = None,
+                 observers: Union[Iterable[Observer], None] = None):
         if any(isinstance(value, (list, dict)) for value in structure):
             raise TypeError(
                 "Nested structures are no longer supported. Please define a flat "
                 "structure instead."
             )
 
+        self.filters = filters
         self.structure = structure
         self.latest_by = latest_by
+        self._json_backend = json_backend
+        self._record_type = None
+        self._compressed_bytes = 0
+        self._decompressed_bytes = 0
+        self._transfer_lock = Lock()
+        self.observers: List[Observer] = list(observers or tuple())
+        self._stats: Union[QueryStats, None] = None
+
+    @property
+    def json_backend(self) -> JSONBackend:
+        """
+        :property:
+            JSON backend used to parse and serialise the data.
+
+        .. versionadded:: 1.3.0
+
+        Returns
+        -------
+        JSONBackend
+        """
+        if self._json_backend is None:
+            return get_json_backend()
+
+        return self._json_backend
+
+    @property
+    def record_type(self) -> type:
+        """
+        :property:
+            Typed record type for the structure, used when the data are
+            requested with ``typed=True``. See ``make_record_type()`` in
+            ``uk_covid19.json_backend`` for additional information.
+
+        .. versionadded:: 1.3.0
+
+        Returns
+        -------
+        type
+        """
+        if self._record_type is None:
+            self._validate_flat_structure()
+            self._record_type = make_record_type(self._get_flat_structure())
+
+        return self._record_type
 
     @property
     def total_pages(self) -> Union[int, None]:
@@ -79,249 +260,2128 @@ class Cov19API:
         return self._total_pages
 
     @property
-    def last_update(self) -> str:
+    def stats(self) -> Union[QueryStats, None]:
         """
         :property:
-            Produces the timestamp for the last update in GMT.
+            Summary of the most recent query -- e.g. the number of pages,
+            bytes received, and the time spent requesting and processing
+            the pages -- or ``None`` if no query has been made.
 
-        This property supplies the API time - i.e. the time at which the data were
-        deployed to the database. Please note that there will always be a difference
-        between this time and the timestamp that is displayed on the website, which may
-        be accessed via the ``.get_release_timestamp()`` method. The website timestamp
-        signifies the time at which the data were release to the API, and by extension
-        the website.
+        .. versionadded:: 1.3.0
 
-        .. note::
+        Returns
+        -------
+        Union[QueryStats, None]
 
-            The output is extracted from the header and is accurate to
-            the second.
-            
-        .. warning::
+        Examples
+        --------
+        >>> data = api.get_json()
+        >>> api.stats.as_dict()
+        {'format': 'json', 'pages': 3, 'requests': 4, 'retries': 0, ...}
+        """
+        return self._stats
 
-            The ISO-8601 standard requires a ``"Z"`` character to be added
-            to the end of the timestamp. This is a timezone feature and is
-            not recognised by Python's ``datetime`` library. It is, however,
-            most other libraries; e.g. ``pandas``. If you wish to parse the
-            timestamp using the the ``datetime`` library, make sure that you
-            remove the trailing ``"Z"`` character.
+    @property
+    def compressed_bytes(self) -> int:
+        """
+        :property:
+            Number of bytes of content received from the API during the
+            most recent query, as transferred -- i.e. compressed, if the
+            server compressed the content. Pages retrieved from the cache
+            without a request are excluded.
+
+        .. versionadded:: 1.3.0
+
+        Returns
+        -------
+        int
+        """
+        return self._compressed_bytes
+
+    @property
+    def decompressed_bytes(self) -> int:
+        """
+        :property:
+            Number of bytes of content received from the API during the
+            most recent query, once decompressed. Pages retrieved from the
+            cache without a request are excluded.
+
+        .. versionadded:: 1.3.0
+
+        Returns
+        -------
+        int
+        """
+        return self._decompressed_bytes
+
+    def _count_transfer(self, compressed: int, decompressed: int):
+        """
+        Adds the size of a page to the totals for the current query.
+
+        Parameters
+        ----------
+        compressed: int
+            Number of bytes transferred.
+
+        decompressed: int
+            Number of bytes once decompressed.
+        """
+        with self._transfer_lock:
+            self._compressed_bytes += compressed
+            self._decompressed_bytes += decompressed
+
+    def _get_head_url(self) -> str:
+        """
+        URL of the ``HEAD`` request for the query, used as the key of
+        the memoised ``Last-Modified`` headers.
 
         Returns
         -------
         str
-            Timestamp, formatted as ISO-8601.
+        """
+        url = PreparedRequest()
+        url.prepare_url(self.endpoint, self.api_params)
 
-        Examples
-        --------
-        >>> filters = ["areaType=region"]
-        >>> structure = {
-        ...     "name": "areaName",
-        ...     "newCases": "newCasesBySpecimenDate"
-        ... }
-        >>> data = Cov19API(
-        ...     filters=filters,
-        ...     structure=structure,
-        ...     latest_by='newCasesBySpecimenDate'
-        ... )
-        >>> timestamp = data.last_update
-        >>> print(timestamp)
-        2020-07-27T20:29:16.000000Z
+        return url.url
 
-        >>> from datetime import datetime
-        >>> parsed_timestamp = datetime.fromisoformat(timestamp.strip("Z"))
-        >>> print(parsed_timestamp)
-        2020-07-27 20:29:16
+    @staticmethod
+    def _format_last_modified(last_modified: str) -> str:
         """
-        if self._last_update is None:
-            self._last_update = self.head()['Last-Modified']
+        Converts the value of a ``Last-Modified`` header to ISO-8601.
+
+        Parameters
+        ----------
+        last_modified: str
+            Timestamp formatted as an HTTP date.
 
-        timestamp = datetime.strptime(self._last_update, "%a, %d %b %Y %H:%M:%S GMT")
+        Returns
+        -------
+        str
+        """
+        timestamp = datetime.strptime(last_modified, "%a, %d %b %Y %H:%M:%S GMT")
 
         return timestamp.isoformat() + ".000000Z"
 
-    @staticmethod
-    def get_release_timestamp() -> str:
+    @property
+    def api_params(self) -> dict:
         """
         :staticmethod:
-            Produces the website timestamp in GMT.
+            API parameters, constructed based on ``filters``, ``structure``,
+            and ``latest_by`` arguments as defined by the user.
+
+        Returns
+        -------
+        Dict[str, str]
+        """
+        api_params = {
+            "filters": str.join(";", self.filters),
+            "structure": dumps(self.structure, separators=(",", ":")),
+        }
+
+        if self.latest_by is not None:
+            api_params.update({
+                "latestBy": self.latest_by
+            })
+
+        return api_params
+
+    def _add_page_event(self, event: PageEvent):
+        """
+        Adds a page to the summary of the current query, and notifies
+        the observers.
+
+        Parameters
+        ----------
+        event: PageEvent
+        """
+        self._stats.add_page(event)
+
+        for observer in self.observers:
+            observer.page_received(self, event)
+
+    def _validate_flat_structure(self):
+        """
+        Checks to ensure that the structure is not hierarchical.
+
+        Raises
+        ------
+        ValueError
+            If the structure is nested.
+        """
+        if isinstance(self.structure, dict):
+            non_str = filter(
+                lambda val: not isinstance(val, str),
+                self.structure.values()
+            )
+
+            if list(non_str):
+                struct = dumps(self.structure, indent=4)
+                raise ValueError("CSV structure cannot be nested. Received:\n%s" % struct)
+
+    def _get_flat_structure(self) -> Dict[str, str]:
+        """
+        Provides the structure as a mapping of column names to metrics.
+
+        Returns
+        -------
+        Dict[str, str]
+        """
+        if isinstance(self.structure, dict):
+            return self.structure
+
+        return {metric: metric for metric in self.structure}
+
+    @staticmethod
+    def _get_export_format(path: str) -> Union[DataFormat, ArrowFormat]:
+        """
+        Determines the format of a file from its extension.
+
+        Parameters
+        ----------
+        path: str
+            Path to the file.
+
+        Returns
+        -------
+        Union[DataFormat, ArrowFormat]
+
+        Raises
+        ------
+        ValueError
+            If the extension of the file is not supported.
+        """
+        from os.path import splitext
+
+        _, ext = splitext(path)
+        ext = ext.lstrip(".").lower()
+
+        if ext in {item.value for item in ArrowFormat}:
+            return ArrowFormat(ext)
+
+        try:
+            return DataFormat(ext)
+        except ValueError:
+            supported = [*DataFormat, *ArrowFormat]
+            raise ValueError(
+                f"Unsupported file extension: '.{ext}'. Expected one of "
+                f"{[f'.{item.value}' for item in supported]}."
+            )
+
+    @staticmethod
+    def _get_arrow_format(path: str) -> ArrowFormat:
+        """
+        Determines the format of a Parquet or Feather file from its
+        extension.
+
+        Parameters
+        ----------
+        path: str
+            Path to the file.
+
+        Returns
+        -------
+        ArrowFormat
+
+        Raises
+        ------
+        ValueError
+            If the extension of the file is not supported.
+        """
+        from os.path import splitext
+
+        _, ext = splitext(path)
+
+        try:
+            return ArrowFormat(ext.lstrip(".").lower())
+        except ValueError:
+            raise ValueError(
+                f"Unsupported file extension: '{ext}'. Expected one of "
+                f"{[f'.{item.value}' for item in ArrowFormat]}."
+            )
+
+    @staticmethod
+    def _format_xml_page(content: bytes,
+                         collect: Union[XMLElement, None] = None) -> Tuple[str, int]:
+        """
+        Reproduces the ``data`` elements of a page in XML, for the XML
+        output of ``.export()``.
+
+        Parameters
+        ----------
+        content: bytes
+            Content of the page.
+
+        collect: Union[XMLElement, None]
+            If defined, the ``data`` elements are also appended to this
+            element. [Default: ``None``]
+
+        Returns
+        -------
+        Tuple[str, int]
+            Elements, and the number of elements.
+        """
+        from xml.etree.ElementTree import tostring
+
+        # The namespace is declared once in the root element instead
+        # of once in every element that uses it.
+        namespace_declaration = f' xmlns:xsi="{XSI_NAMESPACE}"'
+        chunks = list()
+
+        for elm in iter_xml_data((content,), clear=collect is None):
+            elm_str = tostring(elm, encoding='unicode', method='xml')
+            tag_end = elm_str.find(">")
+            start_tag = elm_str[:tag_end].replace(namespace_declaration, "", 1)
+            chunks.append(start_tag + elm_str[tag_end:])
+
+            if collect is not None:
+                collect.append(elm)
+
+        return str.join("", chunks), len(chunks)
+
+    @staticmethod
+    def _format_xml_extras(extras: dict) -> str:
+        """
+        Closes the XML output of ``.export()`` with the metadata.
+
+        Parameters
+        ----------
+        extras: dict
+            Metadata -- e.g. the timestamp of the last update.
+
+        Returns
+        -------
+        str
+        """
+        from xml.etree.ElementTree import tostring
+
+        chunks = list()
+
+        for elm_name, value in extras.items():
+            elm = XMLElement(elm_name)
+            elm.text = str(value)
+            chunks.append(tostring(elm, encoding='unicode', method='xml'))
+
+        return str.join("", chunks) + "</document>"
+
+    def _get_sync_dates(self, store: BaseStore, lookback: int,
+                        end_date: Union[date, None]) -> Union[List[date], None]:
+        """
+        Prepares a store to be brought up to date by ``.sync()``, and
+        determines the dates to request.
+
+        Parameters
+        ----------
+        store: BaseStore
+            Local store of records.
+
+        lookback: int
+            Number of days before the latest date in the store that are
+            requested again.
+
+        end_date: Union[date, None]
+            Last date to request. If ``None``, today's date (UTC) is used.
+
+        Returns
+        -------
+        Union[List[date], None]
+            Dates to request, one query per date, or ``None`` if the
+            store is empty and the full data are to be requested.
+
+        Raises
+        ------
+        ValueError
+            If ``lookback`` is negative, if the structure is nested or
+            does not include the ``date`` metric, if the structure does not
+            include an area metric while the query is not restricted to a
+            single area, or if the query already filters by date or uses
+            ``latest_by``.
+        """
+        if lookback < 0:
+            raise ValueError(f"Look-back must not be negative, got {lookback}.")
+
+        if self.latest_by is not None:
+            raise ValueError("Incremental sync cannot be used with `latest_by`.")
+
+        if any(item.split("=", 1)[0] == "date" for item in self.filters):
+            raise ValueError("Incremental sync cannot be used with a `date` filter.")
+
+        self._validate_flat_structure()
+
+        structure = self._get_flat_structure()
+        store.prepare(structure, get_store_keys(structure, self.filters))
+
+        last_date = store.get_last_date()
+
+        if last_date is None:
+            return None
+
+        start_date = date.fromisoformat(last_date) - timedelta(days=lookback)
+        end_date = end_date or datetime.now(timezone.utc).date()
+
+        return [
+            start_date + timedelta(days=day)
+            for day in range((end_date - start_date).days + 1)
+        ]
+
+    def _read_dataframe(self, buffer: BytesIO):
+        """
+        Parses the data in CSV into a ``pandas.DataFrame`` object with
+        typed columns. See ``.get_dataframe()`` for additional information.
+
+        Parameters
+        ----------
+        buffer: BytesIO
+            Data in CSV, with the column names on the first line only.
+
+        Returns
+        -------
+        DataFrame
+        """
+        from pandas import DataFrame, read_csv, to_datetime
+
+        structure = self._get_flat_structure()
+        column_types = get_column_types(structure)
+
+        if not buffer.tell():
+            return DataFrame(columns=list(structure))
+
+        buffer.seek(0)
+
+        df = read_csv(
+            buffer,
+            dtype={
+                column: "category"
+                for column, column_type in column_types.items()
+                if column_type == ColumnType.CATEGORY
+            }
+        )
+
+        for column, column_type in column_types.items():
+            if column not in df:
+                continue
+
+            if column_type == ColumnType.DATE:
+                df[column] = to_datetime(df[column], format="%Y-%m-%d")
+            elif column_type == ColumnType.INTEGER and df[column].dtype.kind in "iuf":
+                try:
+                    df[column] = df[column].astype("Int64")
+                except (TypeError, ValueError):
+                    # Non-integral values; the inferred type is kept.
+                    pass
+            elif column_type == ColumnType.FLOAT and df[column].dtype.kind in "iu":
+                df[column] = df[column].astype("float64")
+
+        return df
+
+    def __str__(self):
+        resp = "COVID-19 in the UK - API Service\nCurrent parameters: \n"
+        return resp + dumps(self.api_params, indent=4)
+
+    __repr__ = __str__
+
+
+class Cov19API(BaseCov19API):
+    """
+    Interface to access the API service for COVID-19 data in the United Kingdom.
+
+    Parameters
+    ----------
+    filters: Iterable[str]
+        API filters. See the API documentations for additional
+        information.
+
+    structure: Dict[str, Union[dict, str]]
+        Structure parameter. See the API documentations for
+        additional information.
+
+    latest_by: Union[str, None]
+        Retrieves the latest value for a specific metric. [Default: ``None``]
+
+    session: Union[Session, None]
+        .. versionadded:: 1.3.0
+
+        HTTP session used for all requests made by the instance. If
+        ``None`` (default), a pooled, keep-alive session shared by all
+        instances is used. See ``uk_covid19.connection.create_session``
+        for configuring a session of your own.
+
+    cache: Union[ResponseCache, None]
+        .. versionadded:: 1.3.0
+
+        If defined, the pages of data are stored in, and retrieved
+        from, the cache. See ``uk_covid19.cache.ResponseCache`` for
+        additional information. [Default: ``None``]
+
+    retry: Union[RetryPolicy, None]
+        .. versionadded:: 1.3.0
+
+        Policy for retrying the requests for pages that fail, e.g. due
+        to rate limiting or temporary server errors. Each page is retried
+        individually, so that the pages already received are kept. If
+        ``None`` (default), failed requests are not retried. See
+        ``uk_covid19.retry.RetryPolicy`` for additional information.
+
+    rate_limiter: Union[RateLimiter, None]
+        .. versionadded:: 1.3.0
+
+        Limits the rate and the concurrency of the requests for pages.
+        Share one limiter between instances to apply the limits to all
+        of their requests combined. See ``uk_covid19.rate_limit`` for
+        additional information. [Default: ``None``]
+
+    json_backend: Union[JSONBackend, None]
+        .. versionadded:: 1.3.0
+
+        Parses and serialises the data in JSON. If ``None`` (default),
+        the shared backend is used -- i.e. ``msgspec`` or ``orjson`` if
+        installed, and the standard library otherwise. See
+        ``uk_covid19.json_backend`` for additional information.
+
+    observers: Union[Iterable[Observer], None]
+        .. versionadded:: 1.3.0
+
+        Receive the events of each query -- i.e. the timings, sizes,
+        status, retries and cache hits of each page, and a summary of
+        the query. See ``uk_covid19.instrumentation`` for additional
+        information. [Default: ``None``]
+
+    checkpoint: Union[Checkpoint, None]
+        .. versionadded:: 1.3.0
+
+        If defined, each page is stored once received, so that an
+        extract that is interrupted resumes from the last page stored
+        when the query is made again, unless the data have been updated
+        in the meantime. See ``uk_covid19.checkpoint.Checkpoint`` for
+        additional information. [Default: ``None``]
+
+    consistency: Union[str, None]
+        .. versionadded:: 1.3.0
+
+        Handling of extracts during which a new release of the data is
+        published, such that their pages have different ``Last-Modified``
+        headers:
+
+        - ``"raise"``: raises ``ReleaseChangedError`` as soon as a page
+          of a different release is received.
+        - ``"restart"``: requests all of the pages again.
+        - ``"refetch"``: requests the pages of the older release again,
+          as well as any pages added by the newer release.
+
+        With ``"restart"`` and ``"refetch"``, the pages are held until all
+        of them have been received, and ``ReleaseChangedError`` is raised
+        if they remain inconsistent after three attempts. If ``None``
+        (default), pages are not checked.
+    """
+
+    def __init__(self, filters: FiltersType, structure: StructureType,
+                 latest_by: Union[str, None] = None,
+                 session: Union[Session, None] = None,
+                 cache: Union[ResponseCache, None] = None,
+                 retry: Union[RetryPolicy, None] = None,
+                 rate_limiter: Union[RateLimiter, None] = None,
+                 json_backend: Union[JSONBackend, None] = None,
+                 observers: Union[Iterable[Observer], None] = None,
+                 checkpoint: Union[Checkpoint, None] = None,
+                 consistency: Union[str, None] = None):
+        if consistency is not None and consistency not in CONSISTENCY_POLICIES:
+            raise ValueError(
+                f"Unknown consistency policy: '{consistency}'. "
+                f"Expected one of {list(CONSISTENCY_POLICIES)}."
+            )
+
+        super().__init__(
+            filters,
+            structure,
+            latest_by=latest_by,
+            json_backend=json_backend,
+            observers=observers
+        )
+        self._session = session
+        self.cache = cache
+        self.retry = retry
+        self.rate_limiter = rate_limiter
+        self._retries = 0
+        self._retries_lock = Lock()
+        self.checkpoint = checkpoint
+        self.consistency = consistency
+
+    @property
+    def session(self) -> Session:
+        """
+        :property:
+            HTTP session used for the requests.
+
+        .. versionadded:: 1.3.0
+
+        Returns
+        -------
+        Session
+        """
+        if self._session is None:
+            return get_default_session()
+
+        return self._session
+
+    @property
+    def retries(self) -> int:
+        """
+        :property:
+            Number of times that requests for pages were retried during
+            the most recent query.
+
+        .. versionadded:: 1.3.0
+
+        Returns
+        -------
+        int
+        """
+        return self._retries
+
+    @property
+    def last_update(self) -> str:
+        """
+        :property:
+            Produces the timestamp for the last update in GMT.
+
+        This property supplies the API time - i.e. the time at which the data were
+        deployed to the database. Please note that there will always be a difference
+        between this time and the timestamp that is displayed on the website, which may
+        be accessed via the ``.get_release_timestamp()`` method. The website timestamp
+        signifies the time at which the data were release to the API, and by extension
+        the website.
+
+        .. note::
+
+            The output is extracted from the header and is accurate to
+            the second.
+            
+        .. warning::
+
+            The ISO-8601 standard requires a ``"Z"`` character to be added
+            to the end of the timestamp. This is a timezone feature and is
+            not recognised by Python's ``datetime`` library. It is, however,
+            most other libraries; e.g. ``pandas``. If you wish to parse the
+            timestamp using the the ``datetime`` library, make sure that you
+            remove the trailing ``"Z"`` character.
+
+        Returns
+        -------
+        str
+            Timestamp, formatted as ISO-8601.
+
+        Examples
+        --------
+        >>> filters = ["areaType=region"]
+        >>> structure = {
+        ...     "name": "areaName",
+        ...     "newCases": "newCasesBySpecimenDate"
+        ... }
+        >>> data = Cov19API(
+        ...     filters=filters,
+        ...     structure=structure,
+        ...     latest_by='newCasesBySpecimenDate'
+        ... )
+        >>> timestamp = data.last_update
+        >>> print(timestamp)
+        2020-07-27T20:29:16.000000Z
+
+        >>> from datetime import datetime
+        >>> parsed_timestamp = datetime.fromisoformat(timestamp.strip("Z"))
+        >>> print(parsed_timestamp)
+        2020-07-27 20:29:16
+        """
+        if self._last_update is None:
+            self._last_update = self._get_last_modified()
+
+        return self._format_last_modified(self._last_update)
+
+    def _get_last_modified(self, max_age: float = DEFAULT_FRESHNESS_TTL) -> str:
+        """
+        Produces the ``Last-Modified`` header of the query, making a
+        ``HEAD`` request unless the header was received less than
+        ``max_age`` seconds ago.
+
+        Parameters
+        ----------
+        max_age: float
+            Number of seconds for which a header is reused.
+
+        Returns
+        -------
+        str
+        """
+        url = self._get_head_url()
+        last_modified = get_memoised_last_modified(url, max_age)
+
+        if last_modified is None:
+            last_modified = self.head()["Last-Modified"]
+            memoise_last_modified(url, last_modified)
+
+        return last_modified
+
+    def freshness(self, max_age: float = DEFAULT_FRESHNESS_TTL) -> str:
+        """
+        Produces the timestamp for the last update of the data for the
+        query in GMT, without requesting the data.
+
+        A single ``HEAD`` request is made, whose response is reused by
+        all instances with the same query for ``max_age`` seconds. Unlike
+        ``.last_update``, the timestamp is never that of the data already
+        requested by the instance.
+
+        .. versionadded:: 1.3.0
+
+        Parameters
+        ----------
+        max_age: float
+            Number of seconds for which the timestamp is reused. Use ``0``
+            to make a request regardless. [Default: ``60``]
+
+        Returns
+        -------
+        str
+            Timestamp, formatted as ISO-8601.
+
+        Examples
+        --------
+        >>> data = Cov19API(filters=filters, structure=structure)
+        >>> data.freshness()
+        '2020-07-27T20:29:16.000000Z'
+        """
+        return self._format_last_modified(self._get_last_modified(max_age))
+
+    def has_changed_since(self, timestamp: Union[str, datetime],
+                          max_age: float = DEFAULT_FRESHNESS_TTL) -> bool:
+        """
+        Determines whether the data for the query have been updated after
+        ``timestamp``, without requesting the data. See ``.freshness()``
+        for additional information.
+
+        .. versionadded:: 1.3.0
+
+        Parameters
+        ----------
+        timestamp: Union[str, datetime]
+            Time of the previous update -- e.g. the value of ``.last_update``
+            when the data were last requested, a ``Last-Modified`` header,
+            or a ``datetime``, which is assumed to be in UTC if it has no
+            timezone.
+
+        max_age: float
+            Number of seconds for which the timestamp of the last update
+            is reused. [Default: ``60``]
+
+        Returns
+        -------
+        bool
+
+        Examples
+        --------
+        >>> data = api.get_json()
+        >>> previous_update = api.last_update
+        >>> ...
+        >>> if api.has_changed_since(previous_update):
+        ...     data = api.get_json()
+        """
+        last_modified = parsedate_to_datetime(self._get_last_modified(max_age))
+
+        return last_modified > parse_timestamp(timestamp)
+
+    @staticmethod
+    def get_release_timestamp(session: Union[Session, None] = None) -> str:
+        """
+        :staticmethod:
+            Produces the website timestamp in GMT.
+
+        .. versionadded:: 1.2.0
+
+        .. versionchanged:: 1.3.0
+            Added the ``session`` argument.
+
+        This property supplies the website timestamp - i.e. the time at which the data
+        were released to the API and by extension the website. Please note that there
+        will be a difference between this timestamp and the timestamp produced using
+        the ``last_update`` property. The latter signifies the time at which the data
+        were deployed to the database, not the time at which they were released.
+
+        .. note::
+
+            The output is extracted from the header and is accurate to
+            the miliseconds.
+
+        .. warning::
+
+            The ISO-8601 standard requires a ``"Z"`` character to be added
+            to the end of the timestamp. This is a timezone feature and is
+            not recognised by Python's ``datetime`` library. It is, however,
+            most other libraries; e.g. ``pandas``. If you wish to parse the
+            timestamp using the the ``datetime`` library, make sure that you
+            remove the trailing ``"Z"`` character.
+
+        Parameters
+        ----------
+        session: Union[Session, None]
+            HTTP session used for the request. Uses the shared session
+            if ``None``. [Default: ``None``]
+
+        Returns
+        -------
+        str
+            Timestamp, formatted as ISO-8601.
+
+        Examples
+        --------
+        >>> release_timestamp = Cov19API.get_release_timestamp()
+        >>> print(release_timestamp)
+        2020-08-08T15:00:09.977840Z
+
+        >>> from datetime import datetime
+        >>> release_timestamp = Cov19API.get_release_timestamp()
+        >>> parsed_timestamp = datetime.fromisoformat(release_timestamp.strip("Z"))
+        >>> print(parsed_timestamp)
+        2020-08-08 15:00:09
+        """
+        session = session or get_default_session()
+
+        with session.request("GET", Cov19API.release_timestamp_endpoint) as response:
+            json_data = response.json()
+
+        return json_data['websiteTimestamp']
+
+    @staticmethod
+    def batch(queries, max_workers: int = 8, method: str = "get_json",
+              session: Union[Session, None] = None,
+              rate_limiter: Union[RateLimiter, None] = None, **kwargs):
+        """
+        :staticmethod:
+            Runs many queries concurrently over a shared connection pool.
+
+        .. versionadded:: 1.3.0
+
+        Failed queries do not interrupt the batch; their exceptions are
+        collected instead. See ``uk_covid19.batch`` for additional
+        information, and for ``iter_batch``, which produces the outcome
+        of each query as soon as it is complete.
+
+        Parameters
+        ----------
+        queries: Union[Mapping[Hashable, QueryType], Iterable[QueryType]]
+            Queries, as ``Cov19API`` instances or as dictionaries of
+            arguments for ``Cov19API`` -- i.e. ``filters``, ``structure``,
+            and optionally ``latest_by``. If the queries are not a mapping,
+            they are keyed by their position.
+
+        max_workers: int
+            Maximum number of queries that run at the same time.
+            [Default: ``8``]
+
+        method: str
+            Name of the method used to run each query.
+            [Default: ``"get_json"``]
+
+        session: Union[Session, None]
+            HTTP session used by the queries that are defined as
+            dictionaries. [Default: ``None``]
+
+        rate_limiter: Union[RateLimiter, None]
+            Rate limiter shared by the queries that are defined as
+            dictionaries. [Default: ``None``]
+
+        **kwargs
+            Arguments passed to ``method``.
+
+        Returns
+        -------
+        BatchResult
+            Named tuple of ``results`` and ``errors``, both keyed by query.
+
+        Examples
+        --------
+        >>> queries = {
+        ...     name: {
+        ...         "filters": ["areaType=ltla", f"areaName={name}"],
+        ...         "structure": {"date": "date", "newCases": "newCasesByPublishDate"}
+        ...     }
+        ...     for name in ("Adur", "Allerdale", "Amber Valley")
+        ... }
+        >>> batch = Cov19API.batch(queries, max_workers=4)
+        >>> print(batch.results["Adur"]["length"])
+        229
+        >>> print(batch.errors)
+        {}
+        """
+        from uk_covid19.batch import run_batch
+
+        return run_batch(queries, max_workers=max_workers, method=method,
+                         session=session, rate_limiter=rate_limiter, **kwargs)
+
+    def head(self):
+        """
+        Request header for the given input arguments (``filters``,
+        ``structure``, and ``lastest_by``).
+
+        Returns
+        -------
+        Dict[str, str]
+
+        Examples
+        --------
+        >>> filters = ["areaType=region"]
+        >>> structure = {
+        ...     "name": "areaName",
+        ...     "newCases": "newCasesBySpecimenDate"
+        ... }
+        >>> data = Cov19API(
+        ...     filters=filters,
+        ...     structure=structure,
+        ...     latest_by='newCasesBySpecimenDate'
+        ... )
+        >>> head = data.head()
+        >>> print(head)
+        {'Cache-Control': 'public, max-age=60', 'Content-Length': '0',
+         ...
+        }
+        """
+        api_params = self.api_params
+
+        with self.session.request("HEAD", self.endpoint, params=api_params) as response:
+            response.raise_for_status()
+            return response.headers
+
+    @staticmethod
+    def options():
+        """
+        :staticmethod:
+            Provides the options by calling the ``OPTIONS`` method of the API.
+
+        Returns
+        -------
+        dict
+            API options.
+
+        Examples
+        --------
+        >>> from pprint import pprint
+        >>> options = Cov19API.options()
+        >>> pprint(options)
+        {'info': {'description': "Public Health England's Coronavirus Dashboard API",
+         'title': 'Dashboard API',
+         'version': '1.0'},
+         'openapi': '3.0.1',
+          ...
+        }
+        """
+        session = get_default_session()
+
+        with session.request("OPTIONS", Cov19API.endpoint) as response:
+            response.raise_for_status()
+            return response.json()
+
+    def _request_page(self, api_params: dict, revalidate: bool = False) -> Response:
+        """
+        Requests one page of data.
+
+        Parameters
+        ----------
+        api_params: dict
+            Query parameters, including the format and the page number.
+
+        revalidate: bool
+            Whether to revalidate the page stored in the cache, if any,
+            even if it is fresh. [Default: ``False``]
+
+        Returns
+        -------
+        Response
+            Response whose content has already been downloaded.
+
+        Raises
+        ------
+        FailedRequestError
+            When the request fails.
+        """
+        attempt = 1
+        started_at = time()
+        start = perf_counter()
+
+        while True:
+            try:
+                if self.cache is not None:
+                    response = self._request_cached_page(api_params, revalidate)
+                else:
+                    response = self._request_uncached_page(api_params)
+
+                break
+            except Exception as err:
+                if self.retry is None or not self.retry.should_retry(attempt, err):
+                    status_code = getattr(getattr(err, "response", None), "status_code", 0)
+                    self._report_page(api_params, status_code, attempt, started_at, start)
+                    raise
+
+                delay = self.retry.get_delay(attempt, getattr(err, "response", None))
+
+            with self._retries_lock:
+                self._retries += 1
+
+            sleep(delay)
+            attempt += 1
+
+        self._report_page(api_params, response.status_code, attempt, started_at,
+                          start, response)
+
+        return response
+
+    def _report_page(self, api_params: dict, status_code: int, attempts: int,
+                     started_at: float, start: float,
+                     response: Union[Response, None] = None):
+        """
+        Produces the event for a page that has been requested.
+
+        Parameters
+        ----------
+        api_params: dict
+            Query parameters of the page.
+
+        status_code: int
+            Status of the final response, or ``0`` if none was received.
+
+        attempts: int
+            Number of times that the page was requested.
+
+        started_at: float
+            Time of the first request, in seconds since the epoch.
+
+        start: float
+            Value of ``perf_counter()`` at the time of the first request.
+
+        response: Union[Response, None]
+            Final response, if successful.
+        """
+        if self._stats is None:
+            return
+
+        # Responses produced by the cache are not backed by a connection.
+        from_cache = response is not None and response.raw is None
+        received = response is not None and not from_cache
+
+        event = PageEvent(
+            page=api_params.get("page"),
+            format=api_params["format"],
+            status_code=status_code,
+            attempts=attempts,
+            from_cache=from_cache,
+            started_at=started_at,
+            latency=response.elapsed.total_seconds() if received else 0,
+            duration=perf_counter() - start,
+            compressed_bytes=response.raw.tell() if received else 0,
+            decompressed_bytes=len(response.content) if received else 0
+        )
+
+        self._add_page_event(event)
+
+    def _limit_rate(self):
+        """
+        Context in which a request is made, subject to the rate limiter
+        if one is defined.
+        """
+        if self.rate_limiter is None:
+            return nullcontext()
+
+        return self.rate_limiter
+
+    def _read_content(self, response: Response):
+        """
+        Downloads the content of a response requested with ``stream=True``.
+
+        The content is decompressed in chunks as it is received, so the
+        compressed content is never held in memory in its entirety. The
+        decompressed chunks are joined once.
+
+        Parameters
+        ----------
+        response: Response
+
+        Raises
+        ------
+        requests.exceptions.RequestException
+            If the connection drops, times out, or the content cannot be
+            decompressed -- e.g. ``ChunkedEncodingError`` if the content
+            is truncated.
+        """
+        chunks = list()
+
+        # Unlike ``response.raw.stream()``, errors raised by ``urllib3``
+        # are re-raised as ``requests`` exceptions, which may be retried.
+        for chunk in response.iter_content(CONTENT_CHUNK_SIZE):
+            chunks.append(chunk)
+
+        content = b"".join(chunks)
+
+        response._content = content
+        response._content_consumed = True
+
+        # Number of bytes read from the connection, before decompression.
+        self._count_transfer(response.raw.tell(), len(content))
+
+    def _request_uncached_page(self, api_params: dict) -> Response:
+        """
+        Requests one page of data from the API.
+
+        Parameters
+        ----------
+        api_params: dict
+            Query parameters, including the format and the page number.
+
+        Returns
+        -------
+        Response
+
+        Raises
+        ------
+        FailedRequestError
+            When the request fails.
+        """
+        with self._limit_rate(), \
+                self.session.request("GET", self.endpoint, params=api_params,
+                                     stream=True) as response:
+            if response.status_code >= HTTPStatus.BAD_REQUEST:
+                raise FailedRequestError(response=response, params=api_params)
+
+            # Downloads the content before the connection is
+            # released back to the pool.
+            self._read_content(response)
+
+        return response
+
+    def _request_cached_page(self, api_params: dict, revalidate: bool = False) -> Response:
+        """
+        Retrieves one page of data from the cache, making a conditional
+        request to revalidate the stored page if it is no longer fresh.
+
+        Parameters
+        ----------
+        api_params: dict
+            Query parameters, including the format and the page number.
+
+        revalidate: bool
+            Whether to revalidate the stored page even if it is
+            fresh. [Default: ``False``]
+
+        Returns
+        -------
+        Response
+
+        Raises
+        ------
+        FailedRequestError
+            When the request fails.
+        """
+        url = PreparedRequest()
+        url.prepare_url(self.endpoint, api_params)
+
+        entry = self.cache.get(url.url)
+        headers = dict()
+
+        if entry is not None:
+            if not revalidate and self.cache.is_fresh(entry):
+                return entry.to_response()
+
+            headers = entry.validators
+
+        with self._limit_rate(), \
+                self.session.request("GET", self.endpoint, params=api_params,
+                                     headers=headers, stream=True) as response:
+            if entry is not None and response.status_code == HTTPStatus.NOT_MODIFIED:
+                return self.cache.refresh(entry, response).to_response()
+
+            if response.status_code >= HTTPStatus.BAD_REQUEST:
+                raise FailedRequestError(response=response, params=api_params)
+
+            self._read_content(response)
+
+        self.cache.set(url.url, response)
+
+        return response
+
+    def _get(self, format_as: DataFormat, concurrency: int = 1) -> Iterator[Response]:
+        """
+        Extracts paginated data by requesting all of the pages, and
+        records the summary of the query in ``.stats``.
+
+        Parameters
+        ----------
+        format_as: str
+            Response format.
+
+        concurrency: int
+            Number of pages requested in parallel. [Default: ``1``]
+
+        Returns
+        -------
+        Iterator[Response]
+
+        Raises
+        ------
+        FailedRequestError
+            When the request fails.
+
+        ValueError
+            If ``concurrency`` is smaller than 1.
+        """
+        stats = self._stats = QueryStats(format_as.value)
+
+        for observer in self.observers:
+            observer.query_started(self, stats)
+
+        start = perf_counter()
+        responses = self._request_pages(format_as, concurrency)
+
+        try:
+            while True:
+                wait_start = perf_counter()
+                response = next(responses, None)
+                stats.wait_time += perf_counter() - wait_start
+
+                if response is None:
+                    break
+
+                # The time spent until the next page is requested is
+                # spent processing this one.
+                yield response
+        finally:
+            responses.close()
+
+            stats.wall_time = perf_counter() - start
+            stats.parse_time = stats.wall_time - stats.wait_time
+
+            for observer in self.observers:
+                observer.query_finished(self, stats)
+
+    def _request_pages(self, format_as: DataFormat, concurrency: int = 1) -> Iterator[Response]:
+        """
+        Extracts paginated data by requesting all of the pages
+        and combining the results.
+
+        Parameters
+        ----------
+        format_as: str
+            Response format.
+
+        concurrency: int
+            Number of pages requested in parallel. [Default: ``1``]
+
+        Returns
+        -------
+        Iterator[Response]
+
+        Raises
+        ------
+        FailedRequestError
+            When the request fails.
+
+        ValueError
+            If ``concurrency`` is smaller than 1.
+
+        ReleaseChangedError
+            If the pages belong to different releases of the data, and
+            ``consistency`` is defined.
+        """
+        if concurrency < 1:
+            raise ValueError(f"Concurrency must be at least 1, got {concurrency}.")
+
+        self._retries = 0
+        self._compressed_bytes = 0
+        self._decompressed_bytes = 0
+
+        if self.cache is not None and self.cache.release_aware:
+            self.cache.check_release(lambda: self.get_release_timestamp(self.session))
+
+        api_params = self.api_params
+
+        api_params.update({
+            "format": format_as.value,
+            "page": 1
+        })
+
+        if self.latest_by is not None:
+            del api_params["page"]
+            yield self._request_page(api_params)
+            return
+
+        if self.consistency == "raise":
+            yield from self._check_releases(api_params, concurrency)
+            return
+
+        if self.consistency is not None:
+            yield from self._request_consistent_pages(api_params, concurrency)
+            return
+
+        yield from self._request_all_pages(api_params, concurrency)
+
+    def _request_all_pages(self, api_params: dict, concurrency: int,
+                           revalidate: bool = False) -> Iterator[Response]:
+        """
+        Requests all of the pages, using the checkpoint if one is defined.
+
+        Parameters
+        ----------
+        api_params: dict
+            Query parameters, including the format and the number of
+            the first page.
+
+        concurrency: int
+            Number of pages requested in parallel.
+
+        revalidate: bool
+            Whether to revalidate the pages stored in the cache, if any,
+            even if they are fresh. [Default: ``False``]
+
+        Returns
+        -------
+        Iterator[Response]
+        """
+        if self.checkpoint is not None:
+            return self._request_checkpointed_pages(api_params, concurrency, revalidate)
+
+        return self._paginate(api_params, concurrency, revalidate)
+
+    def _check_releases(self, api_params: dict, concurrency: int) -> Iterator[Response]:
+        """
+        Produces the pages as they are received, and raises an exception
+        as soon as a page belongs to a different release from that of
+        the first page.
+
+        Parameters
+        ----------
+        api_params: dict
+            Query parameters, including the format and the number of
+            the first page.
+
+        concurrency: int
+            Number of pages requested in parallel.
+
+        Returns
+        -------
+        Iterator[Response]
+
+        Raises
+        ------
+        ReleaseChangedError
+            If the pages belong to different releases.
+        """
+        expected = None
+
+        responses = self._request_all_pages(api_params, concurrency)
+
+        for page_num, response in enumerate(responses, start=api_params["page"]):
+            last_modified = response.headers["Last-Modified"]
+
+            if expected is None:
+                expected = last_modified
+            elif last_modified != expected:
+                responses.close()
+                raise ReleaseChangedError(page_num, expected, last_modified)
+
+            yield response
+
+    def _request_consistent_pages(self, api_params: dict,
+                                  concurrency: int) -> Iterator[Response]:
+        """
+        Requests all of the pages, and produces them once they are
+        confirmed to belong to the same release. Otherwise, either all
+        of the pages or those of the older releases are requested again,
+        as defined by ``consistency``.
+
+        Parameters
+        ----------
+        api_params: dict
+            Query parameters, including the format and the number of
+            the first page.
+
+        concurrency: int
+            Number of pages requested in parallel.
+
+        Returns
+        -------
+        Iterator[Response]
+
+        Raises
+        ------
+        ReleaseChangedError
+            If the pages still belong to different releases once the
+            attempts have been exhausted.
+        """
+        responses = list(self._request_all_pages(api_params, concurrency))
+        attempts = 0
+
+        while True:
+            releases = {response.headers["Last-Modified"] for response in responses}
+
+            if len(releases) <= 1:
+                break
+
+            if attempts == MAX_CONSISTENCY_ATTEMPTS:
+                self._raise_for_releases(api_params, responses)
+
+            attempts += 1
+
+            if self.consistency == "restart":
+                # Pages stored in the cache may belong to the older release.
+                responses = list(
+                    self._request_all_pages(api_params, concurrency, revalidate=True)
+                )
+            else:
+                latest = max(releases, key=parse_timestamp)
+                responses = self._refetch_outdated_pages(api_params, responses, latest)
+
+        yield from responses
+
+    def _refetch_outdated_pages(self, api_params: dict, responses: List[Response],
+                                latest: str) -> List[Response]:
+        """
+        Requests the pages that do not belong to the latest release
+        again, along with any pages that follow the last one -- in case
+        the latest release has more pages.
+
+        Parameters
+        ----------
+        api_params: dict
+            Query parameters, including the format and the number of
+            the first page.
+
+        responses: List[Response]
+            All of the pages, in order.
+
+        latest: str
+            ``Last-Modified`` header of the latest release.
+
+        Returns
+        -------
+        List[Response]
+            All of the pages, in order.
+        """
+        first_page = api_params["page"]
+        refetched = list()
+
+        for index, response in enumerate(responses):
+            if response.headers["Last-Modified"] == latest:
+                refetched.append(response)
+                continue
+
+            page_params = {**api_params, "page": first_page + index}
+            response = self._request_page(page_params, revalidate=True)
+
+            if response.status_code == HTTPStatus.NO_CONTENT:
+                # The latest release has fewer pages.
+                self._total_pages = page_params["page"] - 1
+                break
+
+            refetched.append(response)
+        else:
+            page_params = {**api_params, "page": first_page + len(refetched)}
+
+            for response in self._paginate(page_params, concurrency=1, revalidate=True):
+                refetched.append(response)
+
+        self._last_update = latest
+
+        return refetched
+
+    def _raise_for_releases(self, api_params: dict, responses: List[Response]) -> NoReturn:
+        """
+        Raises an exception for the first page that belongs to a
+        different release from that of the first page.
+
+        Raises
+        ------
+        ReleaseChangedError
+        """
+        expected = responses[0].headers["Last-Modified"]
+
+        for page_num, response in enumerate(responses, start=api_params["page"]):
+            if response.headers["Last-Modified"] != expected:
+                raise ReleaseChangedError(page_num, expected, response.headers["Last-Modified"])
+
+    def _paginate(self, api_params: dict, concurrency: int,
+                  revalidate: bool = False) -> Iterator[Response]:
+        """
+        Requests the pages in order, from the page defined in
+        ``api_params`` until the last one.
+
+        Parameters
+        ----------
+        api_params: dict
+            Query parameters, including the format and the number of
+            the first page.
+
+        concurrency: int
+            Number of pages requested in parallel.
+
+        revalidate: bool
+            Whether to revalidate the pages stored in the cache, if any,
+            even if they are fresh. [Default: ``False``]
+
+        Returns
+        -------
+        Iterator[Response]
+        """
+        if concurrency > 1:
+            yield from self._get_concurrent(api_params, concurrency, revalidate)
+            return
+
+        api_params = api_params.copy()
+
+        while True:
+            response = self._request_page(api_params, revalidate)
+
+            if response.status_code == HTTPStatus.NO_CONTENT:
+                self._total_pages = api_params["page"] - 1
+                break
+
+            self._last_update = response.headers["Last-Modified"]
+            yield response
+
+            api_params["page"] += 1
+
+    def _request_checkpointed_pages(self, api_params: dict, concurrency: int,
+                                    revalidate: bool = False) -> Iterator[Response]:
+        """
+        Produces the pages stored in the checkpoint, if the data have not
+        been updated since they were stored, and requests the rest. Each
+        page requested is stored in the checkpoint, and the checkpoint is
+        removed once the last page has been received.
+
+        Parameters
+        ----------
+        api_params: dict
+            Query parameters, including the format and the number of
+            the first page.
+
+        concurrency: int
+            Number of pages requested in parallel.
+
+        revalidate: bool
+            Whether to revalidate the pages stored in the cache, if any,
+            even if they are fresh. [Default: ``False``]
+
+        Returns
+        -------
+        Iterator[Response]
+        """
+        url = PreparedRequest()
+        url.prepare_url(self.endpoint, {
+            key: value
+            for key, value in api_params.items()
+            if key != "page"
+        })
+        url = url.url
+
+        state = self.checkpoint.get_state(url)
+
+        if state is not None and state.last_modified != self._get_last_modified(max_age=0):
+            self.checkpoint.remove(url)
+            state = None
+
+        if state is not None:
+            for page_num in range(api_params["page"], state.next_page):
+                started_at, start = time(), perf_counter()
+                response = self.checkpoint.get_page(url, page_num)
+
+                if response is None:
+                    # Missing or damaged -- the pages already produced are
+                    # kept, and the extract continues from this page.
+                    state = self.checkpoint.rewind(url, page_num)
+                    break
+
+                self._report_page({**api_params, "page": page_num}, response.status_code,
+                                  1, started_at, start, response)
+
+                self._last_update = response.headers["Last-Modified"]
+                yield response
+
+        if state is not None:
+            api_params = {**api_params, "page": state.next_page}
+
+        page_num = api_params["page"]
+        last_modified = state.last_modified if state is not None else None
+        consistent = True
+
+        for response in self._paginate(api_params, concurrency, revalidate):
+            if last_modified is None:
+                last_modified = response.headers["Last-Modified"]
+
+            if consistent and response.headers["Last-Modified"] != last_modified:
+                # The data were updated mid-extract, so the stored pages
+                # must not be resumed. The extract restarts next time.
+                self.checkpoint.remove(url)
+                consistent = False
+
+            if consistent:
+                self.checkpoint.add_page(url, page_num, response)
+
+            yield response
+
+            page_num += 1
+
+        self.checkpoint.remove(url)
+
+    def _get_concurrent(self, api_params: dict, concurrency: int,
+                        revalidate: bool = False) -> Iterator[Response]:
+        """
+        Requests up to ``concurrency`` pages ahead of the one being
+        consumed, and produces the responses in page order.
+
+        Once a page with no content is reached, the requests for
+        the pages that follow it are cancelled.
+
+        Parameters
+        ----------
+        api_params: dict
+            Query parameters, including the format and the number of
+            the first page.
+
+        concurrency: int
+            Number of pages requested in parallel.
+
+        revalidate: bool
+            Whether to revalidate the pages stored in the cache, if any,
+            even if they are fresh. [Default: ``False``]
+
+        Returns
+        -------
+        Iterator[Response]
+        """
+        first_page = api_params["page"]
+
+        def request_page(page_num: int) -> Response:
+            return self._request_page({**api_params, "page": page_num}, revalidate)
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            pending = deque(
+                (page_num, executor.submit(request_page, page_num))
+                for page_num in range(first_page, first_page + concurrency)
+            )
+            next_page = first_page + concurrency
+
+            try:
+                while pending:
+                    page_num, future = pending.popleft()
+                    response = future.result()
+
+                    if response.status_code == HTTPStatus.NO_CONTENT:
+                        self._total_pages = page_num - 1
+                        break
+
+                    pending.append((next_page, executor.submit(request_page, next_page)))
+                    next_page += 1
+
+                    self._last_update = response.headers["Last-Modified"]
+                    yield response
+            finally:
+                for _, future in pending:
+                    future.cancel()
+
+    def iter_pages(self, concurrency: int = 1, typed: bool = False) -> Iterator[List[dict]]:
+        """
+        Produces the data one page at a time, as soon as each page is
+        received. Unlike ``.get_json()``, only one page is held in memory
+        at any one time.
+
+        .. versionadded:: 1.3.0
+
+        Parameters
+        ----------
+        concurrency: int
+            Number of pages requested in parallel. [Default: ``1``]
+
+        typed: bool
+            If ``True``, the records are instances of ``.record_type``,
+            with dates parsed as ``datetime.date`` objects, rather than
+            dictionaries. [Default: ``False``]
+
+        Returns
+        -------
+        Iterator[List[dict]]
+            Records of each page.
+
+        Examples
+        --------
+        >>> filters = ["areaType=region"]
+        >>> structure = {
+        ...     "name": "areaName",
+        ...     "newCases": "newCasesBySpecimenDate"
+        ... }
+        >>> data = Cov19API(filters=filters, structure=structure)
+        >>> for page in data.iter_pages():
+        ...     print(len(page))
+        1000
+        1000
+        ...
+        """
+        backend = self.json_backend
+        record_type = self.record_type if typed else None
+
+        for response in self._get(DataFormat.JSON, concurrency):
+            yield backend.decode_page(response.content, record_type)
+
+    def iter_records(self, concurrency: int = 1, typed: bool = False) -> Iterator[dict]:
+        """
+        Produces the data one record at a time, as each page is received.
+
+        .. versionadded:: 1.3.0
+
+        Parameters
+        ----------
+        concurrency: int
+            Number of pages requested in parallel. [Default: ``1``]
+
+        typed: bool
+            If ``True``, the records are instances of ``.record_type``
+            rather than dictionaries. [Default: ``False``]
+
+        Returns
+        -------
+        Iterator[dict]
+
+        Examples
+        --------
+        >>> filters = ["areaType=region"]
+        >>> structure = {
+        ...     "name": "areaName",
+        ...     "newCases": "newCasesBySpecimenDate"
+        ... }
+        >>> data = Cov19API(filters=filters, structure=structure)
+        >>> for record in data.iter_records():
+        ...     print(record)
+        {'name': 'East Midlands', 'newCases': 0}
+        ...
+        """
+        for page_data in self.iter_pages(concurrency, typed=typed):
+            yield from page_data
+
+    def iter_xml_elements(self, concurrency: int = 1,
+                          clear: bool = False) -> Iterator[XMLElement]:
+        """
+        Produces the data in XML one ``data`` element at a time. Each page
+        is parsed incrementally, and each element is produced as soon as
+        it has been parsed.
+
+        .. versionadded:: 1.3.0
+
+        Parameters
+        ----------
+        concurrency: int
+            Number of pages requested in parallel. [Default: ``1``]
+
+        clear: bool
+            If ``True``, the content of each element is discarded once the
+            next element is requested. Elements must then be processed or
+            copied before the iteration is resumed. [Default: ``False``]
+
+        Returns
+        -------
+        Iterator[xml.etree.ElementTree.Element]
+
+        Examples
+        --------
+        >>> filters = ["areaType=region"]
+        >>> structure = {
+        ...     "name": "areaName",
+        ...     "newCases": "newCasesBySpecimenDate"
+        ... }
+        >>> data = Cov19API(filters=filters, structure=structure)
+        >>> for elm in data.iter_xml_elements(clear=True):
+        ...     print(elm.findtext("name"), elm.findtext("newCases"))
+        East Midlands 0
+        ...
+        """
+        for response in self._get(DataFormat.XML, concurrency):
+            yield from iter_xml_data((response.content,), clear=clear)
+
+    def iter_csv_lines(self, concurrency: int = 1) -> Iterator[str]:
+        """
+        Produces the data in CSV one line at a time, as each page is
+        received. The first line contains the column names; the lines
+        do not include a line break.
+
+        .. versionadded:: 1.3.0
+
+        Parameters
+        ----------
+        concurrency: int
+            Number of pages requested in parallel. [Default: ``1``]
+
+        Returns
+        -------
+        Iterator[str]
+
+        Examples
+        --------
+        >>> from csv import reader
+        >>> filters = ["areaType=region"]
+        >>> structure = {
+        ...     "name": "areaName",
+        ...     "newCases": "newCasesBySpecimenDate"
+        ... }
+        >>> data = Cov19API(filters=filters, structure=structure)
+        >>> for row in reader(data.iter_csv_lines()):
+        ...     print(row)
+        ['name', 'newCases']
+        ['East Midlands', '0']
+        ...
+        """
+        for chunk in self._iter_csv_chunks(concurrency):
+            for line in chunk.decode().split("\n"):
+                if line:
+                    yield line
+
+    def _iter_csv_chunks(self, concurrency: int = 1) -> Iterator[bytes]:
+        """
+        Produces the data in CSV as raw bytes, one page at a time. The
+        first chunk starts with the column names, which are removed from
+        the pages that follow. Line breaks are normalised to ``\\n``, and
+        every chunk ends with a line break.
+
+        Parameters
+        ----------
+        concurrency: int
+            Number of pages requested in parallel. [Default: ``1``]
+
+        Returns
+        -------
+        Iterator[bytes]
+
+        Raises
+        ------
+        ValueError
+            If the column names of a page differ from those of the
+            first page.
+        """
+        header = None
+
+        for response in self._get(DataFormat.CSV, concurrency):
+            header, chunk = prepare_csv_page(response.content, header)
+
+            if chunk:
+                yield chunk
+
+    def _get_extras(self, length: int) -> dict:
+        """
+        Metadata appended to the data in JSON and XML outputs.
+
+        Parameters
+        ----------
+        length: int
+            Number of records.
+
+        Returns
+        -------
+        dict
+        """
+        return {
+            "lastUpdate": self.last_update,
+            "length": length,
+            "totalPages": self._total_pages
+        }
+
+    def _iter_json_document(self, concurrency: int = 1,
+                            collect: Union[list, None] = None) -> Iterator[str]:
+        """
+        Produces the JSON output one page at a time.
+
+        The concatenated chunks represent the same data as ``.get_json()``.
+        Where the JSON backend supports it -- e.g. ``msgspec`` -- the
+        records are reproduced as received from the API, rather than
+        parsed and serialised again.
+
+        Parameters
+        ----------
+        concurrency: int
+            Number of pages requested in parallel. [Default: ``1``]
+
+        collect: Union[list, None]
+            If defined, the records are also appended to this list.
+            [Default: ``None``]
+
+        Returns
+        -------
+        Iterator[str]
+        """
+        backend = self.json_backend
+        length = 0
+
+        yield '{"data":['
+
+        for response in self._get(DataFormat.JSON, concurrency):
+            # The records are spliced into the document without being
+            # serialised again, where the backend supports it.
+            chunk, page_length = backend.extract_data(response.content, collect)
+
+            if not page_length:
+                continue
+
+            yield ("," if length else "") + chunk
+
+            length += page_length
+
+        extras = backend.dumps(self._get_extras(length=length))
+
+        # Appends the extras to the outer object.
+        yield "]," + extras[1:]
+
+    def _iter_xml_document(self, concurrency: int = 1,
+                           collect: Union[XMLElement, None] = None) -> Iterator[str]:
+        """
+        Produces the XML output one page at a time.
+
+        Parameters
+        ----------
+        concurrency: int
+            Number of pages requested in parallel. [Default: ``1``]
+
+        collect: Union[XMLElement, None]
+            If defined, the ``data`` elements are also appended to this
+            element. [Default: ``None``]
+
+        Returns
+        -------
+        Iterator[str]
+        """
+        length = 0
+
+        yield f'<document xmlns:xsi="{XSI_NAMESPACE}">'
 
-        .. versionadded:: 1.2.0
+        for response in self._get(DataFormat.XML, concurrency):
+            chunk, page_length = self._format_xml_page(response.content, collect)
+            length += page_length
 
-        This property supplies the website timestamp - i.e. the time at which the data
-        were released to the API and by extension the website. Please note that there
-        will be a difference between this timestamp and the timestamp produced using
-        the ``last_update`` property. The latter signifies the time at which the data
-        were deployed to the database, not the time at which they were released.
+            yield chunk
 
-        .. note::
+        yield self._format_xml_extras(self._get_extras(length=length))
 
-            The output is extracted from the header and is accurate to
-            the miliseconds.
+    def _iter_csv_document(self, concurrency: int = 1,
+                           collect: Union[BytesIO, None] = None) -> Iterator[str]:
+        """
+        Produces the CSV output one page at a time.
 
-        .. warning::
+        Parameters
+        ----------
+        concurrency: int
+            Number of pages requested in parallel. [Default: ``1``]
+
+        collect: Union[BytesIO, None]
+            If defined, the rows are also written to this buffer.
+            [Default: ``None``]
 
-            The ISO-8601 standard requires a ``"Z"`` character to be added
-            to the end of the timestamp. This is a timezone feature and is
-            not recognised by Python's ``datetime`` library. It is, however,
-            most other libraries; e.g. ``pandas``. If you wish to parse the
-            timestamp using the the ``datetime`` library, make sure that you
-            remove the trailing ``"Z"`` character.
-            
         Returns
         -------
-        str
-            Timestamp, formatted as ISO-8601.
+        Iterator[str]
+        """
+        for chunk in self._iter_csv_chunks(concurrency):
+            if collect is not None:
+                collect.write(chunk)
 
-        Examples
-        --------
-        >>> release_timestamp = Cov19API.get_release_timestamp()
-        >>> print(release_timestamp)
-        2020-08-08T15:00:09.977840Z
+            yield chunk.decode()
 
-        >>> from datetime import datetime
-        >>> release_timestamp = Cov19API.get_release_timestamp()
-        >>> parsed_timestamp = datetime.fromisoformat(release_timestamp.strip("Z"))
-        >>> print(parsed_timestamp)
-        2020-08-08 15:00:09
+    def _iter_arrow_tables(self, schema, concurrency: int = 1,
+                           collect: Union[list, None] = None) -> Iterator["pyarrow.Table"]:
         """
-        with request("GET", Cov19API.release_timestamp_endpoint) as response:
-            json_data = response.json()
+        Produces the data as an Apache Arrow table per page.
 
-        return json_data['websiteTimestamp']
+        Parameters
+        ----------
+        schema: pyarrow.Schema
+            Schema of the tables.
 
-    @property
-    def api_params(self) -> dict:
-        """
-        :staticmethod:
-            API parameters, constructed based on ``filters``, ``structure``,
-            and ``latest_by`` arguments as defined by the user.
+        concurrency: int
+            Number of pages requested in parallel. [Default: ``1``]
+
+        collect: Union[list, None]
+            If defined, the tables are also appended to this list.
+            [Default: ``None``]
 
         Returns
         -------
-        Dict[str, str]
+        Iterator[pyarrow.Table]
         """
-        api_params = {
-            "filters": str.join(";", self.filters),
-            "structure": dumps(self.structure, separators=(",", ":")),
-        }
+        for response in self._get(DataFormat.CSV, concurrency):
+            if not response.content.strip():
+                continue
 
-        if self.latest_by is not None:
-            api_params.update({
-                "latestBy": self.latest_by
-            })
+            table = read_csv_table(response.content, schema)
 
-        return api_params
+            if collect is not None:
+                collect.append(table)
 
-    def head(self):
+            yield table
+
+    def export(self, path: str, concurrency: int = 1) -> NoReturn:
         """
-        Request header for the given input arguments (``filters``,
-        ``structure``, and ``lastest_by``).
+        Saves the full data (all pages) in a file, as each page is
+        received. Unlike the ``save_as`` argument of ``.get_json()``,
+        ``.get_xml()`` and ``.get_csv()``, only one page is held in memory
+        at any one time.
+
+        The data are written to a temporary file first, which replaces
+        the file at ``path`` once all of the pages have been written.
+
+        .. versionadded:: 1.3.0
+
+        Parameters
+        ----------
+        path: str
+            Path to the file. The format is determined by the extension
+            of the file -- i.e. ``.json``, ``.xml``, ``.csv``, ``.parquet``
+            or ``.feather``. The ``pyarrow`` library must be installed
+            separately to save Parquet and Feather files.
+
+        concurrency: int
+            Number of pages requested in parallel. [Default: ``1``]
 
         Returns
         -------
-        Dict[str, str]
+        NoReturn
+
+        Raises
+        ------
+        ValueError
+            If the extension of the file is not supported.
 
         Examples
         --------
-        >>> filters = ["areaType=region"]
+        >>> filters = ["areaType=ltla"]
         >>> structure = {
+        ...     "date": "date",
         ...     "name": "areaName",
         ...     "newCases": "newCasesBySpecimenDate"
         ... }
-        >>> data = Cov19API(
-        ...     filters=filters,
-        ...     structure=structure,
-        ...     latest_by='newCasesBySpecimenDate'
-        ... )
-        >>> head = data.head()
-        >>> print(head)
-        {'Cache-Control': 'public, max-age=60', 'Content-Length': '0',
-         ...
-        }
+        >>> data = Cov19API(filters=filters, structure=structure)
+        >>> data.export("some_existing_directory/data.json")
         """
-        api_params = self.api_params
-
-        with request("HEAD", self.endpoint, params=api_params,
-                     verify=certifi.where()) as response:
-            response.raise_for_status()
-            return response.headers
+        format_as = self._get_export_format(path)
 
-    @staticmethod
-    def options():
-        """
-        :staticmethod:
-            Provides the options by calling the ``OPTIONS`` method of the API.
+        if isinstance(format_as, ArrowFormat):
+            self._validate_flat_structure()
+            schema = get_arrow_schema(self._get_flat_structure())
+            tables = self._iter_arrow_tables(schema, concurrency)
 
-        Returns
-        -------
-        dict
-            API options.
+            stream_tables(tables, schema, path, format_as)
+            return
 
-        Examples
-        --------
-        >>> from pprint import pprint
-        >>> options = Cov19API.options()
-        >>> pprint(options)
-        {'info': {'description': "Public Health England's Coronavirus Dashboard API",
-         'title': 'Dashboard API',
-         'version': '1.0'},
-         'openapi': '3.0.1',
-          ...
+        documents = {
+            DataFormat.JSON: self._iter_json_document,
+            DataFormat.XML: self._iter_xml_document,
+            DataFormat.CSV: self._iter_csv_document
         }
-        """
-        with request("OPTIONS", Cov19API.endpoint, verify=certifi.where()) as response:
-            response.raise_for_status()
-            return response.json()
 
-    def _get(self, format_as: DataFormat) -> Iterator[Response]:
+        if format_as == DataFormat.CSV:
+            self._validate_flat_structure()
+
+        stream_data(documents[format_as](concurrency), path, format_as)
+
+    def sync(self, store: BaseStore, lookback: int = 3,
+             end_date: Union[date, None] = None, concurrency: int = 1) -> int:
         """
-        Extracts paginated data by requesting all of the pages
-        and combining the results.
+        Brings a local store of records up to date, by requesting only
+        the data released since its latest date.
+
+        If the store is empty, the full data are requested. Otherwise, the
+        data are requested one date at a time -- using the ``date`` filter
+        -- from ``lookback`` days before the latest date in the store up to
+        ``end_date``. The records are upserted, so that figures revised
+        for recent days replace those already in the store.
+
+        .. versionadded:: 1.3.0
 
         Parameters
         ----------
-        format_as: str
-            Response format.
+        store: BaseStore
+            Local store of records -- e.g. ``JSONStore``.
+
+        lookback: int
+            Number of days before the latest date in the store that are
+            requested again, to capture revisions. [Default: ``3``]
+
+        end_date: Union[date, None]
+            Last date to request. If ``None``, today's date (UTC) is used.
+            [Default: ``None``]
+
+        concurrency: int
+            Number of pages requested in parallel. [Default: ``1``]
 
         Returns
         -------
-        Iterator[Response]
+        int
+            Number of records received and upserted.
 
         Raises
         ------
-        FailedRequestError
-            When the request fails.
-        """
-        api_params = self.api_params
-
-        api_params.update({
-            "format": format_as.value,
-            "page": 1
-        })
-
-        if self.latest_by is not None:
-            del api_params["page"]
-
-        while True:
-            with request("GET", self.endpoint, params=api_params,
-                         verify=certifi.where()) as response:
-                if response.status_code >= HTTPStatus.BAD_REQUEST:
-                    raise FailedRequestError(response=response, params=api_params)
-
-                if self.latest_by is not None:
-                    yield response
-                    break
-                elif response.status_code == HTTPStatus.NO_CONTENT:
-                    self._total_pages = api_params["page"] - 1
-                    break
-                else:
-                    self._last_update = response.headers["Last-Modified"]
-                    yield response
+        ValueError
+            If ``lookback`` is negative, if the structure is nested or
+            does not include the ``date`` metric, if the structure does not
+            include an area metric while the query is not restricted to a
+            single area, or if the query already filters by date or uses
+            ``latest_by``.
 
-            if self.latest_by is None:
-                api_params["page"] += 1
+        Examples
+        --------
+        >>> from uk_covid19.store import JSONStore
+        >>> store = JSONStore("some_existing_directory/cases.json")
+        >>> filters = ["areaType=nation"]
+        >>> structure = {
+        ...     "date": "date",
+        ...     "name": "areaName",
+        ...     "newCases": "newCasesByPublishDate"
+        ... }
+        >>> data = Cov19API(filters=filters, structure=structure)
+        >>> data.sync(store)  # First run: full data.
+        1120
+        >>> data.sync(store)  # Later runs: recent dates only.
+        16
+        """
+        dates = self._get_sync_dates(store, lookback, end_date)
+
+        if dates is None:
+            queries = [self]
+        else:
+            queries = list()
+
+            for day in dates:
+                query = Cov19API(
+                    filters=[*self.filters, f"date={day}"],
+                    structure=self.structure,
+                    session=self._session,
+                    cache=self.cache,
+                    retry=self.retry,
+                    rate_limiter=self.rate_limiter,
+                    json_backend=self._json_backend,
+                    observers=self.observers,
+                    checkpoint=self.checkpoint,
+                    consistency=self.consistency
+                )
+                query.endpoint = self.endpoint
+                queries.append(query)
+
+        total = 0
+        last_update = None
+
+        for query in queries:
+            for page_data in query.iter_pages(concurrency):
+                store.upsert(page_data)
+                total += len(page_data)
+
+            last_update = query._last_update or last_update
+
+        if last_update is not None:
+            self._last_update = last_update
+            last_update = self._format_last_modified(last_update)
+
+        store.save(last_update=last_update)
+
+        return total
 
     def get_json(self, save_as: Union[str, None] = None,
-                 as_string: bool = False) -> Union[dict, str]:
+                 as_string: bool = False, concurrency: int = 1) -> Union[dict, str]:
         """
         Provides full data (all pages) in JSON.
 
@@ -340,6 +2400,14 @@ class Cov19API:
             If ``False`` (default), returns the data as a dictionary.
             Otherwise, returns the data as a JSON string.
 
+        concurrency: int
+            .. versionadded:: 1.3.0
+
+            Number of pages requested in parallel. The pages that follow
+            the current one are requested ahead of time, but the data are
+            still assembled in page order. The connection pool of the
+            session should be at least as large. [Default: ``1``]
+
         Returns
         -------
         Union[Dict, str]
@@ -360,32 +2428,77 @@ class Cov19API:
         >>> print(result)
         {'data': [{'name': 'East Midlands', 'newCases': 0}, ... }
         """
+        if as_string:
+            return str.join("", self._iter_json_document(concurrency))
+
         resp = {
             "data": list()
         }
 
-        for response in self._get(DataFormat.JSON):
-            current_data = response.json()
-            page_data = current_data['data']
-
-            resp["data"].extend(page_data)
+        if save_as is None:
+            for page_data in self.iter_pages(concurrency):
+                resp["data"].extend(page_data)
+        else:
+            document = self._iter_json_document(concurrency, collect=resp["data"])
+            stream_data(document, save_as, DataFormat.JSON)
 
         resp["lastUpdate"] = self.last_update
         resp["length"] = len(resp["data"])
         resp["totalPages"] = self._total_pages
 
-        if as_string:
-            return dumps(resp, separators=(",", ":"))
+        return resp
 
-        if save_as is None:
-            return resp
+    def get_records(self, concurrency: int = 1) -> RecordSet:
+        """
+        Provides full data (all pages) as a compact ``RecordSet``.
 
-        data = dumps(resp, separators=(",", ":"))
-        save_data(data, save_as, DataFormat.JSON)
+        The records are stored column by column, with area names and
+        other categories shared between records and dates parsed once,
+        which takes a fraction of the memory of the dictionaries
+        produced by ``.get_json()``. Records are produced as named
+        tuples. See ``uk_covid19.records`` for additional information.
 
-        return resp
+        .. versionadded:: 1.3.0
+
+        Parameters
+        ----------
+        concurrency: int
+            Number of pages requested in parallel. [Default: ``1``]
+
+        Returns
+        -------
+        RecordSet
+
+        Raises
+        ------
+        ValueError
+            If the structure is nested.
+
+        Examples
+        --------
+        >>> filters = ["areaType=nation"]
+        >>> structure = {
+        ...     "date": "date",
+        ...     "name": "areaName",
+        ...     "newCases": "newCasesByPublishDate"
+        ... }
+        >>> data = Cov19API(filters=filters, structure=structure)
+        >>> records = data.get_records()
+        >>> records[0]
+        Record(date=datetime.date(2020, 10, 12), name='England', newCases=12872)
+        >>> sum(filter(None, records["newCases"]))
+        596848
+        """
+        self._validate_flat_structure()
 
-    def get_xml(self, save_as=None, as_string=False) -> XMLElement:
+        records = RecordSet(self._get_flat_structure())
+
+        for page_data in self.iter_pages(concurrency):
+            records.extend(page_data)
+
+        return records
+
+    def get_xml(self, save_as=None, as_string=False, concurrency: int = 1) -> XMLElement:
         """
         Provides full data (all pages) in XML.
 
@@ -404,6 +2517,14 @@ class Cov19API:
             If ``False`` (default), returns an ``ElementTree``
             object. Otherwise, returns the data as an XML string.
 
+        concurrency: int
+            .. versionadded:: 1.3.0
+
+            Number of pages requested in parallel. The pages that follow
+            the current one are requested ahead of time, but the data are
+            still assembled in page order. The connection pool of the
+            session should be at least as large. [Default: ``1``]
+
         Returns
         -------
         xml.etree.ElementTree.Element
@@ -432,46 +2553,28 @@ class Cov19API:
             ...
         </document>
         """
-        from xml.etree.ElementTree import SubElement, fromstring
-
-        resp = XMLElement("document")
-
-        for response in self._get(DataFormat.XML):
-            decoded_content = response.content.decode()
+        from xml.etree.ElementTree import SubElement
 
-            # Parsing the XML:
-            parsed_data = fromstring(decoded_content)
+        if as_string:
+            return str.join("", self._iter_xml_document(concurrency))
 
-            # Extracting "data" elements from the tree:
-            page_data = parsed_data.findall(".//data")
+        resp = XMLElement("document")
 
-            resp.extend(page_data)
+        if save_as is None:
+            resp.extend(self.iter_xml_elements(concurrency))
+        else:
+            document = self._iter_xml_document(concurrency, collect=resp)
+            stream_data(document, save_as, DataFormat.XML)
 
-        extras = {
-            "lastUpdate": self.last_update,
-            "length": len(resp.findall(".//data")),
-            "totalPages": self._total_pages
-        }
+        extras = self._get_extras(length=len(resp))
 
         for elm_name, value in extras.items():
             elm = SubElement(resp, elm_name)
             elm.text = str(value)
 
-        if save_as is None and not as_string:
-            return resp
-
-        from xml.etree.ElementTree import tostring
-
-        str_data = tostring(resp, encoding='unicode', method='xml')
-
-        if as_string:
-            return str_data
-
-        save_data(str_data, save_as, DataFormat.XML)
-
         return resp
 
-    def get_csv(self, save_as=None) -> str:
+    def get_csv(self, save_as=None, concurrency: int = 1) -> str:
         """
         Provides full data (all pages) in CSV.
 
@@ -490,6 +2593,14 @@ class Cov19API:
             The value must be a path to a file with the correct
             extension -- i.e. ``.csv`` for CSV).
 
+        concurrency: int
+            .. versionadded:: 1.3.0
+
+            Number of pages requested in parallel. The pages that follow
+            the current one are requested ahead of time, but the data are
+            still assembled in page order. The connection pool of the
+            session should be at least as large. [Default: ``1``]
+
         Returns
         -------
         str
@@ -497,7 +2608,8 @@ class Cov19API:
         Raises
         ------
         ValueError
-            If the structure is nested.
+            If the structure is nested, or if the column names of the
+            pages differ.
 
         Examples
         --------
@@ -517,50 +2629,125 @@ class Cov19API:
         East Midlands,0
         ...
         """
-        # Checks to ensure that the structure is
-        # not hierarchical.
-        if isinstance(self.structure, dict):
-            non_str = filter(
-                lambda val: not isinstance(val, str),
-                self.structure.values()
-            )
+        self._validate_flat_structure()
 
-            if list(non_str):
-                struct = dumps(self.structure, indent=4)
-                raise ValueError("CSV structure cannot be nested. Received:\n%s" % struct)
+        buffer = BytesIO()
+
+        if save_as is None:
+            for chunk in self._iter_csv_chunks(concurrency):
+                buffer.write(chunk)
+        else:
+            document = self._iter_csv_document(concurrency, collect=buffer)
+            stream_data(document, save_as, DataFormat.CSV)
+
+        return buffer.getvalue().decode()
+
+    def get_arrow(self, save_as: Union[str, None] = None, concurrency: int = 1):
+        """
+        Provides full data (all pages) as an Apache Arrow table.
+
+        Each page is requested in CSV and parsed into a table as it is
+        received, using a schema derived from the structure: ``date`` as
+        ``date32``, area names, codes and types as dictionary encoded
+        strings, counts as ``int64``, rates as ``float64``, and metrics of
+        unknown type as strings. See ``uk_covid19.schema`` for additional
+        information.
+
+        .. versionadded:: 1.3.0
+
+        .. warning::
+
+            The ``pyarrow`` library is not included in the dependencies of this
+            library and must be installed separately.
+
+        Parameters
+        ----------
+        save_as: Union[str, None]
+            If defined, the results will (also) be saved as a
+            file. [Default: ``None``]
+
+            The value must be a path to a file with the correct
+            extension -- i.e. ``.parquet`` for Parquet, or ``.feather``
+            for Feather.
+
+        concurrency: int
+            Number of pages requested in parallel. [Default: ``1``]
+
+        Returns
+        -------
+        pyarrow.Table
 
-        linebreak = "\n"
-        resp = str()
+        Raises
+        ------
+        ImportError
+            If the ``pyarrow`` library is not installed.
+
+        ValueError
+            If the structure is nested, or if ``save_as`` does not end
+            with a supported extension.
 
-        for page_num, response in enumerate(self._get(DataFormat.CSV), start=1):
-            decoded_content = response.content.decode()
+        Examples
+        --------
+        >>> filters = ["areaType=nation"]
+        >>> structure = {
+        ...     "date": "date",
+        ...     "name": "areaName",
+        ...     "newCases": "newCasesByPublishDate"
+        ... }
+        >>> data = Cov19API(filters=filters, structure=structure)
+        >>> table = data.get_arrow(save_as="some_existing_directory/data.parquet")
+        >>> print(table.schema)
+        date: date32[day]
+        name: dictionary<values=string, indices=int32, ordered=0>
+        newCases: int64
+        """
+        self._validate_flat_structure()
 
-            # Removing CSV header (column names) where page
-            # number is greater than 1.
-            if page_num > 1:
-                data_lines = decoded_content.split(linebreak)[1:]
-                decoded_content = str.join(linebreak, data_lines)
+        schema = get_arrow_schema(self._get_flat_structure())
+        tables = list()
 
-            resp += decoded_content.strip() + linebreak
+        from pyarrow import concat_tables
 
         if save_as is None:
-            return resp
+            tables.extend(self._iter_arrow_tables(schema, concurrency))
+        else:
+            format_as = self._get_arrow_format(save_as)
+            chunks = self._iter_arrow_tables(schema, concurrency, collect=tables)
+            stream_tables(chunks, schema, save_as, format_as)
 
-        save_data(resp, save_as, DataFormat.CSV)
+        if not tables:
+            return schema.empty_table()
 
-        return resp
+        return concat_tables(tables).unify_dictionaries()
 
-    def get_dataframe(self):
+    def get_dataframe(self, concurrency: int = 1):
         """
         Provides the data as as ``pandas.DataFrame`` object.
 
         .. versionadded:: 1.2.0
 
+        .. versionchanged:: 1.3.0
+
+            Flat structures are requested in CSV and parsed directly into
+            typed columns: ``date`` as ``datetime64``, area names, codes and
+            types as ``category``, and counts as nullable integers (``Int64``).
+            See ``uk_covid19.schema`` for additional information.
+
         .. warning::
 
             The ``pandas`` library is not included in the dependencies of this
             library and must be installed separately.
 
+        Parameters
+        ----------
+        concurrency: int
+            .. versionadded:: 1.3.0
+
+            Number of pages requested in parallel. The pages that follow
+            the current one are requested ahead of time, but the data are
+            still assembled in page order. The connection pool of the
+            session should be at least as large. [Default: ``1``]
+
         Returns
         -------
         DataFrame
@@ -578,13 +2765,18 @@ class Cov19API:
                 "library. Please install the library and try again."
             )
 
-        data = self.get_json()
-        df = DataFrame(data["data"])
+        try:
+            self._validate_flat_structure()
+        except ValueError:
+            # Nested structures cannot be expressed as columns.
+            data = self.get_json(concurrency=concurrency)
+            return DataFrame(data["data"])
 
-        return df
+        # Pages are held as raw CSV in a single buffer, and are
+        # parsed at once; only the header of the first page is kept.
+        buffer = BytesIO()
 
-    def __str__(self):
-        resp = "COVID-19 in the UK - API Service\nCurrent parameters: \n"
-        return resp + dumps(self.api_params, indent=4)
+        for chunk in self._iter_csv_chunks(concurrency):
+            buffer.write(chunk)
 
-    __repr__ = __str__
+        return self._read_dataframe(buffer)
@@ -0,0 +1,1168 @@
+#!/usr/bin python3
+
+# Imports
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Python:
+from typing import Union, AsyncIterator, Iterable, List, Dict, NoReturn
+from http import HTTPStatus
+from collections import deque
+from xml.etree.ElementTree import Element as XMLElement
+from io import BytesIO
+from time import time, perf_counter
+from datetime import datetime, date
+from email.utils import parsedate_to_datetime
+import asyncio
+import ssl
+
+# 3rd party:
+import certifi
+
+# Internal:
+from uk_covid19.api_interface import (
+    BaseCov19API, StructureType, FiltersType, DEFAULT_FRESHNESS_TTL, XSI_NAMESPACE,
+    get_memoised_last_modified, memoise_last_modified, parse_timestamp
+)
+from uk_covid19.utils import (
+    open_data_file, open_table_writer, prepare_csv_page, iter_xml_data
+)
+from uk_covid19.data_format import DataFormat, ArrowFormat
+from uk_covid19.columnar import get_arrow_schema, read_csv_table
+from uk_covid19.store import BaseStore
+from uk_covid19.exceptions import FailedRequestError
+from uk_covid19.json_backend import JSONBackend
+from uk_covid19.records import RecordSet
+from uk_covid19.instrumentation import Observer, PageEvent, QueryStats
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+__all__ = [
+    'AsyncCov19API',
+    'create_async_session'
+]
+
+
+def _import_aiohttp():
+    try:
+        import aiohttp
+    except ImportError:
+        raise ImportError(
+            "The `aiohttp` library is not installed as a part of the `uk-covid19` "
+            "library. Please install the library and try again."
+        )
+
+    return aiohttp
+
+
+def create_async_session(limit: int = 100, limit_per_host: int = 10,
+                         keepalive_timeout: float = 15, compression: bool = True):
+    """
+    Creates an ``aiohttp.ClientSession`` with a connection pool
+    configured for the API.
+
+    .. versionadded:: 1.3.0
+
+    .. warning::
+
+        The ``aiohttp`` library is not included in the dependencies of this
+        library and must be installed separately.
+
+    .. note::
+
+        The session must be created inside a running event loop, and
+        closed once it is no longer needed.
+
+    Parameters
+    ----------
+    limit: int
+        Maximum number of simultaneous connections. [Default: ``100``]
+
+    limit_per_host: int
+        Maximum number of simultaneous connections to the same
+        host. [Default: ``10``]
+
+    keepalive_timeout: float
+        Number of seconds for which idle connections are kept
+        alive. [Default: ``15``]
+
+    compression: bool
+        If ``True``, the API is asked to compress the content of the
+        responses with any of the algorithms supported by ``aiohttp``.
+        Otherwise, the content is requested uncompressed.
+        [Default: ``True``]
+
+    Returns
+    -------
+    aiohttp.ClientSession
+
+    Raises
+    ------
+    ImportError
+        If the ``aiohttp`` library is not installed.
+    """
+    aiohttp = _import_aiohttp()
+
+    ssl_context = ssl.create_default_context(cafile=certifi.where())
+
+    connector = aiohttp.TCPConnector(
+        limit=limit,
+        limit_per_host=limit_per_host,
+        keepalive_timeout=keepalive_timeout,
+        ssl=ssl_context
+    )
+
+    headers = dict()
+
+    if not compression:
+        headers["Accept-Encoding"] = "identity"
+
+    return aiohttp.ClientSession(connector=connector, headers=headers)
+
+
+class AsyncCov19API(BaseCov19API):
+    """
+    Asynchronous interface to access the API service for COVID-19 data
+    in the United Kingdom.
+
+    .. versionadded:: 1.3.0
+
+    .. warning::
+
+        The ``aiohttp`` library is not included in the dependencies of this
+        library and must be installed separately.
+
+    Parameters
+    ----------
+    filters: Iterable[str]
+        API filters. See the API documentations for additional
+        information.
+
+    structure: Dict[str, Union[dict, str]]
+        Structure parameter. See the API documentations for
+        additional information.
+
+    latest_by: Union[str, None]
+        Retrieves the latest value for a specific metric. [Default: ``None``]
+
+    session: Union[aiohttp.ClientSession, None]
+        HTTP session used for all requests made by the instance. Share
+        one session (see ``create_async_session``) between instances to
+        share its connection pool. If ``None`` (default), the instance
+        creates a session of its own on first use, which is closed by
+        ``.close()`` or on exiting an ``async with`` block.
+
+    json_backend: Union[JSONBackend, None]
+        Parses and serialises the data in JSON. If ``None`` (default),
+        the shared backend is used. See ``uk_covid19.json_backend``
+        for additional information.
+
+    observers: Union[Iterable[Observer], None]
+        Receive the events of each query. See ``uk_covid19.instrumentation``
+        for additional information. [Default: ``None``]
+
+    Examples
+    --------
+    >>> async def main():
+    ...     async with create_async_session() as session:
+    ...         queries = [
+    ...             AsyncCov19API(
+    ...                 filters=["areaType=ltla", f"areaName={name}"],
+    ...                 structure={"date": "date", "newCases": "newCasesByPublishDate"},
+    ...                 session=session
+    ...             )
+    ...             for name in ("Adur", "Allerdale", "Amber Valley")
+    ...         ]
+    ...         return await asyncio.gather(*(api.get_json() for api in queries))
+    >>> results = asyncio.run(main())
+    """
+
+    def __init__(self, filters: FiltersType, structure: StructureType,
+                 latest_by: Union[str, None] = None, session=None,
+                 json_backend: Union[JSONBackend, None] = None,
+                 observers: Union[Iterable[Observer], None] = None):
+        super().__init__(
+            filters,
+            structure,
+            latest_by=latest_by,
+            json_backend=json_backend,
+            observers=observers
+        )
+        self._session = session
+        self._owns_session = session is None
+
+    @property
+    def session(self):
+        """
+        :property:
+            HTTP session used for the requests.
+
+        Returns
+        -------
+        aiohttp.ClientSession
+        """
+        if self._session is None:
+            self._session = create_async_session()
+
+        return self._session
+
+    async def close(self):
+        """
+        Closes the session if it was created by the instance.
+        """
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> "AsyncCov19API":
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    @property
+    def last_update(self):
+        """
+        :property:
+            Produces the timestamp for the last update in GMT, requesting
+            the header if the data have not yet been requested. The
+            property must be awaited -- e.g. ``await api.last_update``.
+
+        Returns
+        -------
+        Awaitable[str]
+            Timestamp, formatted as ISO-8601.
+        """
+        return self.get_last_update()
+
+    async def get_last_update(self) -> str:
+        """
+        Produces the timestamp for the last update in GMT, requesting
+        the header if the data have not yet been requested.
+
+        Returns
+        -------
+        str
+            Timestamp, formatted as ISO-8601.
+        """
+        if self._last_update is None:
+            self._last_update = await self._get_last_modified()
+
+        return self._format_last_modified(self._last_update)
+
+    async def _get_last_modified(self, max_age: float = DEFAULT_FRESHNESS_TTL) -> str:
+        """
+        Produces the ``Last-Modified`` header of the query, making a
+        ``HEAD`` request unless the header was received less than
+        ``max_age`` seconds ago.
+
+        Parameters
+        ----------
+        max_age: float
+            Number of seconds for which a header is reused.
+
+        Returns
+        -------
+        str
+        """
+        url = self._get_head_url()
+        last_modified = get_memoised_last_modified(url, max_age)
+
+        if last_modified is None:
+            headers = await self.head()
+            last_modified = headers["Last-Modified"]
+            memoise_last_modified(url, last_modified)
+
+        return last_modified
+
+    async def freshness(self, max_age: float = DEFAULT_FRESHNESS_TTL) -> str:
+        """
+        Produces the timestamp for the last update of the data for the
+        query in GMT, without requesting the data. See
+        ``Cov19API.freshness()`` for additional information.
+
+        Parameters
+        ----------
+        max_age: float
+            Number of seconds for which the timestamp is reused.
+            [Default: ``60``]
+
+        Returns
+        -------
+        str
+            Timestamp, formatted as ISO-8601.
+        """
+        return self._format_last_modified(await self._get_last_modified(max_age))
+
+    async def has_changed_since(self, timestamp: Union[str, datetime],
+                                max_age: float = DEFAULT_FRESHNESS_TTL) -> bool:
+        """
+        Determines whether the data for the query have been updated after
+        ``timestamp``, without requesting the data. See
+        ``Cov19API.has_changed_since()`` for additional information.
+
+        Parameters
+        ----------
+        timestamp: Union[str, datetime]
+            Time of the previous update.
+
+        max_age: float
+            Number of seconds for which the timestamp of the last update
+            is reused. [Default: ``60``]
+
+        Returns
+        -------
+        bool
+        """
+        last_modified = parsedate_to_datetime(await self._get_last_modified(max_age))
+
+        return last_modified > parse_timestamp(timestamp)
+
+    @staticmethod
+    async def get_release_timestamp(session=None) -> str:
+        """
+        :staticmethod:
+            Produces the website timestamp in GMT.
+
+        Parameters
+        ----------
+        session: Union[aiohttp.ClientSession, None]
+            HTTP session used for the request. If ``None``, a temporary
+            session is used. [Default: ``None``]
+
+        Returns
+        -------
+        str
+            Timestamp, formatted as ISO-8601.
+        """
+        if session is None:
+            async with create_async_session() as session:
+                return await AsyncCov19API.get_release_timestamp(session)
+
+        async with session.get(AsyncCov19API.release_timestamp_endpoint) as response:
+            json_data = await response.json()
+
+        return json_data['websiteTimestamp']
+
+    async def head(self):
+        """
+        Request header for the given input arguments (``filters``,
+        ``structure``, and ``lastest_by``).
+
+        Returns
+        -------
+        Mapping[str, str]
+        """
+        params = self.api_params
+
+        async with self.session.head(self.endpoint, params=params) as response:
+            response.raise_for_status()
+            return response.headers
+
+    async def _request_page(self, api_params: dict) -> bytes:
+        """
+        Requests one page of data.
+
+        Parameters
+        ----------
+        api_params: dict
+            Query parameters, including the format and the page number.
+
+        Returns
+        -------
+        bytes
+            Content of the page, or ``None`` if the page has no content.
+
+        Raises
+        ------
+        FailedRequestError
+            When the request fails.
+        """
+        params = {key: str(value) for key, value in api_params.items()}
+        started_at = time()
+        start = perf_counter()
+
+        async with self.session.get(self.endpoint, params=params) as response:
+            latency = perf_counter() - start
+            content = await response.read()
+
+            # Number of bytes received before decompression, where
+            # the version of ``aiohttp`` reports it.
+            compressed = getattr(response.content, "total_raw_bytes", len(content))
+            self._count_transfer(compressed, len(content))
+
+            if self._stats is not None:
+                self._add_page_event(PageEvent(
+                    page=api_params.get("page"),
+                    format=api_params["format"],
+                    status_code=response.status,
+                    attempts=1,
+                    from_cache=False,
+                    started_at=started_at,
+                    latency=latency,
+                    duration=perf_counter() - start,
+                    compressed_bytes=compressed,
+                    decompressed_bytes=len(content)
+                ))
+
+            if response.status >= HTTPStatus.BAD_REQUEST:
+                raise FailedRequestError(response=response, params=api_params, content=content)
+
+            if response.status == HTTPStatus.NO_CONTENT:
+                return None
+
+            self._last_update = response.headers["Last-Modified"]
+
+        return content
+
+    async def _get(self, format_as: DataFormat, concurrency: int = 1) -> AsyncIterator[bytes]:
+        """
+        Extracts paginated data by requesting all of the pages, and
+        records the summary of the query in ``.stats``.
+
+        Parameters
+        ----------
+        format_as: str
+            Response format.
+
+        concurrency: int
+            Number of pages requested in parallel. [Default: ``1``]
+
+        Returns
+        -------
+        AsyncIterator[bytes]
+            Content of the pages, in page order.
+        """
+        stats = self._stats = QueryStats(format_as.value)
+
+        for observer in self.observers:
+            observer.query_started(self, stats)
+
+        start = perf_counter()
+        pages = self._request_pages(format_as, concurrency)
+
+        try:
+            while True:
+                wait_start = perf_counter()
+
+                try:
+                    content = await pages.__anext__()
+                except StopAsyncIteration:
+                    break
+                finally:
+                    stats.wait_time += perf_counter() - wait_start
+
+                yield content
+        finally:
+            await pages.aclose()
+
+            stats.wall_time = perf_counter() - start
+            stats.parse_time = stats.wall_time - stats.wait_time
+
+            for observer in self.observers:
+                observer.query_finished(self, stats)
+
+    async def _request_pages(self, format_as: DataFormat,
+                             concurrency: int = 1) -> AsyncIterator[bytes]:
+        """
+        Extracts paginated data by requesting all of the pages.
+
+        Parameters
+        ----------
+        format_as: str
+            Response format.
+
+        concurrency: int
+            Number of pages requested in parallel. [Default: ``1``]
+
+        Returns
+        -------
+        AsyncIterator[bytes]
+            Content of the pages, in page order.
+
+        Raises
+        ------
+        FailedRequestError
+            When the request fails.
+
+        ValueError
+            If ``concurrency`` is smaller than 1.
+        """
+        if concurrency < 1:
+            raise ValueError(f"Concurrency must be at least 1, got {concurrency}.")
+
+        self._compressed_bytes = 0
+        self._decompressed_bytes = 0
+
+        api_params = self.api_params
+        api_params["format"] = format_as.value
+
+        if self.latest_by is not None:
+            content = await self._request_page(api_params)
+
+            if content is not None:
+                yield content
+
+            return
+
+        pending = deque(
+            (page_num, asyncio.ensure_future(self._request_page({**api_params, "page": page_num})))
+            for page_num in range(1, concurrency + 1)
+        )
+        next_page = concurrency + 1
+
+        try:
+            while pending:
+                page_num, task = pending.popleft()
+                content = await task
+
+                if content is None:
+                    self._total_pages = page_num - 1
+                    break
+
+                task = asyncio.ensure_future(
+                    self._request_page({**api_params, "page": next_page})
+                )
+                pending.append((next_page, task))
+                next_page += 1
+
+                yield content
+        finally:
+            for _, task in pending:
+                task.cancel()
+
+            if pending:
+                await asyncio.gather(*(task for _, task in pending), return_exceptions=True)
+
+    async def iter_pages(self, concurrency: int = 1,
+                         typed: bool = False) -> AsyncIterator[List[Dict]]:
+        """
+        Produces the data one page at a time, as soon as each page
+        is received.
+
+        Parameters
+        ----------
+        concurrency: int
+            Number of pages requested in parallel. [Default: ``1``]
+
+        typed: bool
+            If ``True``, the records are instances of ``.record_type``
+            rather than dictionaries. [Default: ``False``]
+
+        Returns
+        -------
+        AsyncIterator[List[Dict]]
+            Records of each page.
+
+        Examples
+        --------
+        >>> async for page in api.iter_pages():
+        ...     process(page)
+        """
+        backend = self.json_backend
+        record_type = self.record_type if typed else None
+
+        async for content in self._get(DataFormat.JSON, concurrency):
+            yield backend.decode_page(content, record_type)
+
+    async def iter_records(self, concurrency: int = 1,
+                           typed: bool = False) -> AsyncIterator[Dict]:
+        """
+        Produces the data one record at a time, as each page is received.
+
+        Parameters
+        ----------
+        concurrency: int
+            Number of pages requested in parallel. [Default: ``1``]
+
+        typed: bool
+            If ``True``, the records are instances of ``.record_type``
+            rather than dictionaries. [Default: ``False``]
+
+        Returns
+        -------
+        AsyncIterator[Dict]
+        """
+        async for page_data in self.iter_pages(concurrency, typed=typed):
+            for record in page_data:
+                yield record
+
+    async def iter_xml_elements(self, concurrency: int = 1,
+                                clear: bool = False) -> AsyncIterator[XMLElement]:
+        """
+        Produces the data in XML one ``data`` element at a time, as each
+        page is received. See ``Cov19API.iter_xml_elements()`` for
+        additional information.
+
+        Parameters
+        ----------
+        concurrency: int
+            Number of pages requested in parallel. [Default: ``1``]
+
+        clear: bool
+            If ``True``, the content of each element is discarded once the
+            next element is requested. [Default: ``False``]
+
+        Returns
+        -------
+        AsyncIterator[xml.etree.ElementTree.Element]
+        """
+        async for content in self._get(DataFormat.XML, concurrency):
+            for elm in iter_xml_data((content,), clear=clear):
+                yield elm
+
+    async def iter_csv_lines(self, concurrency: int = 1) -> AsyncIterator[str]:
+        """
+        Produces the data in CSV one line at a time, as each page is
+        received. The first line contains the column names; the lines
+        do not include a line break.
+
+        Parameters
+        ----------
+        concurrency: int
+            Number of pages requested in parallel. [Default: ``1``]
+
+        Returns
+        -------
+        AsyncIterator[str]
+
+        Raises
+        ------
+        ValueError
+            If the structure is nested.
+        """
+        self._validate_flat_structure()
+
+        async for chunk in self._iter_csv_chunks(concurrency):
+            for line in chunk.decode().split("\n"):
+                if line:
+                    yield line
+
+    async def _iter_csv_chunks(self, concurrency: int = 1) -> AsyncIterator[bytes]:
+        """
+        Produces the data in CSV as raw bytes, one page at a time. See
+        ``Cov19API._iter_csv_chunks()`` for additional information.
+
+        Parameters
+        ----------
+        concurrency: int
+            Number of pages requested in parallel. [Default: ``1``]
+
+        Returns
+        -------
+        AsyncIterator[bytes]
+        """
+        header = None
+
+        async for content in self._get(DataFormat.CSV, concurrency):
+            header, chunk = prepare_csv_page(content, header)
+
+            if chunk:
+                yield chunk
+
+    async def _get_extras(self, length: int) -> dict:
+        """
+        Metadata appended to the data in JSON and XML outputs.
+
+        Parameters
+        ----------
+        length: int
+            Number of records.
+
+        Returns
+        -------
+        dict
+        """
+        return {
+            "lastUpdate": await self.get_last_update(),
+            "length": length,
+            "totalPages": self._total_pages
+        }
+
+    async def _iter_json_document(self, concurrency: int = 1,
+                                  collect: Union[list, None] = None) -> AsyncIterator[str]:
+        """
+        Produces the JSON output one page at a time.
+
+        Parameters
+        ----------
+        concurrency: int
+            Number of pages requested in parallel. [Default: ``1``]
+
+        collect: Union[list, None]
+            If defined, the records are also appended to this list.
+            [Default: ``None``]
+
+        Returns
+        -------
+        AsyncIterator[str]
+        """
+        backend = self.json_backend
+        length = 0
+
+        yield '{"data":['
+
+        async for content in self._get(DataFormat.JSON, concurrency):
+            chunk, page_length = backend.extract_data(content, collect)
+
+            if not page_length:
+                continue
+
+            yield ("," if length else "") + chunk
+
+            length += page_length
+
+        extras = backend.dumps(await self._get_extras(length=length))
+
+        # Appends the extras to the outer object.
+        yield "]," + extras[1:]
+
+    async def _iter_xml_document(self, concurrency: int = 1,
+                                 collect: Union[XMLElement, None] = None) -> AsyncIterator[str]:
+        """
+        Produces the XML output one page at a time.
+
+        Parameters
+        ----------
+        concurrency: int
+            Number of pages requested in parallel. [Default: ``1``]
+
+        collect: Union[XMLElement, None]
+            If defined, the ``data`` elements are also appended to this
+            element. [Default: ``None``]
+
+        Returns
+        -------
+        AsyncIterator[str]
+        """
+        length = 0
+
+        yield f'<document xmlns:xsi="{XSI_NAMESPACE}">'
+
+        async for content in self._get(DataFormat.XML, concurrency):
+            chunk, page_length = self._format_xml_page(content, collect)
+            length += page_length
+
+            yield chunk
+
+        yield self._format_xml_extras(await self._get_extras(length=length))
+
+    async def _iter_csv_document(self, concurrency: int = 1,
+                                 collect: Union[BytesIO, None] = None) -> AsyncIterator[str]:
+        """
+        Produces the CSV output one page at a time.
+
+        Parameters
+        ----------
+        concurrency: int
+            Number of pages requested in parallel. [Default: ``1``]
+
+        collect: Union[BytesIO, None]
+            If defined, the rows are also written to this buffer.
+            [Default: ``None``]
+
+        Returns
+        -------
+        AsyncIterator[str]
+        """
+        async for chunk in self._iter_csv_chunks(concurrency):
+            if collect is not None:
+                collect.write(chunk)
+
+            yield chunk.decode()
+
+    async def _iter_arrow_tables(self, schema,
+                                 concurrency: int = 1) -> AsyncIterator["pyarrow.Table"]:
+        """
+        Produces the data as an Apache Arrow table per page.
+
+        Parameters
+        ----------
+        schema: pyarrow.Schema
+            Schema of the tables.
+
+        concurrency: int
+            Number of pages requested in parallel. [Default: ``1``]
+
+        Returns
+        -------
+        AsyncIterator[pyarrow.Table]
+        """
+        async for content in self._get(DataFormat.CSV, concurrency):
+            if content.strip():
+                yield read_csv_table(content, schema)
+
+    async def export(self, path: str, concurrency: int = 1) -> NoReturn:
+        """
+        Saves the full data (all pages) in a file, as each page is
+        received. See ``Cov19API.export()`` for additional information.
+
+        Parameters
+        ----------
+        path: str
+            Path to the file. The format is determined by the extension
+            of the file -- i.e. ``.json``, ``.xml``, ``.csv``, ``.parquet``
+            or ``.feather``. The ``pyarrow`` library must be installed
+            separately to save Parquet and Feather files.
+
+        concurrency: int
+            Number of pages requested in parallel. [Default: ``1``]
+
+        Returns
+        -------
+        NoReturn
+
+        Raises
+        ------
+        ValueError
+            If the extension of the file is not supported.
+        """
+        format_as = self._get_export_format(path)
+
+        if isinstance(format_as, ArrowFormat):
+            self._validate_flat_structure()
+            schema = get_arrow_schema(self._get_flat_structure())
+
+            with open_table_writer(schema, path, format_as) as write_table:
+                async for table in self._iter_arrow_tables(schema, concurrency):
+                    write_table(table)
+
+            return
+
+        documents = {
+            DataFormat.JSON: self._iter_json_document,
+            DataFormat.XML: self._iter_xml_document,
+            DataFormat.CSV: self._iter_csv_document
+        }
+
+        if format_as == DataFormat.CSV:
+            self._validate_flat_structure()
+
+        with open_data_file(path, format_as) as pointer:
+            async for chunk in documents[format_as](concurrency):
+                pointer.write(chunk)
+
+    async def sync(self, store: BaseStore, lookback: int = 3,
+                   end_date: Union[date, None] = None, concurrency: int = 1) -> int:
+        """
+        Brings a local store of records up to date, by requesting only
+        the data released since its latest date. See ``Cov19API.sync()``
+        for additional information.
+
+        Parameters
+        ----------
+        store: BaseStore
+            Local store of records -- e.g. ``JSONStore``.
+
+        lookback: int
+            Number of days before the latest date in the store that are
+            requested again, to capture revisions. [Default: ``3``]
+
+        end_date: Union[date, None]
+            Last date to request. If ``None``, today's date (UTC) is used.
+            [Default: ``None``]
+
+        concurrency: int
+            Number of pages requested in parallel. [Default: ``1``]
+
+        Returns
+        -------
+        int
+            Number of records received and upserted.
+
+        Raises
+        ------
+        ValueError
+            If the query cannot be synchronised incrementally. See
+            ``Cov19API.sync()`` for additional information.
+        """
+        dates = self._get_sync_dates(store, lookback, end_date)
+
+        if dates is None:
+            queries = [self]
+        else:
+            queries = list()
+
+            for day in dates:
+                query = AsyncCov19API(
+                    filters=[*self.filters, f"date={day}"],
+                    structure=self.structure,
+                    session=self.session,
+                    json_backend=self._json_backend,
+                    observers=self.observers
+                )
+                query.endpoint = self.endpoint
+                queries.append(query)
+
+        total = 0
+        last_update = None
+
+        for query in queries:
+            async for page_data in query.iter_pages(concurrency):
+                store.upsert(page_data)
+                total += len(page_data)
+
+            last_update = query._last_update or last_update
+
+        if last_update is not None:
+            self._last_update = last_update
+            last_update = self._format_last_modified(last_update)
+
+        store.save(last_update=last_update)
+
+        return total
+
+    async def get_json(self, save_as: Union[str, None] = None,
+                       as_string: bool = False, concurrency: int = 1) -> Union[dict, str]:
+        """
+        Provides full data (all pages) in JSON.
+
+        Parameters
+        ----------
+        save_as: Union[str, None]
+            If defined, the results will (also) be saved as a
+            file. [Default: ``None``]
+
+        as_string: bool
+            If ``False`` (default), returns the data as a dictionary.
+            Otherwise, returns the data as a JSON string.
+
+        concurrency: int
+            Number of pages requested in parallel. [Default: ``1``]
+
+        Returns
+        -------
+        Union[Dict, str]
+        """
+        if as_string:
+            return str.join("", [chunk async for chunk in self._iter_json_document(concurrency)])
+
+        resp = {
+            "data": list()
+        }
+
+        if save_as is None:
+            async for page_data in self.iter_pages(concurrency):
+                resp["data"].extend(page_data)
+        else:
+            # Each page is written as it is received, as with ``.export()``.
+            with open_data_file(save_as, DataFormat.JSON) as pointer:
+                async for chunk in self._iter_json_document(concurrency, collect=resp["data"]):
+                    pointer.write(chunk)
+
+        resp["lastUpdate"] = await self.get_last_update()
+        resp["length"] = len(resp["data"])
+        resp["totalPages"] = self._total_pages
+
+        return resp
+
+    async def get_records(self, concurrency: int = 1) -> RecordSet:
+        """
+        Provides full data (all pages) as a compact ``RecordSet``.
+
+        Parameters
+        ----------
+        concurrency: int
+            Number of pages requested in parallel. [Default: ``1``]
+
+        Returns
+        -------
+        RecordSet
+
+        Raises
+        ------
+        ValueError
+            If the structure is nested.
+        """
+        self._validate_flat_structure()
+
+        records = RecordSet(self._get_flat_structure())
+
+        async for page_data in self.iter_pages(concurrency):
+            records.extend(page_data)
+
+        return records
+
+    async def get_xml(self, save_as=None, as_string=False, concurrency: int = 1) -> XMLElement:
+        """
+        Provides full data (all pages) in XML.
+
+        Parameters
+        ----------
+        save_as: Union[str, None]
+            If defined, the results will (also) be saved as a
+            file. [Default: ``None``]
+
+        as_string: bool
+            If ``False`` (default), returns an ``ElementTree``
+            object. Otherwise, returns the data as an XML string.
+
+        concurrency: int
+            Number of pages requested in parallel. [Default: ``1``]
+
+        Returns
+        -------
+        xml.etree.ElementTree.Element
+        """
+        from xml.etree.ElementTree import SubElement
+
+        if as_string:
+            return str.join("", [chunk async for chunk in self._iter_xml_document(concurrency)])
+
+        resp = XMLElement("document")
+
+        if save_as is None:
+            async for elm in self.iter_xml_elements(concurrency):
+                resp.append(elm)
+        else:
+            with open_data_file(save_as, DataFormat.XML) as pointer:
+                async for chunk in self._iter_xml_document(concurrency, collect=resp):
+                    pointer.write(chunk)
+
+        extras = await self._get_extras(length=len(resp))
+
+        for elm_name, value in extras.items():
+            elm = SubElement(resp, elm_name)
+            elm.text = str(value)
+
+        return resp
+
+    async def get_csv(self, save_as=None, concurrency: int = 1) -> str:
+        """
+        Provides full data (all pages) in CSV.
+
+        Parameters
+        ----------
+        save_as: Union[str, None]
+            If defined, the results will (also) be saved as a
+            file. [Default: ``None``]
+
+        concurrency: int
+            Number of pages requested in parallel. [Default: ``1``]
+
+        Returns
+        -------
+        str
+
+        Raises
+        ------
+        ValueError
+            If the structure is nested, or if the column names of the
+            pages differ.
+        """
+        self._validate_flat_structure()
+
+        buffer = BytesIO()
+
+        if save_as is None:
+            async for chunk in self._iter_csv_chunks(concurrency):
+                buffer.write(chunk)
+        else:
+            with open_data_file(save_as, DataFormat.CSV) as pointer:
+                async for chunk in self._iter_csv_document(concurrency, collect=buffer):
+                    pointer.write(chunk)
+
+        return buffer.getvalue().decode()
+
+    async def get_arrow(self, save_as: Union[str, None] = None, concurrency: int = 1):
+        """
+        Provides full data (all pages) as an Apache Arrow table. See
+        ``Cov19API.get_arrow()`` for additional information.
+
+        .. warning::
+
+            The ``pyarrow`` library is not included in the dependencies of this
+            library and must be installed separately.
+
+        Parameters
+        ----------
+        save_as: Union[str, None]
+            If defined, the results will (also) be saved as a
+            file. [Default: ``None``]
+
+            The value must be a path to a file with the correct
+            extension -- i.e. ``.parquet`` for Parquet, or ``.feather``
+            for Feather.
+
+        concurrency: int
+            Number of pages requested in parallel. [Default: ``1``]
+
+        Returns
+        -------
+        pyarrow.Table
+
+        Raises
+        ------
+        ImportError
+            If the ``pyarrow`` library is not installed.
+
+        ValueError
+            If the structure is nested, or if ``save_as`` does not end
+            with a supported extension.
+        """
+        self._validate_flat_structure()
+
+        schema = get_arrow_schema(self._get_flat_structure())
+        tables = list()
+
+        from pyarrow import concat_tables
+
+        if save_as is None:
+            async for table in self._iter_arrow_tables(schema, concurrency):
+                tables.append(table)
+        else:
+            format_as = self._get_arrow_format(save_as)
+
+            with open_table_writer(schema, save_as, format_as) as write_table:
+                async for table in self._iter_arrow_tables(schema, concurrency):
+                    write_table(table)
+                    tables.append(table)
+
+        if not tables:
+            return schema.empty_table()
+
+        return concat_tables(tables).unify_dictionaries()
+
+    async def get_dataframe(self, concurrency: int = 1):
+        """
+        Provides the data as as ``pandas.DataFrame`` object. See
+        ``Cov19API.get_dataframe()`` for additional information.
+
+        .. warning::
+
+            The ``pandas`` library is not included in the dependencies of this
+            library and must be installed separately.
+
+        Parameters
+        ----------
+        concurrency: int
+            Number of pages requested in parallel. [Default: ``1``]
+
+        Returns
+        -------
+        DataFrame
+
+        Raises
+        ------
+        ImportError
+            If the ``pandas`` library is not installed.
+        """
+        try:
+            from pandas import DataFrame
+        except ImportError:
+            raise ImportError(
+                "The `pandas` library is not installed as a part of the `uk-covid19` "
+                "library. Please install the library and try again."
+            )
+
+        try:
+            self._validate_flat_structure()
+        except ValueError:
+            # Nested structures cannot be expressed as columns.
+            data = await self.get_json(concurrency=concurrency)
+            return DataFrame(data["data"])
+
+        buffer = BytesIO()
+
+        async for chunk in self._iter_csv_chunks(concurrency):
+            buffer.write(chunk)
+
+        return self._read_dataframe(buffer)
@@ -0,0 +1,214 @@
+#!/usr/bin python3
+
+# Imports
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Python:
+from typing import (
+    Union, Dict, Hashable, Any, Mapping, Iterable, Iterator, NamedTuple, Tuple
+)
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# 3rd party:
+from requests import Session
+
+# Internal:
+from uk_covid19.api_interface import Cov19API
+from uk_covid19.connection import create_session, DEFAULT_POOL_MAXSIZE
+from uk_covid19.rate_limit import RateLimiter
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+__all__ = [
+    'BatchResult',
+    'iter_batch',
+    'run_batch'
+]
+
+
+QueryType = Union[Cov19API, Dict[str, Any]]
+QueriesType = Union[Mapping[Hashable, QueryType], Iterable[QueryType]]
+
+
+class BatchResult(NamedTuple):
+    """
+    Outcome of a batch of queries.
+
+    .. versionadded:: 1.3.0
+
+    Attributes
+    ----------
+    results: Dict[Hashable, Any]
+        Data produced by each successful query, keyed by query.
+
+    errors: Dict[Hashable, Exception]
+        Exception raised by each failed query, keyed by query.
+    """
+    results: Dict[Hashable, Any]
+    errors: Dict[Hashable, Exception]
+
+
+def _prepare_queries(queries: QueriesType, session: Session,
+                     rate_limiter: Union[RateLimiter, None]) -> Dict[Hashable, Cov19API]:
+    if not isinstance(queries, Mapping):
+        queries = dict(enumerate(queries))
+
+    prepared = dict()
+
+    for key, query in queries.items():
+        if not isinstance(query, Cov19API):
+            query = Cov19API(session=session, rate_limiter=rate_limiter, **query)
+
+        prepared[key] = query
+
+    return prepared
+
+
+def iter_batch(queries: QueriesType, max_workers: int = 8, method: str = "get_json",
+               session: Union[Session, None] = None,
+               rate_limiter: Union[RateLimiter, None] = None,
+               **kwargs) -> Iterator[Tuple[Hashable, Any, Union[Exception, None]]]:
+    """
+    Runs many queries concurrently, and produces the outcome of each
+    query as soon as it is complete. If the iteration stops early, the
+    queries that have not started are cancelled.
+
+    .. versionadded:: 1.3.0
+
+    Parameters
+    ----------
+    queries: Union[Mapping[Hashable, QueryType], Iterable[QueryType]]
+        Queries, as ``Cov19API`` instances or as dictionaries of arguments
+        for ``Cov19API`` -- i.e. ``filters``, ``structure``, and optionally
+        ``latest_by``. If the queries are not a mapping, they are keyed by
+        their position.
+
+    max_workers: int
+        Maximum number of queries that run at the same time. [Default: ``8``]
+
+    method: str
+        Name of the ``Cov19API`` method used to run each query.
+        [Default: ``"get_json"``]
+
+    session: Union[Session, None]
+        HTTP session used by the queries that are defined as dictionaries.
+        If ``None``, the shared session is used, unless ``max_workers``
+        exceeds the size of its connection pool; a session with a large
+        enough pool is then created for the batch. [Default: ``None``]
+
+    rate_limiter: Union[RateLimiter, None]
+        Rate limiter shared by the queries that are defined as dictionaries,
+        so that the limits apply to the batch as a whole. Queries defined as
+        ``Cov19API`` instances use their own limiter, if any.
+        [Default: ``None``]
+
+    **kwargs
+        Arguments passed to ``method``.
+
+    Returns
+    -------
+    Iterator[Tuple[Hashable, Any, Union[Exception, None]]]
+        Key, data, and exception of each query. The data are ``None`` if
+        the query failed, and the exception is ``None`` if it succeeded.
+
+    Examples
+    --------
+    >>> queries = {
+    ...     name: {
+    ...         "filters": ["areaType=ltla", f"areaName={name}"],
+    ...         "structure": {"date": "date", "newCases": "newCasesByPublishDate"}
+    ...     }
+    ...     for name in ("Adur", "Allerdale", "Amber Valley")
+    ... }
+    >>> for name, data, error in iter_batch(queries, max_workers=4):
+    ...     print(name, error or data["length"])
+    Allerdale 231
+    Adur 229
+    Amber Valley 230
+    """
+    batch_session = None
+
+    if session is None and max_workers > DEFAULT_POOL_MAXSIZE:
+        session = batch_session = create_session(pool_maxsize=max_workers)
+
+    prepared = _prepare_queries(queries, session, rate_limiter)
+
+    def run(query: Cov19API):
+        return getattr(query, method)(**kwargs)
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    futures = dict()
+
+    try:
+        for key, query in prepared.items():
+            futures[executor.submit(run, query)] = key
+
+        for future in as_completed(futures):
+            key = futures[future]
+
+            try:
+                yield key, future.result(), None
+            except Exception as err:
+                yield key, None, err
+    finally:
+        # If the iteration stops early -- e.g. on ``break`` -- the queries
+        # that have not started are cancelled; only those already running
+        # are waited for.
+        for future in futures:
+            future.cancel()
+
+        executor.shutdown(wait=True)
+
+        if batch_session is not None:
+            batch_session.close()
+
+
+def run_batch(queries: QueriesType, max_workers: int = 8, method: str = "get_json",
+              session: Union[Session, None] = None,
+              rate_limiter: Union[RateLimiter, None] = None, **kwargs) -> BatchResult:
+    """
+    Runs many queries concurrently. Failed queries do not interrupt
+    the batch; their exceptions are collected instead.
+
+    .. versionadded:: 1.3.0
+
+    Parameters
+    ----------
+    queries: Union[Mapping[Hashable, QueryType], Iterable[QueryType]]
+        Queries, as ``Cov19API`` instances or as dictionaries of arguments
+        for ``Cov19API``. See ``iter_batch`` for additional information.
+
+    max_workers: int
+        Maximum number of queries that run at the same time. [Default: ``8``]
+
+    method: str
+        Name of the ``Cov19API`` method used to run each query.
+        [Default: ``"get_json"``]
+
+    session: Union[Session, None]
+        HTTP session used by the queries that are defined as dictionaries.
+        [Default: ``None``]
+
+    rate_limiter: Union[RateLimiter, None]
+        Rate limiter shared by the queries that are defined as dictionaries.
+        [Default: ``None``]
+
+    **kwargs
+        Arguments passed to ``method``.
+
+    Returns
+    -------
+    BatchResult
+    """
+    results = dict()
+    errors = dict()
+
+    batch = iter_batch(queries, max_workers=max_workers, method=method,
+                       session=session, rate_limiter=rate_limiter, **kwargs)
+
+    for key, data, error in batch:
+        if error is not None:
+            errors[key] = error
+        else:
+            results[key] = data
+
+    return BatchResult(results=results, errors=errors)
@@ -0,0 +1,492 @@
+#!/usr/bin python3
+
+# Imports
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Python:
+from typing import Union, Dict, NamedTuple, Callable
+from collections import OrderedDict
+from hashlib import sha256
+from threading import RLock
+from time import time
+from json import dumps, loads
+import os
+
+# 3rd party:
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+# Internal:
+from uk_covid19.utils import temporary_path
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+__all__ = [
+    'ResponseCache',
+    'CacheEntry'
+]
+
+
+# Headers that describe the transfer rather than the content, and
+# no longer apply once the content has been decoded.
+EXCLUDED_HEADERS = {
+    "content-encoding",
+    "content-length",
+    "transfer-encoding",
+    "connection",
+    "keep-alive"
+}
+
+
+def _get_max_age(headers: Dict[str, str]) -> Union[int, None]:
+    cache_control = CaseInsensitiveDict(headers).get("Cache-Control", "")
+
+    for directive in cache_control.split(","):
+        name, _, value = directive.strip().partition("=")
+
+        if name.lower() in ("no-store", "no-cache"):
+            return 0
+        elif name.lower() == "max-age":
+            try:
+                return int(value)
+            except ValueError:
+                return None
+
+    return None
+
+
+class CacheEntry(NamedTuple):
+    """
+    Response stored in the cache.
+
+    .. versionadded:: 1.3.0
+    """
+    url: str
+    status_code: int
+    headers: Dict[str, str]
+    stored_at: float
+    content: bytes
+
+    def is_fresh(self, default_max_age: int = 0) -> bool:
+        """
+        Whether the entry may be used without revalidating it with
+        the server, based on its ``Cache-Control`` header.
+
+        Parameters
+        ----------
+        default_max_age: int
+            Number of seconds for which the entry remains fresh if the
+            response did not define a ``max-age``. [Default: ``0``]
+
+        Returns
+        -------
+        bool
+        """
+        max_age = _get_max_age(self.headers)
+
+        if max_age is None:
+            max_age = default_max_age
+
+        return time() - self.stored_at < max_age
+
+    @property
+    def validators(self) -> Dict[str, str]:
+        """
+        Headers used to make a conditional request for the entry.
+
+        Returns
+        -------
+        Dict[str, str]
+        """
+        headers = CaseInsensitiveDict(self.headers)
+        validators = dict()
+
+        if "ETag" in headers:
+            validators["If-None-Match"] = headers["ETag"]
+
+        if "Last-Modified" in headers:
+            validators["If-Modified-Since"] = headers["Last-Modified"]
+
+        return validators
+
+    def to_response(self) -> Response:
+        """
+        Produces a ``requests.Response`` object equivalent to the
+        response from which the entry was created.
+
+        Returns
+        -------
+        Response
+        """
+        response = Response()
+        response.status_code = self.status_code
+        response.reason = "OK"
+        response.url = self.url
+        response.headers = CaseInsensitiveDict(self.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = self.content
+
+        return response
+
+
+class ResponseCache:
+    """
+    On-disk cache of API responses.
+
+    Fresh entries -- i.e. those within the ``max-age`` of their
+    ``Cache-Control`` header -- are used without making a request.
+    Once stale, entries are revalidated with a conditional request
+    (``If-None-Match`` / ``If-Modified-Since``), and are only downloaded
+    again if they have changed.
+
+    .. versionadded:: 1.3.0
+
+    Parameters
+    ----------
+    directory: str
+        Path to the directory in which the responses are stored. The
+        directory is created if it does not exist.
+
+    max_size: Union[int, None]
+        Maximum total size of the stored responses in bytes. The least
+        recently used responses are removed once the size is exceeded.
+        If ``None``, the size is not limited. [Default: ``None``]
+
+    default_max_age: int
+        Number of seconds for which a response remains fresh if the
+        server does not define a ``max-age``. [Default: ``0``]
+
+    release_aware: bool
+        If ``True``, the stored responses remain fresh for as long as
+        the website timestamp (see ``Cov19API.get_release_timestamp()``)
+        is unchanged, and are all removed once it changes. Given that
+        the data only change when they are released, this allows all
+        cached queries to be served with no requests other than one to
+        check the timestamp. [Default: ``False``]
+
+    release_check_interval: float
+        Minimum number of seconds between two checks of the website
+        timestamp when ``release_aware`` is ``True``. [Default: ``60``]
+
+    Examples
+    --------
+    >>> cache = ResponseCache("some_directory/cache", max_size=512 * 1024 ** 2)
+    >>> api = Cov19API(
+    ...     filters=["areaType=nation"],
+    ...     structure={"date": "date", "newCases": "newCasesByPublishDate"},
+    ...     cache=cache
+    ... )
+    >>> data = api.get_json()  # Requested from the API.
+    >>> data = api.get_json()  # Retrieved from the cache.
+
+    >>> cache = ResponseCache("some_directory/cache", release_aware=True)
+    """
+
+    _metadata_ext = ".json"
+    _content_ext = ".body"
+    _release_filename = "release.txt"
+
+    def __init__(self, directory: str, max_size: Union[int, None] = None,
+                 default_max_age: int = 0, release_aware: bool = False,
+                 release_check_interval: float = 60):
+        self.directory = os.path.abspath(directory)
+        self.max_size = max_size
+        self.default_max_age = default_max_age
+        self.release_aware = release_aware
+        self.release_check_interval = release_check_interval
+
+        self._lock = RLock()
+        self._index: Union[OrderedDict, None] = None
+        self._size = 0
+        self._release_checked_at: Union[float, None] = None
+
+        os.makedirs(self.directory, exist_ok=True)
+
+    @property
+    def size(self) -> int:
+        """
+        :property:
+            Total size of the stored responses in bytes.
+
+        Returns
+        -------
+        int
+        """
+        with self._lock:
+            self._load_index()
+            return self._size
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._load_index()
+            return len(self._index)
+
+    @staticmethod
+    def _get_key(url: str) -> str:
+        return sha256(url.encode()).hexdigest()
+
+    def _get_paths(self, key: str):
+        base = os.path.join(self.directory, key)
+        return base + self._metadata_ext, base + self._content_ext
+
+    def _load_index(self):
+        """
+        Builds the index of stored responses, ordered from the least to
+        the most recently used, from the contents of the directory.
+        """
+        if self._index is not None:
+            return
+
+        entries = list()
+
+        for filename in os.listdir(self.directory):
+            key, ext = os.path.splitext(filename)
+
+            if ext != self._content_ext:
+                continue
+
+            stat = os.stat(os.path.join(self.directory, filename))
+            entries.append((stat.st_mtime, key, stat.st_size))
+
+        self._index = OrderedDict(
+            (key, size)
+            for _, key, size in sorted(entries)
+        )
+        self._size = sum(self._index.values())
+
+    @staticmethod
+    def _write(path: str, data: bytes):
+        # Instances that share the directory -- e.g. in different
+        # threads -- write to temporary files of their own.
+        with temporary_path(path) as temp_path:
+            with open(temp_path, "xb") as pointer:
+                pointer.write(data)
+
+    def _remove(self, key: str):
+        for path in self._get_paths(key):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+        self._size -= self._index.pop(key, 0)
+
+    def get(self, url: str) -> Union[CacheEntry, None]:
+        """
+        Retrieves the response stored for ``url``.
+
+        Parameters
+        ----------
+        url: str
+            Full URL of the request, including the query.
+
+        Returns
+        -------
+        Union[CacheEntry, None]
+            Stored response, or ``None`` if there is none.
+        """
+        key = self._get_key(url)
+        metadata_path, content_path = self._get_paths(key)
+
+        with self._lock:
+            self._load_index()
+
+            if key not in self._index:
+                return None
+
+            try:
+                with open(metadata_path, "r") as pointer:
+                    metadata = loads(pointer.read())
+
+                with open(content_path, "rb") as pointer:
+                    content = pointer.read()
+            except (OSError, ValueError):
+                self._remove(key)
+                return None
+
+            # Marks the entry as the most recently used.
+            self._index.move_to_end(key)
+            os.utime(content_path)
+
+        return CacheEntry(content=content, **metadata)
+
+    def set(self, url: str, response: Response) -> CacheEntry:
+        """
+        Stores a response, replacing any response previously stored
+        for the same URL.
+
+        Parameters
+        ----------
+        url: str
+            Full URL of the request, including the query.
+
+        response: Response
+            Response whose content has already been downloaded.
+
+        Returns
+        -------
+        CacheEntry
+        """
+        headers = {
+            key: value
+            for key, value in response.headers.items()
+            if key.lower() not in EXCLUDED_HEADERS
+        }
+
+        entry = CacheEntry(
+            url=url,
+            status_code=response.status_code,
+            headers=headers,
+            stored_at=time(),
+            content=response.content
+        )
+
+        self._store(entry)
+
+        return entry
+
+    def refresh(self, entry: CacheEntry, response: Response) -> CacheEntry:
+        """
+        Renews an entry that the server has confirmed to be unchanged
+        (``304 Not Modified``), updating its headers.
+
+        Parameters
+        ----------
+        entry: CacheEntry
+            Stored response.
+
+        response: Response
+            ``304 Not Modified`` response.
+
+        Returns
+        -------
+        CacheEntry
+        """
+        headers = CaseInsensitiveDict(entry.headers)
+
+        for key, value in response.headers.items():
+            if key.lower() not in EXCLUDED_HEADERS:
+                headers[key] = value
+
+        entry = entry._replace(headers=dict(headers), stored_at=time())
+
+        self._store(entry)
+
+        return entry
+
+    def _store(self, entry: CacheEntry):
+        key = self._get_key(entry.url)
+        metadata_path, content_path = self._get_paths(key)
+
+        metadata = entry._asdict()
+        metadata.pop("content")
+
+        with self._lock:
+            self._load_index()
+
+            self._remove(key)
+
+            self._write(metadata_path, dumps(metadata).encode())
+            self._write(content_path, entry.content)
+
+            self._index[key] = len(entry.content)
+            self._size += len(entry.content)
+
+            self._evict()
+
+    def _evict(self):
+        """
+        Removes the least recently used entries until the total size
+        is within ``max_size``.
+        """
+        if self.max_size is None:
+            return
+
+        while self._index and self._size > self.max_size:
+            key = next(iter(self._index))
+            self._remove(key)
+
+    def clear(self):
+        """
+        Removes all stored responses.
+        """
+        with self._lock:
+            self._load_index()
+
+            for key in list(self._index):
+                self._remove(key)
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        """
+        Whether a stored response may be used without revalidating it
+        with the server.
+
+        Parameters
+        ----------
+        entry: CacheEntry
+            Stored response.
+
+        Returns
+        -------
+        bool
+        """
+        if self.release_aware:
+            return True
+
+        return entry.is_fresh(self.default_max_age)
+
+    @property
+    def release_timestamp(self) -> Union[str, None]:
+        """
+        :property:
+            Website timestamp of the release to which the stored responses
+            belong, if ``release_aware`` is ``True``.
+
+        Returns
+        -------
+        Union[str, None]
+        """
+        path = os.path.join(self.directory, self._release_filename)
+
+        try:
+            with open(path, "r") as pointer:
+                return pointer.read().strip() or None
+        except FileNotFoundError:
+            return None
+
+    def check_release(self, get_release_timestamp: Callable[[], str]) -> bool:
+        """
+        Removes all stored responses if a new release has been published
+        since they were stored. The website timestamp is requested at most
+        once every ``release_check_interval`` seconds; other calls return
+        immediately.
+
+        Parameters
+        ----------
+        get_release_timestamp: Callable[[], str]
+            Function that produces the current website timestamp -- e.g.
+            ``Cov19API.get_release_timestamp``.
+
+        Returns
+        -------
+        bool
+            Whether the stored responses were removed.
+        """
+        with self._lock:
+            checked_at = self._release_checked_at
+
+            if checked_at is not None and time() - checked_at < self.release_check_interval:
+                return False
+
+            timestamp = get_release_timestamp()
+            self._release_checked_at = time()
+
+            if timestamp == self.release_timestamp:
+                return False
+
+            self.clear()
+
+            path = os.path.join(self.directory, self._release_filename)
+            self._write(path, timestamp.encode())
+
+            return True
@@ -0,0 +1,324 @@
+#!/usr/bin python3
+
+# Imports
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Python:
+from typing import Union, NamedTuple
+from hashlib import sha256
+from threading import RLock
+from time import time
+from json import dumps, loads
+import shutil
+import os
+
+# 3rd party:
+from requests import Response
+
+# Internal:
+from uk_covid19.cache import CacheEntry, EXCLUDED_HEADERS
+from uk_covid19.utils import temporary_path
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+__all__ = [
+    'Checkpoint',
+    'CheckpointState'
+]
+
+
+class CheckpointState(NamedTuple):
+    """
+    Progress of an extract.
+
+    .. versionadded:: 1.3.0
+
+    Attributes
+    ----------
+    url: str
+        URL of the query, including the format but excluding the
+        page number.
+
+    last_modified: str
+        ``Last-Modified`` header of the first page -- i.e. the version
+        of the data to which all of the stored pages belong.
+
+    next_page: int
+        Number of the first page that has not been stored.
+
+    updated_at: float
+        Time at which the last page was stored, in seconds since
+        the epoch.
+    """
+    url: str
+    last_modified: str
+    next_page: int
+    updated_at: float
+
+
+class Checkpoint:
+    """
+    On-disk record of the pages received by extracts, from which
+    interrupted extracts are resumed.
+
+    Each page is stored once it has been received, along with the
+    number of the next page. When the same query is made again -- e.g.
+    after the process has been restarted -- the stored pages are
+    produced from the disk, and the extract continues from the next
+    page. The stored pages of a query are removed once all of its
+    pages have been received.
+
+    Extracts are only resumed if the data have not been updated since
+    the first page was received -- i.e. if the ``Last-Modified`` header
+    of the query is unchanged. Otherwise, the stored pages are removed
+    and the extract restarts from the first page.
+
+    .. versionadded:: 1.3.0
+
+    Parameters
+    ----------
+    directory: str
+        Path to the directory in which the pages are stored. It is
+        created if it does not exist.
+
+    Examples
+    --------
+    >>> checkpoint = Checkpoint("extracts")
+    >>> api = Cov19API(filters, structure, checkpoint=checkpoint)
+    >>> data = api.get_json()  # Resumes from the last page stored, if any.
+    """
+    _state_filename = "state.json"
+    _metadata_ext = ".json"
+    _content_ext = ".body"
+
+    def __init__(self, directory: str):
+        self.directory = os.path.abspath(directory)
+        self._lock = RLock()
+
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _get_query_directory(self, url: str) -> str:
+        return os.path.join(self.directory, sha256(url.encode()).hexdigest())
+
+    def _get_page_paths(self, url: str, page: int):
+        base = os.path.join(self._get_query_directory(url), str(page))
+        return base + self._metadata_ext, base + self._content_ext
+
+    @staticmethod
+    def _write(path: str, data: bytes):
+        with temporary_path(path) as temp_path:
+            with open(temp_path, "xb") as pointer:
+                pointer.write(data)
+
+    def get_state(self, url: str) -> Union[CheckpointState, None]:
+        """
+        Retrieves the progress of the extract of a query.
+
+        Parameters
+        ----------
+        url: str
+            URL of the query, including the format but excluding
+            the page number.
+
+        Returns
+        -------
+        Union[CheckpointState, None]
+            Progress of the extract, or ``None`` if no pages have
+            been stored.
+        """
+        path = os.path.join(self._get_query_directory(url), self._state_filename)
+
+        with self._lock:
+            try:
+                with open(path, "r") as pointer:
+                    return CheckpointState(**loads(pointer.read()))
+            except FileNotFoundError:
+                return None
+            except (OSError, ValueError, TypeError):
+                self.remove(url)
+                return None
+
+    def get_page(self, url: str, page: int) -> Union[Response, None]:
+        """
+        Retrieves a stored page.
+
+        Parameters
+        ----------
+        url: str
+            URL of the query, including the format but excluding
+            the page number.
+
+        page: int
+            Page number.
+
+        Returns
+        -------
+        Union[Response, None]
+            Page, as a ``requests.Response`` object, or ``None`` if the
+            page is not stored.
+        """
+        metadata_path, content_path = self._get_page_paths(url, page)
+
+        with self._lock:
+            try:
+                with open(metadata_path, "r") as pointer:
+                    metadata = loads(pointer.read())
+
+                with open(content_path, "rb") as pointer:
+                    content = pointer.read()
+            except (OSError, ValueError):
+                return None
+
+        return CacheEntry(content=content, **metadata).to_response()
+
+    def add_page(self, url: str, page: int, response: Response) -> CheckpointState:
+        """
+        Stores a page, and records the page that follows it as the next
+        page of the extract.
+
+        Pages must be added in order, starting from the first page, and
+        must belong to the same version of the data -- i.e. have the same
+        ``Last-Modified`` header.
+
+        Parameters
+        ----------
+        url: str
+            URL of the query, including the format but excluding
+            the page number.
+
+        page: int
+            Page number.
+
+        response: Response
+            Response whose content has already been downloaded.
+
+        Returns
+        -------
+        CheckpointState
+            Progress of the extract.
+
+        Raises
+        ------
+        ValueError
+            If the page does not follow the last page stored, or
+            belongs to a different version of the data.
+        """
+        last_modified = response.headers["Last-Modified"]
+
+        with self._lock:
+            state = self.get_state(url)
+            expected_page = 1 if state is None else state.next_page
+
+            if page != expected_page:
+                raise ValueError(
+                    f"Expected page {expected_page} of the extract, got page {page}."
+                )
+
+            if state is not None and state.last_modified != last_modified:
+                raise ValueError(
+                    f"Page {page} was last modified on {last_modified}, but the "
+                    f"stored pages were last modified on {state.last_modified}."
+                )
+
+            os.makedirs(self._get_query_directory(url), exist_ok=True)
+
+            headers = {
+                key: value
+                for key, value in response.headers.items()
+                if key.lower() not in EXCLUDED_HEADERS
+            }
+
+            metadata = CacheEntry(
+                url=response.url,
+                status_code=response.status_code,
+                headers=headers,
+                stored_at=time(),
+                content=b""
+            )._asdict()
+            metadata.pop("content")
+
+            metadata_path, content_path = self._get_page_paths(url, page)
+            self._write(content_path, response.content)
+            self._write(metadata_path, dumps(metadata).encode())
+
+            # The state is only updated once the page has been stored.
+            state = CheckpointState(
+                url=url,
+                last_modified=last_modified,
+                next_page=page + 1,
+                updated_at=time()
+            )
+
+            state_path = os.path.join(self._get_query_directory(url), self._state_filename)
+            self._write(state_path, dumps(state._asdict()).encode())
+
+        return state
+
+    def rewind(self, url: str, page: int) -> Union[CheckpointState, None]:
+        """
+        Removes the stored pages from ``page`` onwards -- e.g. once ``page``
+        is found to be missing or damaged -- so that the extract continues
+        from ``page``.
+
+        Parameters
+        ----------
+        url: str
+            URL of the query, including the format but excluding
+            the page number.
+
+        page: int
+            Number of the first page to remove.
+
+        Returns
+        -------
+        Union[CheckpointState, None]
+            Progress of the extract, or ``None`` if no pages remain.
+        """
+        with self._lock:
+            state = self.get_state(url)
+
+            if state is None or page <= 1:
+                self.remove(url)
+                return None
+
+            if page >= state.next_page:
+                return state
+
+            removed_pages = range(page, state.next_page)
+            state = state._replace(next_page=page, updated_at=time())
+
+            # The state is updated before the pages are removed.
+            state_path = os.path.join(self._get_query_directory(url), self._state_filename)
+            self._write(state_path, dumps(state._asdict()).encode())
+
+            for page_num in removed_pages:
+                for path in self._get_page_paths(url, page_num):
+                    try:
+                        os.remove(path)
+                    except FileNotFoundError:
+                        pass
+
+        return state
+
+    def remove(self, url: str):
+        """
+        Removes the stored pages of a query.
+
+        Parameters
+        ----------
+        url: str
+            URL of the query, including the format but excluding
+            the page number.
+        """
+        with self._lock:
+            shutil.rmtree(self._get_query_directory(url), ignore_errors=True)
+
+    def clear(self):
+        """
+        Removes the stored pages of all queries.
+        """
+        with self._lock:
+            for filename in os.listdir(self.directory):
+                path = os.path.join(self.directory, filename)
+
+                if os.path.isdir(path):
+                    shutil.rmtree(path, ignore_errors=True)
@@ -0,0 +1,203 @@
+#!/usr/bin python3
+
+# Imports
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Python:
+from typing import Dict, List
+from io import BytesIO
+
+# 3rd party:
+
+# Internal:
+from uk_covid19.schema import ColumnType, get_column_types
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+__all__ = [
+    'import_pyarrow',
+    'get_arrow_schema',
+    'read_csv_table',
+    'DictionaryUnifier'
+]
+
+
+def import_pyarrow():
+    """
+    Imports the ``pyarrow`` library, which is an optional dependency.
+
+    .. versionadded:: 1.3.0
+
+    Returns
+    -------
+    module
+
+    Raises
+    ------
+    ImportError
+        If the ``pyarrow`` library is not installed.
+    """
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError(
+            "The `pyarrow` library is not installed as a part of the `uk-covid19` "
+            "library. Please install the library and try again."
+        )
+
+    return pyarrow
+
+
+def get_arrow_schema(structure: Dict[str, str]) -> "pyarrow.Schema":
+    """
+    Derives a typed Apache Arrow schema from a ``structure``.
+
+    .. versionadded:: 1.3.0
+
+    Dates are stored as ``date32``, categories as dictionary encoded
+    strings, integers as ``int64``, floats as ``float64``, and metrics of
+    unknown type as strings. All fields are nullable.
+
+    Parameters
+    ----------
+    structure: Dict[str, str]
+        Flat structure, mapping column names to metrics.
+
+    Returns
+    -------
+    pyarrow.Schema
+
+    Raises
+    ------
+    ImportError
+        If the ``pyarrow`` library is not installed.
+    """
+    pa = import_pyarrow()
+
+    arrow_types = {
+        ColumnType.DATE: pa.date32(),
+        ColumnType.CATEGORY: pa.dictionary(pa.int32(), pa.string()),
+        ColumnType.INTEGER: pa.int64(),
+        ColumnType.FLOAT: pa.float64(),
+        ColumnType.STRING: pa.string()
+    }
+
+    return pa.schema([
+        (column, arrow_types[column_type])
+        for column, column_type in get_column_types(structure).items()
+    ])
+
+
+def read_csv_table(content: bytes, schema: "pyarrow.Schema") -> "pyarrow.Table":
+    """
+    Parses a page of data in CSV into a table with the given ``schema``.
+
+    .. versionadded:: 1.3.0
+
+    Parameters
+    ----------
+    content: bytes
+        Page of data in CSV, including the column names.
+
+    schema: pyarrow.Schema
+        Schema of the table, as produced by ``get_arrow_schema()``.
+
+    Returns
+    -------
+    pyarrow.Table
+
+    Raises
+    ------
+    ImportError
+        If the ``pyarrow`` library is not installed.
+    """
+    import_pyarrow()
+
+    from pyarrow.csv import read_csv, ConvertOptions
+
+    options = ConvertOptions(
+        column_types={field.name: field.type for field in schema},
+        include_columns=schema.names,
+        strings_can_be_null=True
+    )
+
+    return read_csv(BytesIO(content), convert_options=options)
+
+
+class DictionaryUnifier:
+    """
+    Re-encodes the dictionary columns of consecutive tables, so that
+    the dictionary of each table extends that of the previous one.
+
+    Tables parsed independently have unrelated dictionaries. Once
+    unified, the tables may be written one at a time to formats that
+    only support a single, growing dictionary per column -- e.g. the
+    Arrow IPC (Feather) file format.
+
+    .. versionadded:: 1.3.0
+
+    Parameters
+    ----------
+    schema: pyarrow.Schema
+        Schema of the tables.
+    """
+
+    def __init__(self, schema: "pyarrow.Schema"):
+        pa = import_pyarrow()
+
+        self._pa = pa
+        self._values: Dict[str, List[str]] = dict()
+        self._indices: Dict[str, Dict[str, int]] = dict()
+
+        for field in schema:
+            if pa.types.is_dictionary(field.type):
+                self._values[field.name] = list()
+                self._indices[field.name] = dict()
+
+    def _encode(self, column: str, array: "pyarrow.DictionaryArray") -> "pyarrow.DictionaryArray":
+        pa = self._pa
+        values = self._values[column]
+        indices = self._indices[column]
+
+        mapping = list()
+
+        for value in array.dictionary.to_pylist():
+            if value not in indices:
+                indices[value] = len(values)
+                values.append(value)
+
+            mapping.append(indices[value])
+
+        remapped = pa.array(mapping, type=array.indices.type).take(array.indices)
+
+        return pa.DictionaryArray.from_arrays(
+            remapped,
+            pa.array(values, type=array.dictionary.type)
+        )
+
+    def unify(self, table: "pyarrow.Table") -> "pyarrow.Table":
+        """
+        Re-encodes the dictionary columns of ``table``.
+
+        Parameters
+        ----------
+        table: pyarrow.Table
+
+        Returns
+        -------
+        pyarrow.Table
+        """
+        for column in self._values:
+            position = table.schema.get_field_index(column)
+            field = table.field(position)
+            chunks = [
+                self._encode(column, chunk)
+                for chunk in table.column(position).chunks
+            ]
+
+            table = table.set_column(
+                position,
+                field,
+                self._pa.chunked_array(chunks, type=field.type)
+            )
+
+        return table
@@ -0,0 +1,147 @@
+#!/usr/bin python3
+
+# Imports
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Python:
+from threading import Lock
+from typing import Union
+
+# 3rd party:
+from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+import certifi
+
+# Internal:
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+__all__ = [
+    'create_session',
+    'get_default_session',
+    'set_default_session'
+]
+
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+
+# Compression algorithms that can be decoded -- i.e. gzip and deflate,
+# as well as brotli and zstd if the libraries are installed.
+ACCEPT_ENCODING = make_headers(accept_encoding=True)["accept-encoding"]
+
+_default_session: Union[Session, None] = None
+_default_session_lock = Lock()
+
+
+def create_session(pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+                   pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+                   pool_block: bool = False,
+                   keep_alive: bool = True,
+                   compression: bool = True) -> Session:
+    """
+    Creates a ``requests.Session`` with a connection pool configured
+    for the API.
+
+    .. versionadded:: 1.3.0
+
+    Parameters
+    ----------
+    pool_connections: int
+        Number of per-host connection pools to keep. [Default: ``10``]
+
+    pool_maxsize: int
+        Maximum number of connections kept alive for each host. This
+        should be at least as large as the number of threads that use
+        the session concurrently. [Default: ``10``]
+
+    pool_block: bool
+        If ``True``, no more than ``pool_maxsize`` connections are ever
+        opened to the same host; additional requests wait for a free
+        connection instead. [Default: ``False``]
+
+    keep_alive: bool
+        If ``False``, connections are closed after each request.
+        [Default: ``True``]
+
+    compression: bool
+        If ``True``, the API is asked to compress the content of the
+        responses with any of the algorithms that can be decoded --
+        i.e. ``gzip`` and ``deflate``, as well as ``br`` and ``zstd`` if
+        the ``brotli`` and ``zstandard`` libraries are installed.
+        Otherwise, the content is requested uncompressed.
+        [Default: ``True``]
+
+    Returns
+    -------
+    Session
+
+    Examples
+    --------
+    >>> session = create_session(pool_maxsize=20)
+    >>> api = Cov19API(
+    ...     filters=["areaType=ltla"],
+    ...     structure={"name": "areaName"},
+    ...     session=session
+    ... )
+    """
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block
+    )
+
+    session = Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.verify = certifi.where()
+
+    session.headers["Accept-Encoding"] = ACCEPT_ENCODING if compression else "identity"
+
+    if not keep_alive:
+        session.headers["Connection"] = "close"
+
+    return session
+
+
+def get_default_session() -> Session:
+    """
+    Produces the session shared by all ``Cov19API`` instances that
+    are not given a session of their own. The session is created on
+    first use.
+
+    .. versionadded:: 1.3.0
+
+    Returns
+    -------
+    Session
+    """
+    global _default_session
+
+    with _default_session_lock:
+        if _default_session is None:
+            _default_session = create_session()
+
+        return _default_session
+
+
+def set_default_session(session: Union[Session, None]) -> None:
+    """
+    Replaces the shared session. Setting the session to ``None``
+    closes the current session and forces a new one to be created
+    on next use.
+
+    .. versionadded:: 1.3.0
+
+    Parameters
+    ----------
+    session: Union[Session, None]
+        New shared session.
+    """
+    global _default_session
+
+    with _default_session_lock:
+        if _default_session is not None and _default_session is not session:
+            _default_session.close()
+
+        _default_session = session
@@ -12,7 +12,8 @@ from enum import Enum, auto
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
 __all__ = [
-    'DataFormat'
+    'DataFormat',
+    'ArrowFormat'
 ]
 
 
@@ -30,3 +31,14 @@ class DataFormat(AutoName):
     JSON = auto()
     XML = auto()
     CSV = auto()
+
+
+class ArrowFormat(AutoName):
+    """
+    Formats of the files in which the data may be saved
+    as Apache Arrow tables.
+
+    .. versionadded:: 1.3.0
+    """
+    PARQUET = auto()
+    FEATHER = auto()
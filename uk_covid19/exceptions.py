@@ -5,6 +5,7 @@
 # Python:
 from pprint import pformat
 from urllib.parse import unquote
+from typing import Union
 
 # 3rd party:
 from requests import Response
@@ -14,7 +15,8 @@ from requests import Response
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
 __all__ = [
-    'FailedRequestError'
+    'FailedRequestError',
+    'ReleaseChangedError'
 ]
 
 
@@ -32,24 +34,78 @@ Parameters:
 {params}
 """
 
-    def __init__(self, response: Response, params: dict):
+    def __init__(self, response: Response, params: dict,
+                 content: Union[bytes, None] = None):
         """
         Parameters
         ----------
         response: Response
             HTTP request ``Response`` object, as produced by the ``requests``
-            library.
+            library, or ``ClientResponse`` object, as produced by the
+            ``aiohttp`` library.
 
         params: dict
             Dictionary of parameters.
+
+        content: Union[bytes, None]
+            .. versionadded:: 1.3.0
+
+            Body of the response. Must be defined if the response does
+            not provide its body as ``response.content``. [Default: ``None``]
         """
+        if content is None:
+            content = response.content
+
+        status_code = getattr(response, "status_code", None) or response.status
+        url = str(response.url)
+
         message = self.message.format(
-            status_code=response.status_code,
+            status_code=status_code,
             reason=response.reason,
-            response_text=response.content.decode() or "No response",
-            url=response.url,
-            decoded_url=unquote(response.url),
+            response_text=content.decode() or "No response",
+            url=url,
+            decoded_url=unquote(url),
             params=pformat(params, indent=2)
         )
 
         super().__init__(message)
+
+        self.response = response
+        self.status_code = status_code
+        self.params = params
+
+
+class ReleaseChangedError(RuntimeError):
+    """
+    Exception for an extract whose pages belong to different releases
+    of the data -- i.e. have different ``Last-Modified`` headers.
+
+    .. versionadded:: 1.3.0
+    """
+
+    message = (
+        "The data were updated during the extract: page {page} was last "
+        "modified on {received}, but page 1 was last modified on {expected}."
+    )
+
+    def __init__(self, page: int, expected: str, received: str):
+        """
+        Parameters
+        ----------
+        page: int
+            Number of the first page that belongs to a different release
+            from that of the first page.
+
+        expected: str
+            ``Last-Modified`` header of the first page.
+
+        received: str
+            ``Last-Modified`` header of the page.
+        """
+        message = self.message.format(page=page, expected=expected, received=received)
+
+        super().__init__(message)
+
+        self.page = page
+        self.expected = expected
+        self.received = received
@@ -0,0 +1,333 @@
+#!/usr/bin python3
+
+# Imports
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Python:
+from typing import Dict, NamedTuple, Union
+from threading import Lock
+
+# 3rd party:
+
+# Internal:
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+__all__ = [
+    'PageEvent',
+    'QueryStats',
+    'Observer',
+    'OpenTelemetryObserver'
+]
+
+
+class PageEvent(NamedTuple):
+    """
+    Outcome of the request for one page of data.
+
+    .. versionadded:: 1.3.0
+
+    Attributes
+    ----------
+    page: Union[int, None]
+        Page number, or ``None`` for queries with ``latest_by``.
+
+    format: str
+        Format of the page -- i.e. ``json``, ``csv`` or ``xml``.
+
+    status_code: int
+        Status of the final response. Pages past the last one have
+        a status of ``204``.
+
+    attempts: int
+        Number of times that the page was requested, including retries.
+
+    from_cache: bool
+        Whether the content was retrieved from the cache, with or
+        without revalidating it with the server.
+
+    started_at: float
+        Time at which the page was first requested, in seconds since
+        the epoch.
+
+    latency: float
+        Number of seconds between sending the final request and
+        receiving the headers of the response. ``0`` for pages
+        retrieved from the cache.
+
+    duration: float
+        Total number of seconds taken to produce the page, including
+        retries and the download of the content.
+
+    compressed_bytes: int
+        Number of bytes received, as transferred.
+
+    decompressed_bytes: int
+        Number of bytes of content, once decompressed.
+    """
+    page: Union[int, None]
+    format: str
+    status_code: int
+    attempts: int
+    from_cache: bool
+    started_at: float
+    latency: float
+    duration: float
+    compressed_bytes: int
+    decompressed_bytes: int
+
+
+class QueryStats:
+    """
+    Summary of a query -- i.e. of one call that requests the data, such
+    as ``.get_json()`` or one iteration over ``.iter_pages()``.
+
+    .. versionadded:: 1.3.0
+
+    Attributes
+    ----------
+    format: str
+        Format in which the pages were requested.
+
+    pages: int
+        Number of pages of data received successfully.
+
+    requests: int
+        Number of requests made for the pages that were not retrieved
+        from the cache, including retries and the request past the
+        last page.
+
+    retries: int
+        Number of times that requests were retried.
+
+    cache_hits: int
+        Number of pages retrieved from the cache.
+
+    compressed_bytes: int
+        Number of bytes received, as transferred.
+
+    decompressed_bytes: int
+        Number of bytes of content, once decompressed.
+
+    request_time: float
+        Total number of seconds taken to produce the pages. With
+        concurrent requests, this may exceed the wall time.
+
+    wait_time: float
+        Number of seconds spent waiting for the pages.
+
+    parse_time: float
+        Number of seconds spent processing the pages once received --
+        i.e. parsing, merging and saving them.
+
+    wall_time: float
+        Number of seconds from the start to the end of the query.
+    """
+
+    def __init__(self, format_as: str):
+        self.format = format_as
+        self.pages = 0
+        self.requests = 0
+        self.retries = 0
+        self.cache_hits = 0
+        self.compressed_bytes = 0
+        self.decompressed_bytes = 0
+        self.request_time = 0.0
+        self.wait_time = 0.0
+        self.parse_time = 0.0
+        self.wall_time = 0.0
+        self._lock = Lock()
+
+    def add_page(self, event: PageEvent):
+        """
+        Adds a page to the summary.
+
+        Parameters
+        ----------
+        event: PageEvent
+        """
+        with self._lock:
+            if event.status_code == 200:
+                self.pages += 1
+
+            self.requests += 0 if event.from_cache else event.attempts
+            self.retries += event.attempts - 1
+            self.cache_hits += event.from_cache
+            self.compressed_bytes += event.compressed_bytes
+            self.decompressed_bytes += event.decompressed_bytes
+            self.request_time += event.duration
+
+    def as_dict(self) -> Dict[str, Union[str, int, float]]:
+        """
+        Produces the summary as a dictionary, e.g. to be reported
+        as metrics.
+
+        Returns
+        -------
+        Dict[str, Union[str, int, float]]
+        """
+        return {
+            key: value
+            for key, value in vars(self).items()
+            if not key.startswith("_")
+        }
+
+    def __repr__(self):
+        return (
+            f"<QueryStats: {self.pages} pages in {self.format}, "
+            f"{self.decompressed_bytes:,} bytes, {self.wall_time:.3f}s>"
+        )
+
+
+class Observer:
+    """
+    Receives the events of the queries made by ``Cov19API`` instances.
+    Subclass it, and override the methods of interest.
+
+    Methods may be called from the threads that request the pages,
+    when pages are requested concurrently.
+
+    .. versionadded:: 1.3.0
+
+    Examples
+    --------
+    >>> class PrintObserver(Observer):
+    ...     def page_received(self, api, event):
+    ...         print(event.page, event.status_code, event.duration)
+    >>> api = Cov19API(filters, structure, observers=[PrintObserver()])
+    """
+
+    def query_started(self, api, stats: QueryStats):
+        """
+        Called before the first page is requested.
+
+        Parameters
+        ----------
+        api: Cov19API
+            Instance making the query.
+
+        stats: QueryStats
+            Summary of the query, which is updated as the pages are
+            received.
+        """
+        pass
+
+    def page_received(self, api, event: PageEvent):
+        """
+        Called once a page has been received, or has failed.
+
+        Parameters
+        ----------
+        api: Cov19API
+            Instance making the query.
+
+        event: PageEvent
+        """
+        pass
+
+    def query_finished(self, api, stats: QueryStats):
+        """
+        Called once the query has ended, successfully or otherwise.
+
+        Parameters
+        ----------
+        api: Cov19API
+            Instance making the query.
+
+        stats: QueryStats
+            Final summary of the query.
+        """
+        pass
+
+
+def _import_opentelemetry():
+    try:
+        from opentelemetry import trace
+    except ImportError:
+        raise ImportError(
+            "The `opentelemetry-api` library is not installed as a part of the "
+            "`uk-covid19` library. Please install the library and try again."
+        )
+
+    return trace
+
+
+class OpenTelemetryObserver(Observer):
+    """
+    Records each query as an OpenTelemetry span, with a child span
+    per page.
+
+    .. versionadded:: 1.3.0
+
+    .. warning::
+
+        The ``opentelemetry-api`` library is not included in the dependencies
+        of this library and must be installed separately.
+
+    Parameters
+    ----------
+    tracer: Union[opentelemetry.trace.Tracer, None]
+        Tracer used to create the spans. If ``None`` (default), the
+        tracer of the global tracer provider is used.
+
+    Raises
+    ------
+    ImportError
+        If the ``opentelemetry-api`` library is not installed.
+    """
+
+    def __init__(self, tracer=None):
+        self._trace = _import_opentelemetry()
+        self._tracer = tracer or self._trace.get_tracer("uk_covid19")
+        self._spans = dict()
+        self._lock = Lock()
+
+    def query_started(self, api, stats: QueryStats):
+        span = self._tracer.start_span(
+            "uk_covid19.query",
+            attributes={
+                "uk_covid19.format": stats.format,
+                "url.full": api.endpoint
+            }
+        )
+
+        with self._lock:
+            self._spans[id(stats)] = span
+
+    def _get_span(self, stats: Union[QueryStats, None]):
+        with self._lock:
+            return self._spans.get(id(stats))
+
+    def page_received(self, api, event: PageEvent):
+        parent = self._get_span(api.stats)
+        context = None
+
+        if parent is not None:
+            context = self._trace.set_span_in_context(parent)
+
+        span = self._tracer.start_span(
+            "uk_covid19.page",
+            context=context,
+            start_time=int(event.started_at * 1e9),
+            attributes={
+                "uk_covid19.page": event.page or 0,
+                "uk_covid19.attempts": event.attempts,
+                "uk_covid19.from_cache": event.from_cache,
+                "uk_covid19.latency": event.latency,
+                "uk_covid19.compressed_bytes": event.compressed_bytes,
+                "uk_covid19.decompressed_bytes": event.decompressed_bytes,
+                "http.response.status_code": event.status_code
+            }
+        )
+        span.end(end_time=int((event.started_at + event.duration) * 1e9))
+
+    def query_finished(self, api, stats: QueryStats):
+        with self._lock:
+            span = self._spans.pop(id(stats), None)
+
+        if span is None:
+            return
+
+        for key, value in stats.as_dict().items():
+            span.set_attribute(f"uk_covid19.{key}", value)
+
+        span.end()
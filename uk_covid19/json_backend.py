@@ -0,0 +1,377 @@
+#!/usr/bin python3
+
+# Imports
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Python:
+from typing import Any, Dict, List, Optional, Tuple, Union
+from collections import namedtuple
+from datetime import date
+from threading import Lock
+import json
+
+# 3rd party:
+
+# Internal:
+from uk_covid19.schema import ColumnType, get_column_types
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+__all__ = [
+    'JSONBackend',
+    'OrjsonBackend',
+    'MsgspecBackend',
+    'get_json_backend',
+    'set_json_backend',
+    'make_record_type'
+]
+
+
+_default_backend: Union["JSONBackend", None] = None
+_default_backend_lock = Lock()
+
+
+def _import_library(name: str):
+    from importlib import import_module
+
+    try:
+        return import_module(name)
+    except ImportError:
+        raise ImportError(
+            f"The `{name}` library is not installed as a part of the `uk-covid19` "
+            f"library. Please install the library and try again."
+        )
+
+
+def make_record_type(structure: Dict[str, str]) -> type:
+    """
+    Creates a typed record type for a ``structure``.
+
+    If the ``msgspec`` library is installed, the type is a ``msgspec.Struct``,
+    into which pages may be decoded directly. Otherwise, it is a named tuple.
+    In both cases, dates are converted to ``datetime.date`` objects.
+
+    .. versionadded:: 1.3.0
+
+    Parameters
+    ----------
+    structure: Dict[str, str]
+        Flat structure, mapping column names to metrics.
+
+    Returns
+    -------
+    type
+    """
+    column_types = get_column_types(structure)
+
+    try:
+        import msgspec
+    except ImportError:
+        record_type = namedtuple("Record", list(column_types))
+        record_type._date_fields = tuple(
+            column
+            for column, column_type in column_types.items()
+            if column_type == ColumnType.DATE
+        )
+        return record_type
+
+    python_types = {
+        ColumnType.DATE: Optional[date],
+        ColumnType.CATEGORY: Optional[str],
+        # Counts are occasionally reported as decimals.
+        ColumnType.INTEGER: Optional[Union[int, float]],
+        ColumnType.FLOAT: Optional[float],
+        ColumnType.STRING: Any
+    }
+
+    fields = [
+        (column, python_types[column_type], None)
+        for column, column_type in column_types.items()
+    ]
+
+    return msgspec.defstruct("Record", fields)
+
+
+def _convert_records(data: List[dict], record_type: type) -> List[Any]:
+    date_fields = getattr(record_type, "_date_fields", None)
+
+    if date_fields is None:
+        # msgspec.Struct
+        import msgspec
+
+        return msgspec.convert(data, List[record_type])
+
+    fields = record_type._fields
+    date_positions = [fields.index(field) for field in date_fields]
+    records = list()
+
+    for item in data:
+        values = [item.get(field) for field in fields]
+
+        for position in date_positions:
+            if values[position]:
+                values[position] = date.fromisoformat(values[position])
+
+        records.append(record_type._make(values))
+
+    return records
+
+
+class JSONBackend:
+    """
+    JSON parser and serialiser based on the standard library.
+
+    Backends produce compact JSON -- i.e. with no whitespace. The
+    output of different backends may differ in the escaping of
+    non-ASCII characters, but always represents the same data.
+
+    .. versionadded:: 1.3.0
+    """
+    name = "json"
+
+    def loads(self, content: Union[bytes, str]) -> Any:
+        """
+        Parses a JSON document.
+
+        Parameters
+        ----------
+        content: Union[bytes, str]
+
+        Returns
+        -------
+        Any
+        """
+        return json.loads(content)
+
+    def dumps(self, obj: Any) -> str:
+        """
+        Serialises an object as compact JSON.
+
+        Parameters
+        ----------
+        obj: Any
+
+        Returns
+        -------
+        str
+        """
+        return json.dumps(obj, separators=(",", ":"))
+
+    def decode_page(self, content: bytes, record_type: Union[type, None] = None) -> List[Any]:
+        """
+        Parses a page of data, and produces its records.
+
+        Parameters
+        ----------
+        content: bytes
+            Page of data in JSON, as received from the API.
+
+        record_type: Union[type, None]
+            Type of the records, as created by ``make_record_type()``.
+            If ``None``, the records are dictionaries. [Default: ``None``]
+
+        Returns
+        -------
+        List[Any]
+        """
+        data = self.loads(content)["data"]
+
+        if record_type is None:
+            return data
+
+        return _convert_records(data, record_type)
+
+    def extract_data(self, content: bytes,
+                     collect: Union[list, None] = None) -> Tuple[str, int]:
+        """
+        Produces the records of a page of data as JSON, without the
+        brackets of the array, to be spliced into a larger document.
+
+        Parameters
+        ----------
+        content: bytes
+            Page of data in JSON, as received from the API.
+
+        collect: Union[list, None]
+            If defined, the records are also parsed and appended to
+            this list. [Default: ``None``]
+
+        Returns
+        -------
+        Tuple[str, int]
+            Records of the page, separated by commas, and the number
+            of records.
+        """
+        data = self.decode_page(content)
+
+        if collect is not None:
+            collect.extend(data)
+
+        return self.dumps(data)[1:-1], len(data)
+
+
+class OrjsonBackend(JSONBackend):
+    """
+    JSON parser and serialiser based on the ``orjson`` library.
+
+    .. versionadded:: 1.3.0
+
+    Raises
+    ------
+    ImportError
+        If the ``orjson`` library is not installed.
+    """
+    name = "orjson"
+
+    def __init__(self):
+        self._orjson = _import_library("orjson")
+
+    def loads(self, content: Union[bytes, str]) -> Any:
+        return self._orjson.loads(content)
+
+    def dumps(self, obj: Any) -> str:
+        return self._orjson.dumps(obj).decode()
+
+
+class MsgspecBackend(JSONBackend):
+    """
+    JSON parser and serialiser based on the ``msgspec`` library. Pages
+    are decoded directly into typed records when a record type is given,
+    and records are extracted from pages as they are, without being
+    parsed.
+
+    .. versionadded:: 1.3.0
+
+    Raises
+    ------
+    ImportError
+        If the ``msgspec`` library is not installed.
+    """
+    name = "msgspec"
+
+    def __init__(self):
+        self._msgspec = _import_library("msgspec")
+        self._decoders = dict()
+        self._decoders_lock = Lock()
+
+        # The records are validated, but kept as raw JSON.
+        raw_page_type = self._msgspec.defstruct(
+            "RawPage",
+            [("data", List[self._msgspec.Raw])]
+        )
+        self._raw_decoder = self._msgspec.json.Decoder(raw_page_type)
+
+    def loads(self, content: Union[bytes, str]) -> Any:
+        return self._msgspec.json.decode(content)
+
+    def dumps(self, obj: Any) -> str:
+        return self._msgspec.json.encode(obj).decode()
+
+    def _get_decoder(self, record_type: type):
+        with self._decoders_lock:
+            if record_type not in self._decoders:
+                page_type = self._msgspec.defstruct("Page", [("data", List[record_type])])
+                self._decoders[record_type] = self._msgspec.json.Decoder(page_type)
+
+            return self._decoders[record_type]
+
+    def decode_page(self, content: bytes, record_type: Union[type, None] = None) -> List[Any]:
+        if record_type is None or not issubclass(record_type, self._msgspec.Struct):
+            return super().decode_page(content, record_type)
+
+        return self._get_decoder(record_type).decode(content).data
+
+    def extract_data(self, content: bytes,
+                     collect: Union[list, None] = None) -> Tuple[str, int]:
+        if collect is None:
+            # The records are spliced as received, without being parsed.
+            records = self._raw_decoder.decode(content).data
+
+            return b",".join(records).decode(), len(records)
+
+        # The page is decoded once; the records are serialised again from
+        # the objects, which is faster than decoding the page a second time.
+        data = self.decode_page(content)
+        collect.extend(data)
+
+        return self._msgspec.json.encode(data)[1:-1].decode(), len(data)
+
+
+BACKENDS = {
+    backend.name: backend
+    for backend in (JSONBackend, OrjsonBackend, MsgspecBackend)
+}
+
+
+def _create_backend(name: Union[str, None]) -> JSONBackend:
+    if name is not None:
+        if name not in BACKENDS:
+            raise ValueError(
+                f"Unknown JSON backend: '{name}'. Expected one of {list(BACKENDS)}."
+            )
+
+        return BACKENDS[name]()
+
+    # The fastest backend that is installed.
+    for backend in (MsgspecBackend, OrjsonBackend):
+        try:
+            return backend()
+        except ImportError:
+            continue
+
+    return JSONBackend()
+
+
+def get_json_backend() -> JSONBackend:
+    """
+    Produces the JSON backend used by all ``Cov19API`` instances that
+    are not given a backend of their own. Unless defined otherwise, the
+    backend is ``msgspec`` or ``orjson`` if installed -- in that order --
+    and the standard library otherwise.
+
+    .. versionadded:: 1.3.0
+
+    Returns
+    -------
+    JSONBackend
+    """
+    global _default_backend
+
+    with _default_backend_lock:
+        if _default_backend is None:
+            _default_backend = _create_backend(None)
+
+        return _default_backend
+
+
+def set_json_backend(backend: Union[JSONBackend, str, None]) -> None:
+    """
+    Replaces the shared JSON backend.
+
+    .. versionadded:: 1.3.0
+
+    Parameters
+    ----------
+    backend: Union[JSONBackend, str, None]
+        New backend, or the name of a backend -- i.e. ``"json"``,
+        ``"orjson"`` or ``"msgspec"``. If ``None``, the fastest
+        backend that is installed is used.
+
+    Raises
+    ------
+    ImportError
+        If the library of the backend is not installed.
+
+    ValueError
+        If the name of the backend is not recognised.
+
+    Examples
+    --------
+    >>> set_json_backend("json")
+    """
+    global _default_backend
+
+    if not isinstance(backend, JSONBackend):
+        backend = _create_backend(backend)
+
+    with _default_backend_lock:
+        _default_backend = backend
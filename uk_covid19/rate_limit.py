@@ -0,0 +1,226 @@
+#!/usr/bin python3
+
+# Imports
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Python:
+from typing import Union
+from threading import Lock, BoundedSemaphore
+from time import monotonic, sleep, time
+from json import dumps, loads
+from math import ceil
+import os
+
+# 3rd party:
+
+# Internal:
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+__all__ = [
+    'RateLimiter',
+    'FileRateLimiter'
+]
+
+
+class RateLimiter:
+    """
+    Token bucket rate limiter for requests made to the API.
+
+    The same limiter may be shared between threads and between
+    ``Cov19API`` instances, in which case the limits apply to all of
+    their requests combined.
+
+    .. versionadded:: 1.3.0
+
+    Parameters
+    ----------
+    rate: float
+        Maximum sustained number of requests per second.
+
+    burst: Union[int, None]
+        Maximum number of requests that may be made at once after a
+        period of inactivity. Defaults to ``rate``, rounded up.
+        [Default: ``None``]
+
+    max_concurrent: Union[int, None]
+        Maximum number of requests in progress at the same time. If
+        ``None``, the number is not limited. [Default: ``None``]
+
+    Examples
+    --------
+    >>> limiter = RateLimiter(rate=5, max_concurrent=4)
+    >>> apis = [
+    ...     Cov19API(
+    ...         filters=["areaType=ltla", f"areaName={name}"],
+    ...         structure={"date": "date", "newCases": "newCasesByPublishDate"},
+    ...         rate_limiter=limiter
+    ...     )
+    ...     for name in ("Adur", "Allerdale", "Amber Valley")
+    ... ]
+    """
+
+    def __init__(self, rate: float, burst: Union[int, None] = None,
+                 max_concurrent: Union[int, None] = None):
+        if rate <= 0:
+            raise ValueError(f"Rate must be greater than 0, got {rate}.")
+
+        self.rate = rate
+        self.burst = burst or max(ceil(rate), 1)
+        self.max_concurrent = max_concurrent
+
+        self._lock = Lock()
+        self._tokens = float(self.burst)
+        self._updated_at = monotonic()
+
+        self._semaphore = None
+
+        if max_concurrent is not None:
+            self._semaphore = BoundedSemaphore(max_concurrent)
+
+    def _take_token(self) -> float:
+        """
+        Takes a token from the bucket, if one is available.
+
+        Returns
+        -------
+        float
+            ``0`` if a token was taken. Otherwise, the number of seconds
+            until the next token becomes available.
+        """
+        with self._lock:
+            now = monotonic()
+            elapsed = now - self._updated_at
+
+            self._tokens = min(self._tokens + elapsed * self.rate, self.burst)
+            self._updated_at = now
+
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0
+
+            return (1 - self._tokens) / self.rate
+
+    def acquire(self):
+        """
+        Waits until a request may be made. Each call must be followed
+        by a call to ``.release()`` once the request is complete.
+        """
+        if self._semaphore is not None:
+            self._semaphore.acquire()
+
+        try:
+            wait = self._take_token()
+
+            while wait > 0:
+                sleep(wait)
+                wait = self._take_token()
+        except BaseException:
+            self.release()
+            raise
+
+    def release(self):
+        """
+        Signals that a request is complete.
+        """
+        if self._semaphore is not None:
+            self._semaphore.release()
+
+    def __enter__(self) -> "RateLimiter":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+
+
+class FileRateLimiter(RateLimiter):
+    """
+    Token bucket rate limiter whose state is stored in a file, so that
+    the limit applies to the requests of several processes combined.
+
+    The limit on the number of concurrent requests, if defined, still
+    applies to each process individually.
+
+    .. versionadded:: 1.3.0
+
+    .. note::
+
+        Only available on POSIX systems.
+
+    Parameters
+    ----------
+    path: str
+        Path to the file that holds the state of the limiter. The file
+        is created if it does not exist. All processes sharing the limit
+        must use the same path and the same ``rate`` and ``burst``.
+
+    rate: float
+        Maximum sustained number of requests per second.
+
+    burst: Union[int, None]
+        Maximum number of requests that may be made at once after a
+        period of inactivity. Defaults to ``rate``, rounded up.
+        [Default: ``None``]
+
+    max_concurrent: Union[int, None]
+        Maximum number of requests in progress at the same time in
+        each process. [Default: ``None``]
+
+    Raises
+    ------
+    ImportError
+        If the system does not support file locks (``fcntl``).
+    """
+
+    def __init__(self, path: str, rate: float, burst: Union[int, None] = None,
+                 max_concurrent: Union[int, None] = None):
+        try:
+            import fcntl
+        except ImportError:
+            raise ImportError(
+                "`FileRateLimiter` is only supported on systems that provide "
+                "the `fcntl` module. Please use `RateLimiter` instead."
+            )
+
+        super().__init__(rate, burst=burst, max_concurrent=max_concurrent)
+
+        self.path = os.path.abspath(path)
+        self._fcntl = fcntl
+
+    def _take_token(self) -> float:
+        fcntl = self._fcntl
+
+        # Threads of this process are serialised by the lock, and
+        # processes by the lock on the file.
+        with self._lock, open(self.path, "a+") as pointer:
+            fcntl.flock(pointer, fcntl.LOCK_EX)
+
+            try:
+                pointer.seek(0)
+                content = pointer.read()
+                now = time()
+
+                try:
+                    state = loads(content)
+                    tokens, updated_at = state["tokens"], state["updated_at"]
+                except (ValueError, KeyError, TypeError):
+                    tokens, updated_at = float(self.burst), now
+
+                elapsed = max(now - updated_at, 0)
+                tokens = min(tokens + elapsed * self.rate, self.burst)
+
+                wait = 0
+
+                if tokens >= 1:
+                    tokens -= 1
+                else:
+                    wait = (1 - tokens) / self.rate
+
+                pointer.seek(0)
+                pointer.truncate()
+                pointer.write(dumps({"tokens": tokens, "updated_at": now}))
+                pointer.flush()
+            finally:
+                fcntl.flock(pointer, fcntl.LOCK_UN)
+
+        return wait
@@ -0,0 +1,174 @@
+#!/usr/bin python3
+
+# Imports
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Python:
+from typing import Any, Dict, Iterable, Iterator, List, Union
+from collections import namedtuple
+from collections.abc import Sequence
+from datetime import date
+
+# 3rd party:
+
+# Internal:
+from uk_covid19.schema import ColumnType, get_column_types
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+__all__ = [
+    'RecordSet'
+]
+
+
+class RecordSet(Sequence):
+    """
+    Compact, read-only collection of records with a flat structure.
+
+    The records are stored column by column, rather than as one
+    dictionary per record, so the names of the columns are only stored
+    once. Area names, codes and other categories are shared between
+    records, and each distinct date is parsed into a ``datetime.date``
+    object once.
+
+    Records are produced as named tuples, whose fields are the columns
+    of the structure. Columns whose names are not valid identifiers are
+    renamed by position -- e.g. ``_1``.
+
+    .. versionadded:: 1.3.0
+
+    Parameters
+    ----------
+    structure: Dict[str, str]
+        Flat structure, mapping column names to metrics.
+
+    Examples
+    --------
+    >>> records = RecordSet({"date": "date", "name": "areaName"})
+    >>> records.extend([{"date": "2020-10-12", "name": "England"}])
+    >>> records[0]
+    Record(date=datetime.date(2020, 10, 12), name='England')
+    >>> records["name"]
+    ['England']
+    """
+
+    def __init__(self, structure: Dict[str, str]):
+        self._column_types = get_column_types(structure)
+        self._columns: Dict[str, List[Any]] = {
+            column: list()
+            for column in self._column_types
+        }
+        self._record_type = namedtuple("Record", list(self._columns), rename=True)
+        self._strings: Dict[str, str] = dict()
+        self._dates: Dict[str, date] = dict()
+        self._length = 0
+
+    @property
+    def columns(self) -> List[str]:
+        """
+        Names of the columns.
+
+        Returns
+        -------
+        List[str]
+        """
+        return list(self._columns)
+
+    @property
+    def record_type(self) -> type:
+        """
+        Named tuple type of the records.
+
+        Returns
+        -------
+        type
+        """
+        return self._record_type
+
+    def _parse_date(self, value: Union[str, None]) -> Union[date, None]:
+        if not value:
+            return None
+
+        parsed = self._dates.get(value)
+
+        if parsed is None:
+            parsed = self._dates[value] = date.fromisoformat(value)
+
+        return parsed
+
+    def extend(self, records: Iterable[dict]) -> None:
+        """
+        Appends records -- e.g. a page of data, as produced by
+        ``Cov19API.iter_pages()``.
+
+        Parameters
+        ----------
+        records: Iterable[dict]
+            Records keyed by column name. Missing columns are
+            stored as ``None``.
+        """
+        records = list(records)
+        strings = self._strings
+
+        for column, values in self._columns.items():
+            column_type = self._column_types[column]
+            page_values = [item.get(column) for item in records]
+
+            if column_type == ColumnType.DATE:
+                page_values = [self._parse_date(value) for value in page_values]
+            elif column_type == ColumnType.CATEGORY:
+                page_values = [strings.setdefault(value, value) for value in page_values]
+
+            values.extend(page_values)
+
+        self._length += len(records)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: Union[int, slice, str]):
+        """
+        Produces a record by position, a list of records by slice, or
+        the values of a column by name. Columns must not be modified.
+        """
+        if isinstance(index, str):
+            return self._columns[index]
+
+        if isinstance(index, slice):
+            columns = [values[index] for values in self._columns.values()]
+            return list(map(self._record_type._make, zip(*columns)))
+
+        return self._record_type._make(values[index] for values in self._columns.values())
+
+    def __iter__(self) -> Iterator[tuple]:
+        return map(self._record_type._make, zip(*self._columns.values()))
+
+    def to_dicts(self) -> List[dict]:
+        """
+        Produces the records as dictionaries, keyed by column name, with
+        dates formatted as in the output of ``Cov19API.get_json()``.
+
+        Returns
+        -------
+        List[dict]
+        """
+        columns = list(self._columns)
+        date_columns = {
+            position
+            for position, column in enumerate(columns)
+            if self._column_types[column] == ColumnType.DATE
+        }
+
+        def to_dict(values) -> dict:
+            return {
+                column: (
+                    value.isoformat()
+                    if position in date_columns and value is not None
+                    else value
+                )
+                for position, (column, value) in enumerate(zip(columns, values))
+            }
+
+        return [to_dict(values) for values in zip(*self._columns.values())]
+
+    def __repr__(self):
+        return f"<RecordSet: {self._length} records of {self.columns}>"
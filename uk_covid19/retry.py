@@ -0,0 +1,209 @@
+#!/usr/bin python3
+
+# Imports
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Python:
+from typing import Union, Iterable
+from http import HTTPStatus
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from random import uniform
+
+# 3rd party:
+from requests import Response
+from requests.exceptions import (
+    ConnectionError, Timeout, ChunkedEncodingError, ContentDecodingError
+)
+
+# Internal:
+from uk_covid19.exceptions import FailedRequestError
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+__all__ = [
+    'RetryPolicy'
+]
+
+
+DEFAULT_RETRY_STATUSES = frozenset({
+    HTTPStatus.TOO_MANY_REQUESTS,
+    HTTPStatus.INTERNAL_SERVER_ERROR,
+    HTTPStatus.BAD_GATEWAY,
+    HTTPStatus.SERVICE_UNAVAILABLE,
+    HTTPStatus.GATEWAY_TIMEOUT
+})
+
+CONNECTION_ERRORS = (ConnectionError, Timeout, ChunkedEncodingError, ContentDecodingError)
+
+
+def parse_retry_after(value: Union[str, None]) -> Union[float, None]:
+    """
+    Parses the value of a ``Retry-After`` header, which is either a
+    number of seconds or an HTTP date.
+
+    Parameters
+    ----------
+    value: Union[str, None]
+        Value of the header.
+
+    Returns
+    -------
+    Union[float, None]
+        Number of seconds to wait, or ``None`` if the value is
+        not defined or cannot be parsed.
+    """
+    if not value:
+        return None
+
+    try:
+        return max(float(value), 0)
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0)
+
+
+class RetryPolicy:
+    """
+    Policy for retrying failed requests for individual pages of data.
+
+    Pages are retried with an exponential backoff: the n-th retry waits
+    for up to ``backoff_factor * 2 ** (n - 1)`` seconds, capped at
+    ``max_backoff``. If the server defines a ``Retry-After`` header, its
+    value is used instead.
+
+    .. versionadded:: 1.3.0
+
+    Parameters
+    ----------
+    max_attempts: int
+        Maximum number of attempts for each page, including the first
+        one. [Default: ``5``]
+
+    backoff_factor: float
+        Base delay between attempts, in seconds. [Default: ``0.5``]
+
+    max_backoff: float
+        Maximum delay between attempts, in seconds. [Default: ``60``]
+
+    jitter: bool
+        If ``True``, a random delay of up to the computed delay is used
+        instead, so that concurrent requests do not retry in lockstep.
+        [Default: ``True``]
+
+    retry_statuses: Iterable[int]
+        Response statuses that are retried. [Default: ``429``, ``500``,
+        ``502``, ``503``, and ``504``]
+
+    retry_connection_errors: bool
+        Whether to retry requests that fail to connect, time out, are
+        interrupted, or whose content cannot be decompressed.
+        [Default: ``True``]
+
+    respect_retry_after: bool
+        Whether to honour the ``Retry-After`` header. [Default: ``True``]
+
+    Examples
+    --------
+    >>> policy = RetryPolicy(max_attempts=3, backoff_factor=1)
+    >>> api = Cov19API(
+    ...     filters=["areaType=ltla"],
+    ...     structure={"date": "date", "newCases": "newCasesBySpecimenDate"},
+    ...     retry=policy
+    ... )
+    >>> data = api.get_json()
+    >>> print(api.retries)
+    0
+    """
+
+    def __init__(self, max_attempts: int = 5, backoff_factor: float = 0.5,
+                 max_backoff: float = 60, jitter: bool = True,
+                 retry_statuses: Iterable[int] = DEFAULT_RETRY_STATUSES,
+                 retry_connection_errors: bool = True,
+                 respect_retry_after: bool = True):
+        if max_attempts < 1:
+            raise ValueError(f"Maximum attempts must be at least 1, got {max_attempts}.")
+
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_connection_errors = retry_connection_errors
+        self.respect_retry_after = respect_retry_after
+
+    def is_retryable(self, error: Exception) -> bool:
+        """
+        Whether a request that failed with ``error`` may be retried.
+
+        Parameters
+        ----------
+        error: Exception
+            Exception raised by the request.
+
+        Returns
+        -------
+        bool
+        """
+        if isinstance(error, FailedRequestError):
+            return error.status_code in self.retry_statuses
+
+        if isinstance(error, CONNECTION_ERRORS):
+            return self.retry_connection_errors
+
+        return False
+
+    def should_retry(self, attempt: int, error: Exception) -> bool:
+        """
+        Whether to retry a request after its ``attempt``-th failure.
+
+        Parameters
+        ----------
+        attempt: int
+            Number of attempts made so far.
+
+        error: Exception
+            Exception raised by the latest attempt.
+
+        Returns
+        -------
+        bool
+        """
+        return attempt < self.max_attempts and self.is_retryable(error)
+
+    def get_delay(self, attempt: int, response: Union[Response, None] = None) -> float:
+        """
+        Number of seconds to wait before the next attempt.
+
+        Parameters
+        ----------
+        attempt: int
+            Number of attempts made so far.
+
+        response: Union[Response, None]
+            Response to the latest attempt, if any.
+
+        Returns
+        -------
+        float
+        """
+        if self.respect_retry_after and response is not None:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+
+            if retry_after is not None:
+                return min(retry_after, self.max_backoff)
+
+        delay = min(self.backoff_factor * 2 ** (attempt - 1), self.max_backoff)
+
+        if self.jitter:
+            return uniform(0, delay)
+
+        return delay
@@ -0,0 +1,175 @@
+#!/usr/bin python3
+
+# Imports
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Python:
+from typing import Dict
+from enum import auto
+
+# 3rd party:
+
+# Internal:
+from uk_covid19.data_format import AutoName
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+__all__ = [
+    'ColumnType',
+    'get_column_type',
+    'get_column_types'
+]
+
+
+AREA_METRICS = {
+    "areaType",
+    "areaName",
+    "areaCode"
+}
+
+DATE_METRICS = {
+    "date"
+}
+
+FLOAT_METRIC_MARKERS = (
+    "Rate",
+    "Positivity",
+    "Percentage",
+    "Ratio",
+    "Average"
+)
+
+CATEGORY_METRIC_SUFFIXES = (
+    "Direction",
+)
+
+COUNT_METRIC_PREFIXES = (
+    "new",
+    "cum"
+)
+
+COUNT_METRIC_MARKERS = (
+    "Cases",
+    "Deaths",
+    "Admissions",
+    "Beds",
+    "Tests",
+    "Vaccinated",
+    "Vaccinations",
+    "Capacity"
+)
+
+# Metrics whose values are breakdowns -- e.g. by age -- rather than
+# numbers, even though their names resemble those of counts.
+BREAKDOWN_METRIC_PREFIXES = (
+    "male",
+    "female"
+)
+
+BREAKDOWN_METRIC_SUFFIXES = (
+    "Demographics",
+)
+
+
+class ColumnType(AutoName):
+    """
+    Type of the values of a column, as derived from its metric.
+
+    .. versionadded:: 1.3.0
+    """
+    DATE = auto()
+    CATEGORY = auto()
+    INTEGER = auto()
+    FLOAT = auto()
+    STRING = auto()
+
+
+def get_column_type(metric: str) -> ColumnType:
+    """
+    Derives the type of the values of a metric from its name.
+
+    .. versionadded:: 1.3.0
+
+    Area metrics (``areaType``, ``areaName``, ``areaCode``) and
+    directions (e.g. ``newCasesByPublishDateDirection``) are categories,
+    rates, positivity, percentages, ratios and averages are floats, and
+    counts -- e.g. new or cumulative cases, deaths, admissions and tests --
+    are integers, which may be missing. Breakdowns (e.g. by age) and all
+    other metrics, whose type is not known (e.g. ``alertLevelName``), are
+    strings.
+
+    Parameters
+    ----------
+    metric: str
+        Name of the metric.
+
+    Returns
+    -------
+    ColumnType
+
+    Examples
+    --------
+    >>> get_column_type("newCasesBySpecimenDateRollingRate")
+    <ColumnType.FLOAT: 'float'>
+
+    >>> get_column_type("alertLevelName")
+    <ColumnType.STRING: 'string'>
+    """
+    if metric in DATE_METRICS:
+        return ColumnType.DATE
+
+    if metric in AREA_METRICS or metric.endswith(CATEGORY_METRIC_SUFFIXES):
+        return ColumnType.CATEGORY
+
+    is_breakdown = (
+        metric.startswith(BREAKDOWN_METRIC_PREFIXES) or
+        metric.endswith(BREAKDOWN_METRIC_SUFFIXES)
+    )
+
+    if is_breakdown:
+        return ColumnType.STRING
+
+    if any(marker in metric for marker in FLOAT_METRIC_MARKERS):
+        return ColumnType.FLOAT
+
+    is_count = (
+        metric.startswith(COUNT_METRIC_PREFIXES) or
+        any(marker in metric for marker in COUNT_METRIC_MARKERS)
+    )
+
+    if is_count:
+        return ColumnType.INTEGER
+
+    return ColumnType.STRING
+
+
+def get_column_types(structure: Dict[str, str]) -> Dict[str, ColumnType]:
+    """
+    Derives the type of each column defined in a ``structure``.
+
+    .. versionadded:: 1.3.0
+
+    Parameters
+    ----------
+    structure: Dict[str, str]
+        Flat structure, mapping column names to metrics.
+
+    Returns
+    -------
+    Dict[str, ColumnType]
+        Type of each column, keyed by column name.
+
+    Examples
+    --------
+    >>> structure = {
+    ...     "date": "date",
+    ...     "name": "areaName",
+    ...     "newCases": "newCasesBySpecimenDate"
+    ... }
+    >>> get_column_types(structure)
+    {'date': <ColumnType.DATE: 'date'>, 'name': <ColumnType.CATEGORY: 'category'>,
+     'newCases': <ColumnType.INTEGER: 'integer'>}
+    """
+    return {
+        column: get_column_type(metric)
+        for column, metric in structure.items()
+    }
@@ -0,0 +1,561 @@
+#!/usr/bin python3
+
+# Imports
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Python:
+from typing import Dict, List, Tuple, Union, NoReturn, Iterable
+from abc import ABC, abstractmethod
+from json import load, loads, dumps
+from os import path as os_path
+from hashlib import sha256
+import sqlite3
+
+# 3rd party:
+
+# Internal:
+from uk_covid19.schema import ColumnType, get_column_type, get_column_types
+from uk_covid19.data_format import DataFormat
+from uk_covid19.utils import save_data
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+__all__ = [
+    'BaseStore',
+    'JSONStore',
+    'SQLiteStore',
+    'get_store_keys'
+]
+
+
+AREA_KEY_METRICS = (
+    "areaType",
+    "areaCode",
+    "areaName"
+)
+
+# Filters that restrict a query to a single area.
+SINGLE_AREA_FILTERS = (
+    "areaCode=",
+    "areaName=",
+    "areaType=overview"
+)
+
+SQLITE_TYPES = {
+    ColumnType.DATE: "TEXT",
+    ColumnType.CATEGORY: "TEXT",
+    ColumnType.INTEGER: "INTEGER",
+    ColumnType.FLOAT: "REAL",
+    # No type affinity: values of unknown type are stored as received.
+    ColumnType.STRING: ""
+}
+
+
+def get_store_keys(structure: Dict[str, str],
+                   filters: Union[Iterable[str], None] = None) -> Tuple[str, ...]:
+    """
+    Determines the columns that identify a record in a local store:
+    the date column, followed by the area columns.
+
+    .. versionadded:: 1.3.0
+
+    Parameters
+    ----------
+    structure: Dict[str, str]
+        Flat structure, mapping column names to metrics.
+
+    filters: Union[Iterable[str], None]
+        Filters of the query. Unless they restrict the query to a single
+        area -- e.g. ``areaName=England`` -- the structure must include an
+        area metric, so that the records of different areas on the same
+        date are not mistaken for one another. If ``None``, the filters
+        are not checked. [Default: ``None``]
+
+    Returns
+    -------
+    Tuple[str, ...]
+        Names of the key columns. The date column is always first.
+
+    Raises
+    ------
+    ValueError
+        If the structure does not include the ``date`` metric, or does
+        not include an area metric while the ``filters`` do not restrict
+        the query to a single area.
+    """
+    date_columns = [
+        column
+        for column, metric in structure.items()
+        if get_column_type(metric) == ColumnType.DATE
+    ]
+
+    if not date_columns:
+        raise ValueError(
+            "The structure must include the `date` metric to identify "
+            "the records in a local store."
+        )
+
+    metrics = {metric: column for column, metric in structure.items()}
+    area_columns = [metrics[metric] for metric in AREA_KEY_METRICS if metric in metrics]
+
+    single_area = filters is None or any(
+        item.startswith(SINGLE_AREA_FILTERS)
+        for item in filters
+    )
+
+    if not area_columns and not single_area:
+        raise ValueError(
+            "The structure must include an area metric (e.g. `areaCode`) to "
+            "identify the records in a local store, unless the filters "
+            "restrict the query to a single area."
+        )
+
+    return (date_columns[0], *area_columns)
+
+
+class BaseStore(ABC):
+    """
+    Base class for local stores of records, used by ``Cov19API.sync()``.
+
+    Subclasses must implement ``.get_last_date()``, ``.upsert()`` and
+    ``.save()``, and cannot be instantiated otherwise. ``.prepare()`` is
+    called once before any of them.
+
+    .. versionadded:: 1.3.0
+    """
+    structure: Union[Dict[str, str], None] = None
+    keys: Union[Tuple[str, ...], None] = None
+
+    def prepare(self, structure: Dict[str, str], keys: Tuple[str, ...]) -> NoReturn:
+        """
+        Defines the records to be stored.
+
+        Parameters
+        ----------
+        structure: Dict[str, str]
+            Flat structure, mapping column names to metrics.
+
+        keys: Tuple[str, ...]
+            Names of the columns that identify a record. The
+            first column is the date.
+
+        Returns
+        -------
+        NoReturn
+        """
+        self.structure = structure
+        self.keys = keys
+
+    @abstractmethod
+    def get_last_date(self) -> Union[str, None]:
+        """
+        Provides the latest date in the store.
+
+        Returns
+        -------
+        Union[str, None]
+            Date, as ``YYYY-MM-DD``, or ``None`` if the store is empty.
+        """
+        pass
+
+    @abstractmethod
+    def upsert(self, records: List[dict]) -> NoReturn:
+        """
+        Inserts the records, and replaces any existing records
+        with the same keys.
+
+        Parameters
+        ----------
+        records: List[dict]
+
+        Returns
+        -------
+        NoReturn
+        """
+        pass
+
+    @abstractmethod
+    def save(self, last_update: Union[str, None] = None) -> NoReturn:
+        """
+        Persists the changes made since the store was loaded
+        or last saved.
+
+        Parameters
+        ----------
+        last_update: Union[str, None]
+            Time at which the data were last updated on the API, if
+            known. [Default: ``None``]
+
+        Returns
+        -------
+        NoReturn
+        """
+        pass
+
+
+class JSONStore(BaseStore):
+    """
+    Local store of records, held in memory and saved as a JSON file.
+
+    The file has the same layout as the output of ``Cov19API.get_json()``,
+    and the records are sorted by date, from the latest to the earliest.
+
+    .. versionadded:: 1.3.0
+
+    Parameters
+    ----------
+    path: str
+        Path to the file. The file is created when the store is first
+        saved, and must end with ``.json``.
+
+    Examples
+    --------
+    >>> store = JSONStore("some_existing_directory/cases.json")
+    >>> api = Cov19API(
+    ...     filters=["areaType=nation"],
+    ...     structure={
+    ...         "date": "date",
+    ...         "name": "areaName",
+    ...         "newCases": "newCasesByPublishDate"
+    ...     }
+    ... )
+    >>> api.sync(store, lookback=3)
+    1120
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._data: List[dict] = list()
+        self._index: Dict[tuple, int] = dict()
+        self._last_update: Union[str, None] = None
+
+        if os_path.isfile(path):
+            with open(path) as pointer:
+                document = load(pointer)
+
+            self._data = document["data"]
+            self._last_update = document.get("lastUpdate")
+
+    def prepare(self, structure: Dict[str, str], keys: Tuple[str, ...]) -> NoReturn:
+        super().prepare(structure, keys)
+
+        self._index = {
+            self._get_key(record): position
+            for position, record in enumerate(self._data)
+        }
+
+    def _get_key(self, record: dict) -> tuple:
+        return tuple(record.get(column) for column in self.keys)
+
+    def get_last_date(self) -> Union[str, None]:
+        date_column = self.keys[0]
+
+        return max(
+            (record[date_column] for record in self._data if record.get(date_column)),
+            default=None
+        )
+
+    def upsert(self, records: List[dict]) -> NoReturn:
+        for record in records:
+            key = self._get_key(record)
+            position = self._index.get(key)
+
+            if position is None:
+                self._index[key] = len(self._data)
+                self._data.append(record)
+            else:
+                self._data[position] = record
+
+    def save(self, last_update: Union[str, None] = None) -> NoReturn:
+        date_column = self.keys[0]
+
+        if last_update is not None:
+            self._last_update = last_update
+
+        self._data.sort(key=lambda record: record.get(date_column) or "", reverse=True)
+        self._index = {
+            self._get_key(record): position
+            for position, record in enumerate(self._data)
+        }
+
+        document = {
+            "data": self._data,
+            "lastUpdate": self._last_update,
+            "length": len(self._data)
+        }
+
+        save_data(dumps(document, separators=(",", ":")), self.path, DataFormat.JSON)
+
+    def __len__(self):
+        return len(self._data)
+
+
+def _quote(name: str) -> str:
+    """
+    Quotes an SQL identifier.
+    """
+    return '"%s"' % name.replace('"', '""')
+
+
+class SQLiteStore(BaseStore):
+    """
+    Local store of records in an SQLite database, for use with
+    ``Cov19API.sync()`` and for querying the data locally.
+
+    The records are stored in a table with one column per item of the
+    structure, typed according to the metrics -- see ``uk_covid19.schema``.
+    The table has a unique index on the key columns (date and area), and
+    indexes on the date and on each area column. Each call to
+    ``.upsert()`` -- i.e. each page of data -- runs in a transaction.
+
+    .. versionadded:: 1.3.0
+
+    Parameters
+    ----------
+    path: str
+        Path to the database file. The file is created if it does
+        not exist.
+
+    table: str
+        Name of the table. [Default: ``"data"``]
+
+    Examples
+    --------
+    >>> with SQLiteStore("some_existing_directory/cases.db") as store:
+    ...     api = Cov19API(
+    ...         filters=["areaType=ltla"],
+    ...         structure={
+    ...             "date": "date",
+    ...             "name": "areaName",
+    ...             "code": "areaCode",
+    ...             "newCases": "newCasesBySpecimenDate"
+    ...         }
+    ...     )
+    ...     api.sync(store)
+    ...     records = store.query(["areaName=Adur", "date=2020-10-12"])
+    >>> print(records)
+    [{'date': '2020-10-12', 'name': 'Adur', 'code': 'E07000223', 'newCases': 4}]
+    """
+
+    def __init__(self, path: str, table: str = "data"):
+        self.path = path
+        self.table = table
+        self._connection = sqlite3.connect(path)
+        self._connection.row_factory = sqlite3.Row
+
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS _metadata "
+                "(name TEXT NOT NULL, key TEXT NOT NULL, value TEXT, "
+                "PRIMARY KEY (name, key))"
+            )
+
+        structure = self._get_metadata("structure")
+
+        if structure is not None:
+            structure = loads(structure)
+            super().prepare(structure, get_store_keys(structure))
+
+    def _get_metadata(self, key: str) -> Union[str, None]:
+        row = self._connection.execute(
+            "SELECT value FROM _metadata WHERE name = ? AND key = ?",
+            (self.table, key)
+        ).fetchone()
+
+        return row["value"] if row is not None else None
+
+    def _set_metadata(self, key: str, value: Union[str, None]):
+        self._connection.execute(
+            "INSERT OR REPLACE INTO _metadata (name, key, value) VALUES (?, ?, ?)",
+            (self.table, key, value)
+        )
+
+    @property
+    def last_update(self) -> Union[str, None]:
+        """
+        :property:
+            Time at which the data were last updated on the API, as
+            recorded when the store was last saved.
+
+        Returns
+        -------
+        Union[str, None]
+        """
+        return self._get_metadata("lastUpdate")
+
+    def prepare(self, structure: Dict[str, str], keys: Tuple[str, ...]) -> NoReturn:
+        super().prepare(structure, keys)
+
+        table = _quote(self.table)
+        column_types = get_column_types(structure)
+        columns = [
+            f"{_quote(column)} {SQLITE_TYPES[column_type]}"
+            for column, column_type in column_types.items()
+        ]
+
+        with self._connection:
+            self._connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} ({', '.join(columns)})"
+            )
+
+            # Columns added to the structure after the table was created.
+            existing = {
+                row["name"]
+                for row in self._connection.execute(f"PRAGMA table_info({table})")
+            }
+
+            for column, column_type in column_types.items():
+                if column not in existing:
+                    self._connection.execute(
+                        f"ALTER TABLE {table} ADD COLUMN "
+                        f"{_quote(column)} {SQLITE_TYPES[column_type]}"
+                    )
+
+            # The name of the unique index is derived from the key columns,
+            # so that an index on different keys -- e.g. from an earlier
+            # structure -- is replaced rather than reused. The new index is
+            # created first, so that the old one is kept if it fails.
+            key_columns = ", ".join(map(_quote, keys))
+            key_digest = sha256(dumps(list(keys)).encode()).hexdigest()[:16]
+            index_name = f"{self.table}_keys_{key_digest}"
+
+            self._connection.execute(
+                f"CREATE UNIQUE INDEX IF NOT EXISTS {_quote(index_name)} "
+                f"ON {table} ({key_columns})"
+            )
+
+            for row in self._connection.execute(f"PRAGMA index_list({table})").fetchall():
+                name = row["name"]
+
+                # Only unique indexes are key indexes; the indexes on
+                # single columns are kept.
+                if row["unique"] and name != index_name and name.startswith(f"{self.table}_keys"):
+                    self._connection.execute(f"DROP INDEX {_quote(name)}")
+
+            # The date is the leading column of the unique index.
+            for column in keys[1:]:
+                self._connection.execute(
+                    f"CREATE INDEX IF NOT EXISTS {_quote(self.table + '_' + column)} "
+                    f"ON {table} ({_quote(column)})"
+                )
+
+            self._set_metadata("structure", dumps(structure))
+
+    def get_last_date(self) -> Union[str, None]:
+        row = self._connection.execute(
+            f"SELECT MAX({_quote(self.keys[0])}) AS last_date FROM {_quote(self.table)}"
+        ).fetchone()
+
+        return row["last_date"]
+
+    def upsert(self, records: List[dict]) -> NoReturn:
+        columns = list(self.structure)
+        statement = (
+            f"INSERT OR REPLACE INTO {_quote(self.table)} "
+            f"({', '.join(map(_quote, columns))}) "
+            f"VALUES ({', '.join('?' * len(columns))})"
+        )
+
+        with self._connection:
+            self._connection.executemany(
+                statement,
+                (
+                    tuple(record.get(column) for column in columns)
+                    for record in records
+                )
+            )
+
+    def save(self, last_update: Union[str, None] = None) -> NoReturn:
+        with self._connection:
+            if last_update is not None:
+                self._set_metadata("lastUpdate", last_update)
+
+    def query(self, filters: Iterable[str] = tuple(),
+              columns: Union[Iterable[str], None] = None) -> List[dict]:
+        """
+        Provides the records that match the ``filters``, from the
+        latest to the earliest date.
+
+        Parameters
+        ----------
+        filters: Iterable[str]
+            Filters, in the same format as those of ``Cov19API`` -- i.e.
+            ``"metric=value"``; e.g. ``["areaType=ltla", "date=2020-10-12"]``.
+            The metrics must be included in the structure of the store.
+            [Default: no filters]
+
+        columns: Union[Iterable[str], None]
+            Columns included in the records. If ``None``, all columns
+            are included. [Default: ``None``]
+
+        Returns
+        -------
+        List[dict]
+
+        Raises
+        ------
+        ValueError
+            If the store is empty, if a filter is malformed, or if a filter
+            or a column is not in the store.
+        """
+        if self.structure is None:
+            raise ValueError("The store is empty.")
+
+        metrics = {metric: column for column, metric in self.structure.items()}
+        conditions = list()
+        params = list()
+
+        for item in filters:
+            metric, sep, value = item.partition("=")
+
+            if not sep:
+                raise ValueError(f"Invalid filter: '{item}'. Expected 'metric=value'.")
+
+            if metric not in metrics:
+                raise ValueError(
+                    f"Filter metric '{metric}' is not in the store. Expected "
+                    f"one of {list(metrics)}."
+                )
+
+            conditions.append(f"{_quote(metrics[metric])} = ?")
+            params.append(value)
+
+        columns = list(self.structure if columns is None else columns)
+        unknown = set(columns) - set(self.structure)
+
+        if unknown:
+            raise ValueError(f"Columns {sorted(unknown)} are not in the store.")
+
+        selection = ", ".join(map(_quote, columns))
+        statement = f"SELECT {selection} FROM {_quote(self.table)}"
+
+        if conditions:
+            statement += " WHERE " + " AND ".join(conditions)
+
+        statement += f" ORDER BY {_quote(self.keys[0])} DESC"
+
+        return [
+            dict(row)
+            for row in self._connection.execute(statement, params)
+        ]
+
+    def close(self):
+        """
+        Closes the connection to the database.
+        """
+        self._connection.close()
+
+    def __enter__(self) -> "SQLiteStore":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        if self.structure is None:
+            return 0
+
+        row = self._connection.execute(
+            f"SELECT COUNT(*) AS length FROM {_quote(self.table)}"
+        ).fetchone()
+
+        return row["length"]
@@ -3,40 +3,45 @@
 # Imports
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # Python:
-from typing import NoReturn
+from typing import NoReturn, Iterable, Iterator, Union, Tuple, TextIO, Callable
+from contextlib import contextmanager
 
 # 3rd party:
 
 # Internal:
-from uk_covid19.data_format import DataFormat
+from uk_covid19.data_format import DataFormat, ArrowFormat
+from uk_covid19.columnar import DictionaryUnifier, import_pyarrow
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
 __all__ = [
-    'save_data'
+    'save_data',
+    'stream_data',
+    'stream_tables',
+    'open_data_file',
+    'open_table_writer',
+    'temporary_path',
+    'prepare_csv_page',
+    'iter_xml_data'
 ]
 
 
-def save_data(data: str, path: str, ext: DataFormat) -> NoReturn:
+def _validate_path(path: str, ext: Union[DataFormat, ArrowFormat]) -> str:
     """
-    Saves the data in a file.
+    Ensures that a file of the given format may be written at ``path``.
 
     Parameters
     ----------
-    data: str
-        Data to be saved.
-
     path: str
-        Path (relative or absolute) to the file in which
-        the data is to be saved. The path must end with
-        the value defined for the ``ext`` argument.
+        Path (relative or absolute) to the file.
 
-    ext: DataFormat
+    ext: Union[DataFormat, ArrowFormat]
         Extension (type) of the file.
 
     Returns
     -------
-    NoReturn
+    str
+        Absolute path to the file.
 
     Raises
     ------
@@ -86,5 +91,423 @@ def save_data(data: str, path: str, ext: DataFormat) -> NoReturn:
             f"permission for <{file_dir}>."
         )
 
-    with open(abs_path, "w") as pointer:
-        print(data, file=pointer)
+    return abs_path
+
+
+@contextmanager
+def temporary_path(abs_path: str) -> Iterator[str]:
+    """
+    Provides the path to a temporary file in the directory of ``abs_path``,
+    which replaces the file at ``abs_path`` once the context exits. The
+    temporary file is removed instead if an exception is raised.
+
+    .. versionadded:: 1.3.0
+
+    Parameters
+    ----------
+    abs_path: str
+        Absolute path to the file.
+
+    Returns
+    -------
+    Iterator[str]
+    """
+    from os import replace, remove
+    from uuid import uuid4
+
+    temp_path = f"{abs_path}.{uuid4().hex}.tmp"
+
+    try:
+        yield temp_path
+        replace(temp_path, abs_path)
+    except BaseException:
+        try:
+            remove(temp_path)
+        except FileNotFoundError:
+            pass
+
+        raise
+
+
+def save_data(data: str, path: str, ext: DataFormat) -> NoReturn:
+    """
+    Saves the data in a file.
+
+    Parameters
+    ----------
+    data: str
+        Data to be saved.
+
+    path: str
+        Path (relative or absolute) to the file in which
+        the data is to be saved. The path must end with
+        the value defined for the ``ext`` argument.
+
+    ext: DataFormat
+        Extension (type) of the file.
+
+    Returns
+    -------
+    NoReturn
+
+    Raises
+    ------
+    IsADirectoryError
+        If the filename is not defined in the path.
+
+    ValueError:
+        If the filename does not end with the correct extension for
+        the requested format.
+
+    NotADirectoryError
+        If the parent directory does not exist.
+
+    PermissionError
+        If the current user does not have permission to write in
+        the directory.
+    """
+    stream_data((data, "\n"), path, ext)
+
+
+def stream_data(chunks: Iterable[str], path: str, ext: DataFormat) -> NoReturn:
+    """
+    Saves the data in a file, one chunk at a time.
+
+    The chunks are written to a temporary file in the same directory,
+    which replaces the file at ``path`` once all of the chunks have been
+    written. The file at ``path`` is therefore never left incomplete,
+    even if producing the chunks fails.
+
+    .. versionadded:: 1.3.0
+
+    Parameters
+    ----------
+    chunks: Iterable[str]
+        Data to be saved. Chunks are only consumed once the path has
+        been validated.
+
+    path: str
+        Path (relative or absolute) to the file in which
+        the data is to be saved. The path must end with
+        the value defined for the ``ext`` argument.
+
+    ext: DataFormat
+        Extension (type) of the file.
+
+    Returns
+    -------
+    NoReturn
+
+    Raises
+    ------
+    IsADirectoryError
+        If the filename is not defined in the path.
+
+    ValueError:
+        If the filename does not end with the correct extension for
+        the requested format.
+
+    NotADirectoryError
+        If the parent directory does not exist.
+
+    PermissionError
+        If the current user does not have permission to write in
+        the directory.
+    """
+    with open_data_file(path, ext) as pointer:
+        for chunk in chunks:
+            pointer.write(chunk)
+
+
+@contextmanager
+def open_data_file(path: str, ext: DataFormat) -> Iterator[TextIO]:
+    """
+    Opens a file in which the data are written, as with ``stream_data()``,
+    for producers of chunks that cannot be iterated synchronously -- e.g.
+    asynchronous iterators.
+
+    The file is a temporary file, which replaces the file at ``path``
+    once the context exits, or is removed if an exception is raised.
+
+    .. versionadded:: 1.3.0
+
+    Parameters
+    ----------
+    path: str
+        Path (relative or absolute) to the file in which
+        the data is to be saved. The path must end with
+        the value defined for the ``ext`` argument.
+
+    ext: DataFormat
+        Extension (type) of the file.
+
+    Returns
+    -------
+    Iterator[TextIO]
+
+    Raises
+    ------
+    IsADirectoryError
+        If the filename is not defined in the path.
+
+    ValueError:
+        If the filename does not end with the correct extension for
+        the requested format.
+
+    NotADirectoryError
+        If the parent directory does not exist.
+
+    PermissionError
+        If the current user does not have permission to write in
+        the directory.
+    """
+    abs_path = _validate_path(path, ext)
+
+    with temporary_path(abs_path) as temp_path:
+        with open(temp_path, "x") as pointer:
+            yield pointer
+
+
+def stream_tables(tables: Iterable["pyarrow.Table"], schema: "pyarrow.Schema",
+                  path: str, ext: ArrowFormat) -> NoReturn:
+    """
+    Saves Apache Arrow tables in a Parquet or Feather file, one table
+    at a time.
+
+    As with ``stream_data()``, the tables are written to a temporary
+    file, which replaces the file at ``path`` once all of the tables
+    have been written.
+
+    .. versionadded:: 1.3.0
+
+    .. warning::
+
+        The ``pyarrow`` library is not included in the dependencies of this
+        library and must be installed separately.
+
+    Parameters
+    ----------
+    tables: Iterable[pyarrow.Table]
+        Data to be saved. Tables are only consumed once the path has
+        been validated.
+
+    schema: pyarrow.Schema
+        Schema of the tables.
+
+    path: str
+        Path (relative or absolute) to the file in which
+        the data is to be saved. The path must end with
+        the value defined for the ``ext`` argument.
+
+    ext: ArrowFormat
+        Extension (type) of the file.
+
+    Returns
+    -------
+    NoReturn
+
+    Raises
+    ------
+    ImportError
+        If the ``pyarrow`` library is not installed.
+
+    IsADirectoryError
+        If the filename is not defined in the path.
+
+    ValueError:
+        If the filename does not end with the correct extension for
+        the requested format.
+
+    NotADirectoryError
+        If the parent directory does not exist.
+
+    PermissionError
+        If the current user does not have permission to write in
+        the directory.
+    """
+    with open_table_writer(schema, path, ext) as write_table:
+        for table in tables:
+            write_table(table)
+
+
+@contextmanager
+def open_table_writer(schema: "pyarrow.Schema", path: str,
+                      ext: ArrowFormat) -> Iterator[Callable[["pyarrow.Table"], None]]:
+    """
+    Opens a Parquet or Feather file in which Apache Arrow tables are
+    written, as with ``stream_tables()``, for producers of tables that
+    cannot be iterated synchronously -- e.g. asynchronous iterators.
+
+    .. versionadded:: 1.3.0
+
+    .. warning::
+
+        The ``pyarrow`` library is not included in the dependencies of this
+        library and must be installed separately.
+
+    Parameters
+    ----------
+    schema: pyarrow.Schema
+        Schema of the tables.
+
+    path: str
+        Path (relative or absolute) to the file in which
+        the data is to be saved. The path must end with
+        the value defined for the ``ext`` argument.
+
+    ext: ArrowFormat
+        Extension (type) of the file.
+
+    Returns
+    -------
+    Iterator[Callable[[pyarrow.Table], None]]
+        Function that writes one table to the file.
+
+    Raises
+    ------
+    ImportError
+        If the ``pyarrow`` library is not installed.
+
+    IsADirectoryError
+        If the filename is not defined in the path.
+
+    ValueError:
+        If the filename does not end with the correct extension for
+        the requested format.
+
+    NotADirectoryError
+        If the parent directory does not exist.
+
+    PermissionError
+        If the current user does not have permission to write in
+        the directory.
+    """
+    pa = import_pyarrow()
+
+    abs_path = _validate_path(path, ext)
+
+    with temporary_path(abs_path) as temp_path:
+        if ext == ArrowFormat.PARQUET:
+            from pyarrow.parquet import ParquetWriter
+
+            with ParquetWriter(temp_path, schema) as writer:
+                yield writer.write_table
+        else:
+            # Feather (Arrow IPC) files only support a single dictionary
+            # per column, which may grow from one table to the next.
+            unifier = DictionaryUnifier(schema)
+            options = pa.ipc.IpcWriteOptions(emit_dictionary_deltas=True)
+
+            with pa.OSFile(temp_path, "wb") as sink:
+                with pa.ipc.new_file(sink, schema, options=options) as writer:
+                    yield lambda table: writer.write_table(unifier.unify(table))
+
+
+def prepare_csv_page(content: bytes, header: Union[bytes, None]) -> Tuple[bytes, bytes]:
+    """
+    Prepares a page of data in CSV to be appended to the previous pages.
+
+    Line breaks are normalised to ``\\n``, and the column names are removed
+    from all but the first page. Only the first line of the page is looked
+    up; the rest of the page is not split into lines.
+
+    .. versionadded:: 1.3.0
+
+    Parameters
+    ----------
+    content: bytes
+        Page of data in CSV, as received from the API.
+
+    header: Union[bytes, None]
+        Column names of the first page, or ``None`` if ``content``
+        is the first page.
+
+    Returns
+    -------
+    Tuple[bytes, bytes]
+        Column names of the first page, and the data to be appended. The
+        data are empty, or end with a line break.
+
+    Raises
+    ------
+    ValueError
+        If the column names of the page differ from ``header``.
+    """
+    if b"\r" in content:
+        content = content.replace(b"\r\n", b"\n")
+
+    content = content.strip()
+
+    header_end = content.find(b"\n")
+
+    if header_end == -1:
+        header_end = len(content)
+
+    page_header = content[:header_end]
+
+    if header is None:
+        return page_header, content + b"\n"
+
+    if page_header != header:
+        raise ValueError(
+            f"The column names of the page ({page_header.decode()!r}) differ "
+            f"from those of the first page ({header.decode()!r})."
+        )
+
+    if header_end == len(content):
+        return header, b""
+
+    return header, content[header_end + 1:] + b"\n"
+
+
+def iter_xml_data(chunks: Iterable[bytes], clear: bool = False) -> Iterator["Element"]:
+    """
+    Parses a page of data in XML incrementally, and produces each
+    ``data`` element as soon as it is complete.
+
+    .. versionadded:: 1.3.0
+
+    Parameters
+    ----------
+    chunks: Iterable[bytes]
+        Content of the page, in one or more chunks.
+
+    clear: bool
+        If ``True``, the content of each element is discarded once the
+        next element is requested, so that the page is never held in
+        memory in its entirety. Elements must then be processed or
+        copied before the iteration is resumed. [Default: ``False``]
+
+    Returns
+    -------
+    Iterator[xml.etree.ElementTree.Element]
+    """
+    from xml.etree.ElementTree import XMLPullParser
+
+    parser = XMLPullParser(events=("start", "end"))
+    depth = 0
+
+    def read_events():
+        nonlocal depth
+
+        for event, elm in parser.read_events():
+            if event == "start":
+                depth += 1
+                continue
+
+            depth -= 1
+
+            # Only the children of the root element are data
+            # elements; the metrics may share their name.
+            if depth == 1 and elm.tag == "data":
+                yield elm
+
+                if clear:
+                    elm.clear()
+
+    for chunk in chunks:
+        parser.feed(chunk)
+        yield from read_events()
+
+    parser.close()
+    yield from read_events()